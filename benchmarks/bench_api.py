@@ -0,0 +1,330 @@
+"""
+API benchmarks with per-endpoint query, latency and memory budgets.
+
+Every route under ``company/urls.py``, ``user/urls.py``,
+``performance_review/urls.py`` and ``search/urls.py`` is exercised against a
+synthetic dataset seeded with ``seed_bulk`` at three scales, except the async
+login and register routes: they run on the password hashing pool's own
+database connections, which neither see the benchmark's data nor are counted
+here, and ``bench_login.py`` measures them instead. For each endpoint the run records the
+maximum number of SQL queries per request, p50/p95 latency and the peak
+memory allocated while serving one request, then compares them with
+``budgets/<scale>.json``. A query count above its budget fails the run, so an
+N+1 regression is caught at the first scale it appears. Latency and memory
+vary too much between machines to gate on: going over their budgets is
+reported as a warning, and fails the run only with ``BENCH_STRICT=1``.
+
+Run explicitly (``bench_*.py`` files are not collected by the default run):
+
+    pytest benchmarks/bench_api.py -s                 # all scales
+    pytest benchmarks/bench_api.py -s -k 1k           # one scale
+    BENCH_UPDATE_BUDGETS=1 pytest benchmarks/bench_api.py -s
+
+``BENCH_TOLERANCE`` (default ``2.0``) scales the latency and memory budgets
+before they are compared, on top of the headroom they are written with.
+"""
+import io
+import json
+import math
+import os
+import statistics
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from company.models import Company, Department, Project
+from performance_review.models import PerformanceReview
+from user.models import Employee, User
+
+BUDGETS_DIR = Path(__file__).parent / 'budgets'
+SCALES = {
+    '1k': dict(companies=5, departments=4, employees=1_000, projects=20, reviews=1),
+    '10k': dict(companies=20, departments=5, employees=10_000, projects=50, reviews=1),
+    '100k': dict(companies=50, departments=10, employees=100_000, projects=100, reviews=1),
+}
+PASSWORD = 'password123'
+ITERATIONS = 20
+# Budgets are written with this much room above the measured latency and memory.
+LATENCY_HEADROOM = 3
+MEMORY_HEADROOM = 2
+
+
+class Case(NamedTuple):
+    name: str
+    method: str
+    url: Callable[[int], str]
+    data: Callable[[int], dict] = None
+    status: int = 200
+    iterations: int = ITERATIONS
+    format: str = 'json'
+
+
+class Dataset:
+    """Slugs and ids of seeded rows, plus throwaway rows for the destructive routes."""
+
+    def __init__(self, iterations=ITERATIONS + 1):
+        self.company = Company.objects.order_by('slug').first()
+        self.department = self.company.departments.order_by('slug').first()
+        self.project = self.company.projects.order_by('slug').first()
+        self.projects = list(self.company.projects.order_by('slug').values_list('slug', flat=True))
+        self.employees = list(self.company.employees.order_by('slug').values_list('slug', flat=True)[:50])
+        self.employee = Employee.objects.select_related('user').get(slug=self.employees[0])
+        pending = list(PerformanceReview.objects.filter(stage='pending_review')
+                       .order_by('created_at', 'id').values_list('id', flat=True)[:iterations * 6 + 1])
+        self.reviews = pending[:iterations * 2 + 1]
+        self.review = self.reviews.pop()
+        self.review_batches = [pending[start:start + 4] for start in range(iterations * 2 + 1, len(pending), 4)]
+        self.refresh = str(RefreshToken.for_user(self.employee.user))
+
+        def doomed(prefix, create):
+            return [create(f"Doomed {prefix} {index}") for index in range(iterations)]
+
+        self.doomed_companies = doomed('company', lambda name: Company.objects.create(name=name).slug)
+        self.doomed_departments = doomed('department', lambda name: Department.objects.create(
+            name=name, company=self.company).slug)
+        self.doomed_projects = doomed('project', self.create_project)
+        self.doomed_admin_projects = doomed('admin project', self.create_project)
+        self.doomed_employees = doomed('employee', lambda name: Employee.objects.create(
+            name=name, company=self.company, department=self.department).slug)
+
+    def create_project(self, name):
+        return Project.objects.create(name=name, company=self.company, department=self.department,
+                                      description='', start_date='2025-01-01', end_date='2025-12-31').slug
+
+
+def project_payload(dataset, name):
+    return {
+        'name': name, 'company': dataset.company.slug, 'department': dataset.department.slug,
+        'description': 'Benchmark project', 'start_date': '2025-01-01', 'end_date': '2025-12-31',
+        'assigned_employees': [dataset.employee.pk],
+    }
+
+
+def import_file(index):
+    rows = "".join(f"bench-import-{index}-{row}@example.com,Imported {row}\n" for row in range(100))
+    return SimpleUploadedFile(f"import-{index}.csv", f"email,name\n{rows}".encode())
+
+
+def cases(d):
+    company, department, project = d.company, d.department, d.project
+    return [
+        # company/urls.py
+        Case('companies-list', 'get', lambda i: reverse('company-list')),
+        Case('companies-detail', 'get', lambda i: reverse('company-detail', args=[company.slug])),
+        Case('departments-list', 'get', lambda i: reverse('department-list')),
+        Case('departments-detail', 'get', lambda i: reverse('department-detail', args=[department.slug])),
+        Case('projects-list', 'get', lambda i: reverse('project-list')),
+        Case('projects-detail', 'get', lambda i: reverse('project-detail', args=[project.slug])),
+        Case('projects-create', 'post', lambda i: reverse('project-list'),
+             lambda i: project_payload(d, f"Bench Project {i}"), status=201),
+        Case('projects-update', 'patch', lambda i: reverse('project-detail', args=[project.slug]),
+             lambda i: {'description': f"Revision {i}"}),
+        Case('projects-delete', 'delete', lambda i: reverse('project-detail', args=[d.doomed_projects[i]]),
+             status=204),
+        Case('projects-bulk-assign', 'post', lambda i: reverse('project-bulk-assign'), lambda i: {
+            'assignments': [
+                {'project': slug, 'employees': d.employees[(i + n) % 10:(i + n) % 10 + 5]}
+                for n, slug in enumerate(d.projects)
+            ]}),
+        Case('projects-export', 'get', lambda i: reverse('project-export') + '?format=csv', iterations=3),
+        Case('admin-companies-list', 'get', lambda i: reverse('admin-company-list')),
+        Case('admin-companies-detail', 'get', lambda i: reverse('admin-company-detail', args=[company.slug])),
+        Case('admin-companies-create', 'post', lambda i: reverse('admin-company-list'),
+             lambda i: {'name': f"Bench Company {i}"}, status=201),
+        Case('admin-companies-update', 'patch', lambda i: reverse('admin-company-detail', args=[company.slug]),
+             lambda i: {'name': company.name}),
+        Case('admin-companies-delete', 'delete',
+             lambda i: reverse('admin-company-detail', args=[d.doomed_companies[i]]), status=204),
+        Case('admin-departments-list', 'get', lambda i: reverse('admin-department-list')),
+        Case('admin-departments-detail', 'get',
+             lambda i: reverse('admin-department-detail', args=[department.slug])),
+        Case('admin-departments-create', 'post', lambda i: reverse('admin-department-list'),
+             lambda i: {'name': f"Bench Department {i}", 'company': company.pk}, status=201),
+        Case('admin-departments-update', 'patch',
+             lambda i: reverse('admin-department-detail', args=[department.slug]),
+             lambda i: {'name': department.name}),
+        Case('admin-departments-delete', 'delete',
+             lambda i: reverse('admin-department-detail', args=[d.doomed_departments[i]]), status=204),
+        Case('admin-projects-list', 'get', lambda i: reverse('admin-project-list')),
+        Case('admin-projects-detail', 'get', lambda i: reverse('admin-project-detail', args=[project.slug])),
+        Case('admin-projects-create', 'post', lambda i: reverse('admin-project-list'),
+             lambda i: project_payload(d, f"Bench Admin Project {i}"), status=201),
+        Case('admin-projects-update', 'patch', lambda i: reverse('admin-project-detail', args=[project.slug]),
+             lambda i: {'description': f"Admin revision {i}"}),
+        Case('admin-projects-delete', 'delete',
+             lambda i: reverse('admin-project-detail', args=[d.doomed_admin_projects[i]]), status=204),
+        Case('async-companies-list', 'get', lambda i: reverse('async-company-list')),
+        Case('async-companies-detail', 'get', lambda i: reverse('async-company-detail', args=[company.slug])),
+        Case('async-departments-list', 'get', lambda i: reverse('async-department-list')),
+        Case('async-departments-detail', 'get',
+             lambda i: reverse('async-department-detail', args=[department.slug])),
+        # user/urls.py
+        Case('register', 'post', lambda i: reverse('register'), lambda i: {
+            'username': f"bench-register-{i}", 'email': f"bench-register-{i}@example.com",
+            'password': PASSWORD, 'role': 'employee'}, status=201, iterations=3),
+        Case('login', 'post', lambda i: reverse('token_obtain_pair'),
+             lambda i: {'email': d.employee.user.email, 'password': PASSWORD}, iterations=3),
+        Case('token-refresh', 'post', lambda i: reverse('token_refresh'), lambda i: {'refresh': d.refresh}),
+        Case('employees-list', 'get', lambda i: reverse('employee-list')),
+        Case('employees-detail', 'get', lambda i: reverse('employee-detail', args=[d.employee.slug])),
+        Case('employees-create', 'post', lambda i: reverse('employee-list'), lambda i: {
+            'name': f"Bench Employee {i}", 'mobile': '0100000000', 'address': 'Cairo', 'position': 'Engineer',
+            'company': company.pk, 'department': department.pk}, status=201),
+        Case('employees-update', 'patch', lambda i: reverse('employee-detail', args=[d.employee.slug]),
+             lambda i: {'position': f"Engineer {i}"}),
+        Case('employees-delete', 'delete',
+             lambda i: reverse('employee-detail', args=[d.doomed_employees[i]]), status=204),
+        Case('employees-export-csv', 'get', lambda i: reverse('employee-export') + '?format=csv', iterations=3),
+        Case('employees-export-ndjson', 'get', lambda i: reverse('employee-export') + '?format=ndjson',
+             iterations=3),
+        Case('employees-import', 'post', lambda i: reverse('employee-import-file'),
+             lambda i: {'file': import_file(i)}, iterations=3, format='multipart'),
+        Case('async-employees-list', 'get', lambda i: reverse('async-employee-list')),
+        Case('async-employees-detail', 'get', lambda i: reverse('async-employee-detail', args=[d.employee.slug])),
+        # performance_review/urls.py
+        Case('reviews-list', 'get', lambda i: reverse('performance-review-list-create')),
+        Case('reviews-create', 'post', lambda i: reverse('performance-review-list-create'),
+             lambda i: {'employee': d.employee.slug}, status=201),
+        Case('reviews-detail', 'get', lambda i: reverse('performance-review-detail', args=[d.review])),
+        Case('reviews-update', 'patch', lambda i: reverse('performance-review-detail', args=[d.review]),
+             lambda i: {'feedback': f"Note {i}"}),
+        Case('reviews-delete', 'delete', lambda i: reverse('performance-review-detail', args=[d.reviews[i]]),
+             status=204),
+        Case('reviews-transition', 'post',
+             lambda i: reverse('performance-review-transition', args=[d.reviews[-i - 1]]),
+             lambda i: {'stage': 'review_scheduled', 'scheduled_date': '2030-01-01T09:00:00Z'}),
+        Case('reviews-export', 'get', lambda i: reverse('performance-review-export') + '?format=ndjson',
+             iterations=3),
+        Case('reviews-summary', 'get', lambda i: reverse('performance-review-summary')),
+        Case('reviews-dwell-times', 'get',
+             lambda i: reverse('performance-review-dwell-times') + f'?company={company.slug}'),
+        Case('reviews-bulk-transition', 'post', lambda i: reverse('performance-review-bulk-transition'),
+             lambda i: {'ids': [str(pk) for pk in d.review_batches[i]], 'stage': 'review_scheduled',
+                        'scheduled_date': '2030-01-01T09:00:00Z'}),
+        Case('async-reviews-list', 'get', lambda i: reverse('async-performance-review-list')),
+        Case('async-reviews-detail', 'get', lambda i: reverse('async-performance-review-detail', args=[d.review])),
+        # search/urls.py
+        Case('search', 'get', lambda i: reverse('search') + '?q=sara+has'),
+        Case('search-prefix', 'get', lambda i: reverse('search') + '?q=e&type=employee'),
+    ]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def request(client, case, index):
+    data = case.data(index) if case.data else None
+    # CaptureQueriesContext slices the connection's bounded query log, which
+    # miscounts once the log is full.
+    connection.queries_log.clear()
+    with CaptureQueriesContext(connection) as captured:
+        started = time.perf_counter()
+        response = getattr(client, case.method)(case.url(index), data, format=case.format)
+        if response.streaming:
+            # The export queries run while the body is read; drop each chunk
+            # as it arrives so the peak reflects the server's own footprint.
+            for _ in response.streaming_content:
+                pass
+        elapsed = (time.perf_counter() - started) * 1000
+    assert response.status_code == case.status, (case.name, response.status_code, response.content[:500])
+    return elapsed, len(captured)
+
+
+def measure(client, case):
+    """
+    Serve ``case.iterations`` requests for latency, then one more under
+    tracemalloc for peak memory, and return the query, latency and memory figures.
+    """
+    latencies, queries = [], []
+    for index in range(case.iterations):
+        elapsed, count = request(client, case, index)
+        latencies.append(elapsed)
+        queries.append(count)
+
+    tracemalloc.start()
+    _, count = request(client, case, case.iterations)
+    peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+    queries.append(count)
+    return {
+        'queries': max(queries),
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(percentile(latencies, 0.95), 2),
+        'peak_kb': round(peak_kb, 1),
+    }
+
+
+def budget_from(result):
+    return {
+        'queries': result['queries'],
+        'p95_ms': math.ceil(result['p95_ms'] * LATENCY_HEADROOM),
+        'peak_kb': math.ceil(result['peak_kb'] * MEMORY_HEADROOM),
+    }
+
+
+def violations(results, budgets, tolerance):
+    """Return the query-count violations and the latency and memory ones, separately."""
+    queries, resources = [], []
+    for name, result in results.items():
+        budget = budgets.get(name)
+        if budget is None:
+            queries.append(f"{name}: no budget recorded")
+            continue
+        if result['queries'] > budget['queries']:
+            queries.append(f"{name}: {result['queries']} queries, budget {budget['queries']}")
+        if result['p95_ms'] > budget['p95_ms'] * tolerance:
+            resources.append(f"{name}: p95 {result['p95_ms']}ms, budget {budget['p95_ms']}ms x {tolerance}")
+        if result['peak_kb'] > budget['peak_kb'] * tolerance:
+            resources.append(f"{name}: peak {result['peak_kb']}KiB, budget {budget['peak_kb']}KiB x {tolerance}")
+    return queries, resources
+
+
+def report(scale, results):
+    print(f"\n{'endpoint':<28}{'queries':>8}{'p50 ms':>10}{'p95 ms':>10}{'peak KiB':>11}  [{scale}]")
+    for name, result in results.items():
+        print(f"{name:<28}{result['queries']:>8}{result['p50_ms']:>10}{result['p95_ms']:>10}{result['peak_kb']:>11}")
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('scale', SCALES)
+def test_api_budgets(scale, settings):
+    # Measure the summary query itself rather than its short-lived cache entry.
+    settings.REVIEW_SUMMARY_CACHE_TIMEOUT = 0
+    call_command('seed_bulk', password=PASSWORD, stdout=io.StringIO(), **SCALES[scale])
+    dataset = Dataset()
+    staff = User.objects.create_user(username='bench-staff', email='bench-staff@example.com',
+                                     password=PASSWORD, role=User.ROLES.ADMIN, is_staff=True)
+    client = APIClient()
+    client.force_authenticate(user=staff)
+    # The async views authenticate the token themselves; DRF views keep the forced user.
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(staff)}")
+
+    results = {}
+    for case in cases(dataset):
+        results[case.name] = measure(client, case)
+    report(scale, results)
+
+    path = BUDGETS_DIR / f"{scale}.json"
+    if os.environ.get('BENCH_UPDATE_BUDGETS'):
+        path.write_text(json.dumps({name: budget_from(result) for name, result in results.items()}, indent=2) + "\n")
+        return
+    budgets = json.loads(path.read_text())
+    queries, resources = violations(results, budgets, float(os.environ.get('BENCH_TOLERANCE', 2.0)))
+    if os.environ.get('BENCH_STRICT'):
+        queries += resources
+    elif resources:
+        warnings.warn("Latency or memory budget exceeded:\n" + "\n".join(resources))
+    assert not queries, "Budget exceeded:\n" + "\n".join(queries)
@@ -0,0 +1,73 @@
+"""
+Requests per second of JWT-authenticated reads under each authentication class.
+
+Each endpoint is served through the full middleware stack with a real
+``Authorization: Bearer`` header, first with simplejwt's ``JWTAuthentication``
+(a user query per request, the previous default), then with
+``CachedJWTAuthentication`` and with the stateless ``TokenUser`` path:
+
+    pytest benchmarks/bench_auth.py -s
+
+The run fails if the cached or stateless path needs more queries per request
+than the uncached one; the requests per second are reported for comparison.
+"""
+import time
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from company.models import Company, Department
+from company.views import CompanyViewSet
+from user.authentication import CachedJWTAuthentication
+from user.models import Employee, User
+from user.views import EmployeeViewSet
+
+REQUESTS = 500
+MODES = {
+    'jwt': JWTAuthentication,
+    'cached': CachedJWTAuthentication,
+    'stateless': JWTStatelessUserAuthentication,
+}
+
+
+def serve(client, url, requests):
+    """Return requests per second and queries per request for ``requests`` GETs of ``url``."""
+    client.get(url)  # warm the response and user caches
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for _ in range(requests):
+            assert client.get(url).status_code == 200
+        elapsed = time.perf_counter() - started
+    return round(requests / elapsed), len(queries) / requests
+
+
+@pytest.mark.django_db
+def test_auth_requests_per_second():
+    company = Company.objects.create(name="Bench Auth")
+    department = Department.objects.create(name="Engineering", company=company)
+    user = User.objects.create_user(username="bench-auth", email="bench-auth@example.com", password="password123")
+    Employee.objects.filter(user=user).update(company=company, department=department)
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    endpoints = {
+        'companies-detail': (CompanyViewSet, reverse('company-detail', args=[company.slug])),
+        'employees-detail': (EmployeeViewSet, reverse('employee-detail', args=[user.employee.slug])),
+    }
+
+    results = {}
+    for name, (view, url) in endpoints.items():
+        for mode, authentication in MODES.items():
+            with mock.patch.object(view, 'authentication_classes', [authentication]):
+                results[name, mode] = serve(client, url, REQUESTS)
+
+    print(f"\n{'endpoint':<20}{'auth':<12}{'req/s':>8}{'queries/req':>13}")
+    for (name, mode), (rps, queries) in results.items():
+        print(f"{name:<20}{mode:<12}{rps:>8}{queries:>13.2f}")
+    for name in endpoints:
+        assert results[name, 'cached'][1] < results[name, 'jwt'][1]
+        assert results[name, 'stateless'][1] < results[name, 'jwt'][1]
@@ -0,0 +1,75 @@
+"""
+List pages served from ``values()`` rows and orjson against the model serializers.
+
+Employees, projects and reviews are seeded with ``seed_bulk``. Every list
+endpoint's first ``PAGES`` pages of ``PAGE_SIZE`` rows are then fetched
+``ROUNDS`` times with ``FAST_LIST_RESPONSES`` off and on:
+
+    pytest benchmarks/bench_lists.py -s
+
+The run prints the median milliseconds per page either way and fails if the
+two paths return different bytes or the values path is not faster.
+"""
+import io
+import statistics
+import time
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from user.models import User
+
+PAGE_SIZE = 500
+PAGES = 4
+ROUNDS = 5
+LISTS = {
+    'employees': 'employee-list',
+    'projects': 'project-list',
+    'reviews': 'performance-review-list-create',
+}
+
+
+def fetch_pages(client, name):
+    """Return the seconds each of the first ``PAGES`` pages took, and their bodies."""
+    url, seconds, bodies = f"{reverse(name)}?page_size={PAGE_SIZE}", [], []
+    while url and len(bodies) < PAGES:
+        started = time.perf_counter()
+        response = client.get(url)
+        seconds.append(time.perf_counter() - started)
+        assert response.status_code == 200
+        bodies.append(response.content)
+        url = response.json()['next']
+    return seconds, bodies
+
+
+@pytest.mark.django_db
+def test_values_lists_are_faster():
+    call_command('seed_bulk', companies=10, departments=5, employees=5_000, projects=200, reviews=1,
+                 stdout=io.StringIO())
+    client = APIClient()
+    client.force_authenticate(User.objects.create_user(username="bench-lists", email="bench-lists@example.com",
+                                                       password="password123", is_staff=True))
+
+    results = {}
+    for label, name in LISTS.items():
+        timings = {}
+        for fast in (False, True):
+            with override_settings(FAST_LIST_RESPONSES=fast):
+                fetch_pages(client, name)  # warm up
+                rounds = [fetch_pages(client, name) for _ in range(ROUNDS)]
+            timings[fast] = statistics.median(second for seconds, _ in rounds for second in seconds)
+            bodies = rounds[0][1]
+            if fast:
+                assert bodies == serialized, label
+            serialized = bodies
+        results[label] = timings
+
+    print(f"\n{'list':<12}{'serializer ms':>15}{'values ms':>11}{'speedup':>9}   ({PAGE_SIZE} rows per page)")
+    for label, timings in results.items():
+        print(f"{label:<12}{timings[False] * 1000:>15.1f}{timings[True] * 1000:>11.1f}"
+              f"{timings[False] / timings[True]:>8.1f}x")
+    for label, timings in results.items():
+        assert timings[True] < timings[False], label
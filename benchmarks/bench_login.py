@@ -0,0 +1,105 @@
+"""
+Logins per second under each password hasher, on the sync and async paths.
+
+Every hasher in ``PASSWORD_HASHER_CLASSES`` whose library is installed hashes
+a user's password, which then logs in ``LOGINS`` times through
+``/api/login/`` one after the other, and ``LOGINS`` times at once through
+``/api/async/login/`` while a ticker measures how long the event loop stalls:
+
+    pytest benchmarks/bench_login.py -s
+
+A process logs in about ``1000 / ms per login`` users per second per core, so
+a login storm of R logins per second needs R * ms / 1000 cores' worth of
+workers (or ``PASSWORD_HASH_WORKERS`` threads on the async path). The run fails
+if the default hasher is slower than PBKDF2, if a login rewrites a current
+hash, or if hashing stalls the event loop.
+"""
+import asyncio
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.db import connection
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.module_loading import import_string
+
+from user.models import User
+
+LOGINS = 10
+TICK = 0.005
+CREDENTIALS = {'email': "bench-login@example.com", 'password': "correct horse battery"}
+
+
+def installed(name):
+    hasher = import_string(settings.PASSWORD_HASHER_CLASSES[name])()
+    try:
+        if hasher.library:
+            hasher._load_library()
+    except ValueError:
+        return False
+    return True
+
+
+def hashers_first(name):
+    classes = settings.PASSWORD_HASHER_CLASSES
+    return [classes[name], *(path for other, path in classes.items() if other != name)]
+
+
+def login_sync(logins):
+    """Return seconds per login and the SQL run for ``logins`` sequential logins."""
+    client = Client()
+    with CaptureQueriesContext(connection) as queries:
+        started = time.perf_counter()
+        for _ in range(logins):
+            assert client.post(reverse('token_obtain_pair'), CREDENTIALS).status_code == 200
+        elapsed = time.perf_counter() - started
+    return elapsed / logins, [query['sql'] for query in queries]
+
+
+async def login_async(logins):
+    """Return logins per second for ``logins`` concurrent logins, and the longest event loop stall."""
+    client = AsyncClient()
+    stall = 0.0
+
+    async def tick():
+        nonlocal stall
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(TICK)
+            stall = max(stall, time.perf_counter() - started - TICK)
+
+    async def login():
+        response = await client.post(reverse('async-token-obtain-pair'), CREDENTIALS, content_type='application/json')
+        assert response.status_code == 200
+
+    ticker = asyncio.create_task(tick())
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    ticker.cancel()
+    return logins / elapsed, stall
+
+
+@pytest.mark.django_db(transaction=True)
+def test_login_throughput():
+    results = {}
+    for name in settings.PASSWORD_HASHER_CLASSES:
+        if not installed(name):
+            continue
+        with override_settings(PASSWORD_HASHERS=hashers_first(name)):
+            User.objects.filter(email=CREDENTIALS['email']).delete()
+            User.objects.create_user(username="bench-login", **CREDENTIALS)
+            per_login, queries = login_sync(LOGINS)
+            assert not [sql for sql in queries if sql.startswith('UPDATE')]
+            results[name] = (per_login, *async_to_sync(login_async)(LOGINS))
+
+    print(f"\n{'hasher':<10}{'ms/login':>10}{'sync/s':>9}{'async/s':>9}{'loop stall ms':>15}"
+          f"   ({settings.PASSWORD_HASH_WORKERS} hashing threads)")
+    for name, (per_login, async_rate, stall) in results.items():
+        print(f"{name:<10}{per_login * 1000:>10.0f}{1 / per_login:>9.1f}{async_rate:>9.1f}{stall * 1000:>15.1f}")
+    assert results[settings.PASSWORD_HASHER][0] <= results['pbkdf2'][0]
+    for per_login, _, stall in results.values():
+        assert stall < per_login
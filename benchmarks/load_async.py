@@ -0,0 +1,135 @@
+"""
+Concurrency load test for a running server.
+
+Opens ``--connections`` keep-alive HTTP/1.1 connections and has each of them
+request the given paths in a loop for ``--duration`` seconds, then reports
+throughput, latency percentiles and status codes. It needs nothing outside
+the standard library, so it can be pointed at any deployment::
+
+    # sync (WSGI) vs async (ASGI) workers on the same data
+    gunicorn -w 4 main.wsgi:application &
+    python benchmarks/load_async.py --email admin@example.com --password secret /api/companies/ /api/employees/
+
+    gunicorn -w 4 -k uvicorn.workers.UvicornWorker main.asgi:application &
+    python benchmarks/load_async.py --email admin@example.com --password secret /api/async/companies/ /api/async/employees/
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from collections import Counter
+from itertools import cycle
+from urllib.parse import urlsplit
+
+
+class Connection:
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, headers, body=b''):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        head = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", f"Content-Length: {len(body)}"]
+        head += [f"{name}: {value}" for name, value in headers.items()]
+        self.writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+        await self.writer.drain()
+
+        status = int((await self.reader.readline()).split()[1])
+        response_headers = {}
+        while (line := await self.reader.readline()) not in (b'\r\n', b''):
+            name, _, value = line.decode('latin-1').partition(':')
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get('transfer-encoding') == 'chunked':
+            chunks = []
+            while size := int((await self.reader.readline()).strip(), 16):
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            await self.reader.readline()
+            content = b''.join(chunks)
+        else:
+            content = await self.reader.readexactly(int(response_headers.get('content-length', 0)))
+
+        if response_headers.get('connection') == 'close':
+            self.close()
+        return status, content
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+async def login(host, port, email, password):
+    connection = Connection(host, port)
+    body = json.dumps({'email': email, 'password': password}).encode()
+    status, content = await connection.request('POST', '/api/login/', {'Content-Type': 'application/json'}, body)
+    connection.close()
+    if status != 200:
+        raise SystemExit(f"Login failed ({status}): {content.decode()}")
+    return json.loads(content)['access']
+
+
+async def worker(host, port, paths, headers, deadline, latencies, statuses):
+    connection = Connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status, _ = await connection.request('GET', next(paths), headers)
+            except (OSError, asyncio.IncompleteReadError, ValueError, IndexError) as exc:
+                statuses[type(exc).__name__] += 1
+                connection.close()
+                continue
+            latencies.append(time.perf_counter() - started)
+            statuses[status] += 1
+    finally:
+        connection.close()
+
+
+def percentile(values, fraction):
+    return values[min(int(len(values) * fraction), len(values) - 1)] * 1000 if values else 0.0
+
+
+async def main(args):
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    token = args.token or (await login(host, port, args.email, args.password) if args.email else None)
+    headers = {'Authorization': f"Bearer {token}"} if token else {}
+
+    latencies, statuses = [], Counter()
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(
+        worker(host, port, cycle(args.paths[index % len(args.paths):] + args.paths[:index % len(args.paths)]),
+               headers, deadline, latencies, statuses)
+        for index in range(args.connections)
+    ))
+    seconds = time.perf_counter() - started
+
+    latencies.sort()
+    print(json.dumps({
+        'connections': args.connections,
+        'seconds': round(seconds, 1),
+        'requests': len(latencies),
+        'requests_per_second': round(len(latencies) / seconds, 1),
+        'p50_ms': round(percentile(latencies, 0.50), 1),
+        'p95_ms': round(percentile(latencies, 0.95), 1),
+        'p99_ms': round(percentile(latencies, 0.99), 1),
+        'mean_ms': round(statistics.fmean(latencies) * 1000, 1) if latencies else 0.0,
+        'statuses': {str(status): count for status, count in statuses.most_common()},
+    }, indent=2))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('paths', nargs='+', help="Paths to request, round-robin per connection")
+    parser.add_argument('--url', default='http://127.0.0.1:8000', help="Server base URL")
+    parser.add_argument('--connections', type=int, default=500, help="Concurrent keep-alive connections")
+    parser.add_argument('--duration', type=float, default=30, help="Seconds to run for")
+    parser.add_argument('--token', help="JWT access token to send")
+    parser.add_argument('--email', help="Log in as this user instead of passing --token")
+    parser.add_argument('--password', help="Password for --email")
+    asyncio.run(main(parser.parse_args()))
@@ -10,6 +10,7 @@ class CompanyAdmin(admin.ModelAdmin):
 class DepartmentAdmin(admin.ModelAdmin):
     list_display = ['name', 'company', 'employee_count', 'project_count']
     list_filter = ['company']
+    list_select_related = ['company']
     readonly_fields = ['employee_count', 'project_count']
 
 
@@ -0,0 +1,23 @@
+from main.async_api import async_read_view, paginate, retrieve
+from .models import Company, Department
+from .serializers import CompanyValuesSerializer, DepartmentValuesSerializer
+
+
+@async_read_view
+async def company_list(request):
+    return await paginate(request, Company.objects.all(), ('slug',), CompanyValuesSerializer())
+
+
+@async_read_view
+async def company_detail(request, slug):
+    return await retrieve(Company.objects.all(), CompanyValuesSerializer(), slug=slug)
+
+
+@async_read_view
+async def department_list(request):
+    return await paginate(request, Department.objects.all(), ('slug',), DepartmentValuesSerializer())
+
+
+@async_read_view
+async def department_detail(request, slug):
+    return await retrieve(Department.objects.all(), DepartmentValuesSerializer(), slug=slug)
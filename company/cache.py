@@ -0,0 +1,125 @@
+"""
+Versioned response cache for the read-only company and department endpoints.
+
+Cached entries are keyed on version numbers instead of being deleted. A global
+version covers the list endpoints, and one version per company covers that
+company's detail page and its departments' pages. Saving or deleting a
+company, department, employee or project bumps the versions it affects (see
+``company/signals.py``), so stale entries are simply never read again and
+expire on their own. Versions live in the API cache, so every process must
+share it: the default ``locmem`` backend only suits a single process.
+"""
+import hashlib
+import time
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+GLOBAL_VERSION_KEY = 'hierarchy:version'
+
+
+def api_cache():
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def company_version_key(company_id):
+    return f'hierarchy:version:company:{company_id}'
+
+
+def get_version(key):
+    # A missing version (first use, eviction, restart) starts from the clock,
+    # so it can never repeat a version an older entry was stored under.
+    cache = api_cache()
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump(*company_ids):
+    """
+    Invalidate the list endpoints and the detail pages of the given companies.
+
+    The versions change once the current transaction commits. A bump before
+    then would let a concurrent read rebuild an entry from the uncommitted
+    rows' previous state and store it under the new version.
+    """
+    transaction.on_commit(partial(bump_now, company_ids))
+
+
+def bump_now(company_ids):
+    cache = api_cache()
+    keys = [GLOBAL_VERSION_KEY] + [company_version_key(pk) for pk in set(company_ids) if pk is not None]
+    for key in keys:
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), timeout=None)
+
+
+def etag_for(*parts):
+    return '"%s"' % hashlib.md5(':'.join(map(str, parts)).encode()).hexdigest()
+
+
+def etag_matches(request, etag):
+    """Whether ``If-None-Match`` lists ``etag``, compared weakly as RFC 9110 asks."""
+    etags = {tag.removeprefix('W/') for tag in parse_etags(request.headers.get('If-None-Match', ''))}
+    return '*' in etags or etag in etags
+
+
+class HierarchyCacheMixin:
+    """
+    Serve ``list`` and ``retrieve`` from the API cache with ``ETag`` support.
+
+    The ETag is derived from the cache versions alone, so a matching
+    ``If-None-Match`` is answered with a 304 before any query or
+    serialization runs. Viewsets implement ``company_id_for(instance)``.
+    """
+
+    def company_id_for(self, instance):
+        raise NotImplementedError
+
+    def cache_key(self, kind, request):
+        path = hashlib.md5(request.get_full_path().encode()).hexdigest()
+        return f'hierarchy:{self.basename}:{kind}:{path}'
+
+    def cached_response(self, request, data, etag):
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+        return Response(data, headers={'ETag': etag})
+
+    def list(self, request, *args, **kwargs):
+        version = get_version(GLOBAL_VERSION_KEY)
+        key = self.cache_key('list', request)
+        etag = etag_for(key, version)
+        if etag_matches(request, etag):
+            return self.cached_response(request, None, etag)
+
+        cache = api_cache()
+        entry = cache.get(key)
+        if entry is None or entry['version'] != version:
+            entry = {'version': version, 'data': super().list(request, *args, **kwargs).data}
+            cache.set(key, entry, settings.API_CACHE_TIMEOUT)
+        return self.cached_response(request, entry['data'], etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        cache = api_cache()
+        key = self.cache_key('detail', request)
+        entry = cache.get(key)
+        if entry is None or entry['version'] != get_version(company_version_key(entry['company_id'])):
+            instance = self.get_object()
+            company_id = self.company_id_for(instance)
+            version = get_version(company_version_key(company_id))
+            entry = {
+                'company_id': company_id,
+                'version': version,
+                'data': self.get_serializer(instance).data,
+            }
+            cache.set(key, entry, settings.API_CACHE_TIMEOUT)
+        return self.cached_response(request, entry['data'], etag_for(key, entry['version']))
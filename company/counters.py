@@ -0,0 +1,69 @@
+"""
+Stored counters on ``Company`` and ``Department``.
+
+``COUNTED`` lists, per model, the foreign keys whose targets count its rows.
+``company/signals.py`` applies single-row creates, moves and deletes; code
+that writes with ``bulk_create`` calls ``count_created`` itself, and
+``manage.py recount`` rebuilds every counter from scratch.
+"""
+from collections import Counter, defaultdict
+
+from django.db.models import F, QuerySet
+from django.db.models.functions import Greatest
+
+from user.models import Employee
+from .models import Company, Department, Project
+
+COUNTED = {
+    Department: [('company_id', Company, 'department_count')],
+    Employee: [('company_id', Company, 'employee_count'), ('department_id', Department, 'employee_count')],
+    Project: [('company_id', Company, 'project_count'), ('department_id', Department, 'project_count')],
+}
+
+
+def adjust(model, field, deltas):
+    """
+    Add ``deltas`` (``{pk: change}``) to ``field``, with one UPDATE per distinct change.
+
+    Decrements stop at zero, so a counter that drifted low (after an
+    ``update()`` or raw SQL; see ``manage.py recount``) can't fail a delete.
+    """
+    by_change = defaultdict(list)
+    for pk, change in deltas.items():
+        if pk is not None and change:
+            by_change[change].append(pk)
+    for change, pks in by_change.items():
+        value = F(field) + change if change > 0 else Greatest(F(field) + change, 0)
+        model.objects.filter(pk__in=pks).update(**{field: value})
+
+
+def deleted_targets(origin):
+    """
+    ``{model: pks}`` of the counting rows a delete started at ``origin`` removes.
+
+    ``origin`` is what ``post_delete`` passes: the instance or queryset whose
+    ``delete()`` cascaded. Deleting a company takes its departments with it,
+    so counters on either need no adjusting. Worked out once per delete.
+    """
+    targets = getattr(origin, '_counted_targets', None)
+    if targets is not None:
+        return targets
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    targets = {}
+    if model in (Company, Department):
+        pks = set(origin.values_list('pk', flat=True)) if isinstance(origin, QuerySet) else {origin.pk}
+        targets[model] = pks
+        if model is Company:
+            targets[Department] = set(Department.objects.filter(company__in=pks).values_list('pk', flat=True))
+    if origin is not None:
+        origin._counted_targets = targets
+    return targets
+
+
+def count_created(instances):
+    """Count freshly bulk-created ``instances`` of one of the ``COUNTED`` models."""
+    instances = list(instances)
+    if not instances:
+        return
+    for attname, model, field in COUNTED[type(instances[0])]:
+        adjust(model, field, Counter(getattr(instance, attname) for instance in instances))
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+from main.filters import FilterSet
+
+
+class DepartmentFilter(FilterSet):
+    company = serializers.SlugField(source='company__slug', required=False)
+
+
+class ProjectFilter(FilterSet):
+    """Projects of a company or department, or running at some point in ``active_from``..``active_to``."""
+    company = serializers.SlugField(source='company__slug', required=False)
+    department = serializers.SlugField(source='department__slug', required=False)
+    active_from = serializers.DateField(source='end_date__gte', required=False)
+    active_to = serializers.DateField(source='start_date__lte', required=False)
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from company.cache import bump
+from company.models import Company, Department
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the stored department, employee and project counters of every company and department. "
+        "Run it after writing rows in ways that skip model signals, such as QuerySet.update() or raw SQL."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            companies = Company.objects.recount()
+            departments = Department.objects.recount()
+        bump(*Company.objects.values_list('pk', flat=True))
+        self.stdout.write(self.style.SUCCESS(f"Recounted {companies} companies and {departments} departments."))
@@ -0,0 +1,193 @@
+import random
+import time
+import uuid
+from datetime import date, timedelta
+from itertools import islice
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from company.cache import bump
+from company.counters import count_created
+from company.models import Company, Department, Project
+from performance_review.models import PerformanceReview, ReviewTransition
+from search.documents import index_instances
+from search.models import SearchDocument
+from user.models import Employee, User
+
+FIRST_NAMES = ['Ahmed', 'Sara', 'Omar', 'Lina', 'Youssef', 'Mona', 'Karim', 'Nour', 'Hassan', 'Laila',
+               'James', 'Maria', 'Chen', 'Priya', 'Lucas', 'Emma', 'Kenji', 'Fatima', 'Ivan', 'Zara']
+LAST_NAMES = ['Hashim', 'Mostafa', 'Adel', 'Farouk', 'Smith', 'Garcia', 'Wang', 'Patel', 'Silva', 'Kim',
+              'Ibrahim', 'Nasser', 'Tanaka', 'Rossi', 'Novak', 'Haddad', 'Cohen', 'Okafor', 'Larsen', 'Dubois']
+POSITIONS = ['Engineer', 'Senior Engineer', 'Designer', 'Analyst', 'Accountant', 'Recruiter',
+             'Product Manager', 'Support Specialist', 'Sales Representative', 'Team Lead']
+DEPARTMENTS = ['Engineering', 'Finance', 'Sales', 'Marketing', 'Support', 'Operations',
+               'Legal', 'Research', 'Design', 'People']
+PROJECT_WORDS = ['Apollo', 'Atlas', 'Beacon', 'Comet', 'Delta', 'Echo', 'Falcon', 'Helix', 'Nova', 'Orion']
+EPOCH = date(2020, 1, 1)
+
+
+def batched(items, size):
+    items = iter(items)
+    while batch := list(islice(items, size)):
+        yield batch
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a large, reproducible dataset for load testing with batched bulk inserts. "
+        "The same --seed and cardinalities always produce the same rows; run it against an empty database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--companies', type=int, default=10, help="Number of companies")
+        parser.add_argument('--departments', type=int, default=5, help="Departments per company")
+        parser.add_argument('--employees', type=int, default=1000, help="Total number of employees")
+        parser.add_argument('--projects', type=int, default=20, help="Projects per company")
+        parser.add_argument('--assignments', type=int, default=5, help="Employees assigned to each project")
+        parser.add_argument('--reviews', type=int, default=0, help="Performance reviews per employee")
+        parser.add_argument('--seed', type=int, default=42, help="Random seed")
+        parser.add_argument('--batch-size', type=int, default=5000, help="Rows per INSERT")
+        parser.add_argument('--password', default='password123', help="Password shared by every seeded user")
+
+    def handle(self, *args, **options):
+        if options['companies'] < 1 or options['departments'] < 1:
+            raise CommandError("At least one company and one department per company are required.")
+        self.seed = options['seed']
+        self.rng = random.Random(self.seed)
+        self.batch_size = options['batch_size']
+        self.domain = f"seed{self.seed}.example"
+        if User.objects.filter(email__endswith=f"@{self.domain}").exists():
+            raise CommandError(f"Users @{self.domain} already exist; use another --seed or an empty database.")
+        # Hashing once and sharing the result skips the password hasher for every other user.
+        self.password = make_password(options['password'])
+
+        started = time.perf_counter()
+        companies = self.create_companies(options['companies'], options['seed'])
+        per_company, remainder = divmod(options['employees'], len(companies))
+        totals = dict.fromkeys(['departments', 'employees', 'projects', 'assignments', 'reviews'], 0)
+
+        for index, company in enumerate(companies):
+            with transaction.atomic():
+                departments = self.create_departments(company, options['departments'])
+                employee_count = per_company + (1 if index < remainder else 0)
+                employees = self.create_employees(company, departments, employee_count, totals['employees'])
+                projects = self.create_projects(company, departments, options['projects'])
+                assignments = self.assign(projects, employees, options['assignments'])
+                reviews = self.create_reviews(employees, options['reviews'])
+                # bulk_create skips the post_save handlers that keep the counters and search documents.
+                for rows in (departments, employees, projects):
+                    count_created(rows)
+                for rows in ([company], departments, employees, projects):
+                    index_instances(rows)
+            totals['departments'] += len(departments)
+            totals['employees'] += len(employees)
+            totals['projects'] += len(projects)
+            totals['assignments'] += assignments
+            totals['reviews'] += reviews
+            self.stdout.write(f"{company.name}: {len(employees)} employees, {len(projects)} projects")
+
+        # bulk_create skips the post_save handlers that normally invalidate the API cache.
+        bump(*(company.pk for company in companies))
+        SearchDocument.objects.optimize()
+        seconds = time.perf_counter() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"Created {len(companies)} companies, {totals['departments']} departments, "
+            f"{totals['employees']} employees, {totals['projects']} projects, "
+            f"{totals['assignments']} assignments and {totals['reviews']} reviews in {seconds:.1f}s "
+            f"({totals['employees'] / seconds:.0f} employees/s)"
+        ))
+
+    def create_companies(self, count, seed):
+        companies = []
+        for index in range(count):
+            name = f"Seed {seed} Company {index:05d}"
+            companies.append(Company(name=name, slug=name.lower()))
+        return Company.objects.bulk_create(companies, batch_size=self.batch_size)
+
+    def create_departments(self, company, count):
+        departments = []
+        for index in range(count):
+            name = f"{DEPARTMENTS[index % len(DEPARTMENTS)]} {index}"
+            departments.append(Department(company=company, name=name, slug=f"{name.lower()}-{company.slug}"))
+        return Department.objects.bulk_create(departments, batch_size=self.batch_size)
+
+    def create_employees(self, company, departments, count, offset):
+        rng = self.rng
+        employees = []
+        for batch in batched(range(offset, offset + count), self.batch_size):
+            users = [
+                User(username=f"seed{self.seed}-user{number:07d}", email=f"user{number:07d}@{self.domain}",
+                     role=User.ROLES.EMPLOYEE, password=self.password)
+                for number in batch
+            ]
+            User.objects.bulk_create(users)
+            if any(user.pk is None for user in users):
+                ids = dict(User.objects.filter(email__in=[user.email for user in users]).values_list('email', 'id'))
+                for user in users:
+                    user.pk = ids[user.email]
+
+            chunk = [
+                Employee(
+                    user=user,
+                    company=company,
+                    department=rng.choice(departments),
+                    name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                    mobile=f"+20{rng.randrange(10 ** 9, 10 ** 10)}",
+                    address=f"{rng.randrange(1, 999)} Street {rng.randrange(1, 99)}",
+                    position=rng.choice(POSITIONS),
+                    hired_on=EPOCH + timedelta(days=rng.randrange(2000)),
+                )
+                for user in users
+            ]
+            employees.extend(Employee.objects.bulk_create(Employee.objects.allocate_slugs(chunk)))
+        return employees
+
+    def create_projects(self, company, departments, count):
+        rng = self.rng
+        projects = []
+        for index in range(count):
+            department = rng.choice(departments)
+            name = f"{rng.choice(PROJECT_WORDS)} {index}"
+            start = EPOCH + timedelta(days=rng.randrange(2000))
+            projects.append(Project(
+                company=company,
+                department=department,
+                name=name,
+                slug=f"{name.lower()}-{department.slug}-{company.slug}",
+                description=f"{name} for {department.name}",
+                start_date=start,
+                end_date=start + timedelta(days=rng.randrange(30, 720)),
+            ))
+        return Project.objects.bulk_create(projects, batch_size=self.batch_size)
+
+    def assign(self, projects, employees, per_project):
+        through = Project.assigned_employees.through
+        rows = [
+            through(project_id=project.pk, employee_id=employee.pk)
+            for project in projects
+            for employee in self.rng.sample(employees, min(per_project, len(employees)))
+        ]
+        through.objects.bulk_create(rows, batch_size=self.batch_size)
+        return len(rows)
+
+    def create_reviews(self, employees, per_employee):
+        rng = self.rng
+        stages = [stage for stage, _ in PerformanceReview.REVIEW_STAGES]
+        reviews = []
+        for employee in employees:
+            for _ in range(per_employee):
+                # A seeded UUID keeps primary keys reproducible across runs.
+                reviews.append(PerformanceReview(
+                    id=uuid.UUID(int=rng.getrandbits(128), version=4),
+                    employee=employee,
+                    stage=rng.choice(stages),
+                ))
+        PerformanceReview.objects.bulk_create(reviews, batch_size=self.batch_size)
+        # bulk_create skips the post_save handler that records each review's first stage.
+        ReviewTransition.objects.bulk_create(
+            (ReviewTransition(review=review, stage=review.stage, created_at=review.created_at) for review in reviews),
+            batch_size=self.batch_size,
+        )
+        return len(reviews)
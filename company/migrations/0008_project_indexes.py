@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-18 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0007_alter_project_assigned_employees'),
+        ('user', '0008_alter_employee_company_alter_employee_department'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['company', 'department'], name='project_company_dept_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['department', 'start_date', 'end_date'], name='project_dept_dates_idx'),
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:39
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count(model, field):
+    counts = model.objects.filter(**{field: OuterRef('pk')}).order_by().values(field).annotate(
+        total=Count('pk')).values('total')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+def fill_counters(apps, schema_editor):
+    Company = apps.get_model('company', 'Company')
+    Department = apps.get_model('company', 'Department')
+    Project = apps.get_model('company', 'Project')
+    Employee = apps.get_model('user', 'Employee')
+    Company.objects.update(
+        department_count=count(Department, 'company'),
+        employee_count=count(Employee, 'company'),
+        project_count=count(Project, 'company'),
+    )
+    Department.objects.update(employee_count=count(Employee, 'department'), project_count=count(Project, 'department'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0008_project_indexes'),
+        ('user', '0009_employee_company_dept_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='company',
+            name='department_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='employee_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='company',
+            name='project_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='employee_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='department',
+            name='project_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0009_stored_counters'),
+        ('user', '0009_employee_company_dept_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['start_date', 'slug'], name='project_start_slug_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['end_date', 'slug'], name='project_end_slug_idx'),
+        ),
+    ]
@@ -1,46 +1,141 @@
-from django.db import models
+from collections import defaultdict
+
+from django.db import models, transaction
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from main.models import LoadedValuesMixin
 from user.models import Employee
 
-class Company(models.Model):
+
+def _count_subquery(model, field):
+    """Correlated ``COUNT(*)`` of ``model`` rows whose ``field`` points at the outer row."""
+    counts = (
+        model.objects.filter(**{field: OuterRef('pk')})
+        .order_by()
+        .values(field)
+        .annotate(total=Count('pk'))
+        .values('total')
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class CompanyQuerySet(models.QuerySet):
+    def recount(self):
+        """
+        Rebuild the stored department, employee and project counters in one UPDATE.
+
+        Each total is a correlated subquery rather than a ``Count`` over joins,
+        so the three relations don't multiply each other's rows.
+        """
+        return self.update(
+            department_count=_count_subquery(Department, 'company'),
+            employee_count=_count_subquery(Employee, 'company'),
+            project_count=_count_subquery(Project, 'company'),
+        )
+
+
+class StoredCountersMixin:
+    """
+    Keep ``save()`` from writing the counter columns back.
+
+    The counters are changed with ``F()`` updates (see ``company/counters.py``)
+    while an instance is in memory, so saving its stale values would undo them.
+    """
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
+
+
+class Company(StoredCountersMixin, models.Model):
     slug = models.SlugField(unique=True, blank=True)
     name = models.CharField(max_length=255,unique=True)
+    department_count = models.PositiveIntegerField(default=0, editable=False)
+    employee_count = models.PositiveIntegerField(default=0, editable=False)
+    project_count = models.PositiveIntegerField(default=0, editable=False)
+
+    counter_fields = ('department_count', 'employee_count', 'project_count')
+
+    objects = CompanyQuerySet.as_manager()
 
     def save(self, *args, **kwargs):
         self.slug = self.name.lower()
         super().save(*args, **kwargs)
 
-    @property
-    def department_count(self):
-        return self.departments.count()
-    
-    @property   
-    def employee_count(self):
-        return self.employees.count()
-    
-    @property   
-    def project_count(self):
-        return self.projects.count()
 
+class DepartmentQuerySet(models.QuerySet):
+    def recount(self):
+        """Rebuild the stored employee and project counters, as ``CompanyQuerySet.recount`` does."""
+        return self.update(
+            employee_count=_count_subquery(Employee, 'department'),
+            project_count=_count_subquery(Project, 'department'),
+        )
 
-class Department(models.Model):
+
+class Department(LoadedValuesMixin, StoredCountersMixin, models.Model):
     slug = models.SlugField(unique=True, blank=True)
     company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='departments')
     name = models.CharField(max_length=255)
+    employee_count = models.PositiveIntegerField(default=0, editable=False)
+    project_count = models.PositiveIntegerField(default=0, editable=False)
+
+    counter_fields = ('employee_count', 'project_count')
+
+    objects = DepartmentQuerySet.as_manager()
 
     def save(self, *args, **kwargs):
         self.slug = self.name.lower() + '-' + self.company.slug
         super().save(*args, **kwargs)
 
-    @property
-    def employee_count(self):
-        return self.employees.count()
 
-    @property
-    def project_count(self):
-        return self.projects.count()
+class ProjectQuerySet(models.QuerySet):
+    def with_related(self):
+        """Load company and department in the same query and prefetch assigned employees' names, by id."""
+        return self.select_related('company', 'department').prefetch_related(
+            Prefetch('assigned_employees', queryset=Employee.objects.only('name').order_by('pk')),
+        )
 
+    def bulk_assign(self, assignments, batch_size=1000):
+        """
+        Replace the assigned employees of many projects at once.
 
-class Project(models.Model):
+        ``assignments`` maps project ids to the full set of employee ids each
+        project should end up with. The current rows of the through table are
+        read and diffed in memory; additions go in with ``bulk_create`` and
+        removals with filtered deletes, all inside one transaction. Reads,
+        inserts and deletes each take ``batch_size`` ids per query, which keeps
+        them under the database's limit on query parameters.
+        """
+        through = self.model.assigned_employees.through
+        current = defaultdict(dict)
+        project_ids = list(assignments)
+        with transaction.atomic():
+            for start in range(0, len(project_ids), batch_size):
+                rows = through.objects.filter(project_id__in=project_ids[start:start + batch_size])
+                for pk, project_id, employee_id in rows.values_list('pk', 'project_id', 'employee_id'):
+                    current[project_id][employee_id] = pk
+
+            added, removed = [], []
+            for project_id, employee_ids in assignments.items():
+                existing = current[project_id]
+                added.extend(
+                    through(project_id=project_id, employee_id=employee_id)
+                    for employee_id in employee_ids if employee_id not in existing
+                )
+                removed.extend(pk for employee_id, pk in existing.items() if employee_id not in employee_ids)
+
+            through.objects.bulk_create(added, batch_size=batch_size, ignore_conflicts=True)
+            for start in range(0, len(removed), batch_size):
+                through.objects.filter(pk__in=removed[start:start + batch_size]).delete()
+        return {'projects': len(assignments), 'added': len(added), 'removed': len(removed)}
+
+
+class Project(LoadedValuesMixin, models.Model):
     slug = models.SlugField(unique=True, blank=True)
     company = models.ForeignKey(Company, on_delete=models.CASCADE, related_name='projects')
     department = models.ForeignKey(Department, on_delete=models.CASCADE, related_name='projects')
@@ -50,6 +145,16 @@ class Project(models.Model):
     end_date = models.DateField()
     assigned_employees = models.ManyToManyField(Employee, related_name='projects')
 
+    objects = ProjectQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['company', 'department'], name='project_company_dept_idx'),
+            models.Index(fields=['department', 'start_date', 'end_date'], name='project_dept_dates_idx'),
+            models.Index(fields=['start_date', 'slug'], name='project_start_slug_idx'),
+            models.Index(fields=['end_date', 'slug'], name='project_end_slug_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         self.slug = self.name.lower() + '-' + self.department.slug + '-' + self.company.slug
         super().save(*args, **kwargs)
@@ -1,44 +1,58 @@
+from collections import Counter, defaultdict
+
 from .models import Company, Department, Project
 from rest_framework import serializers
+from main.serializers import SparseFieldsetMixin, ValuesSerializer
+from user.models import Employee
 
-class CompanySerializer(serializers.ModelSerializer):
+class CompanySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Company
         fields = '__all__'
 
-    employee_count = serializers.SerializerMethodField()
-    department_count = serializers.SerializerMethodField()
-    project_count = serializers.SerializerMethodField()
-    def get_employee_count(self, obj) -> int:
-        return obj.employee_count 
-
-    def get_department_count(self, obj) -> int:
-        return obj.department_count
-
-    def get_project_count(self, obj) -> int:
-        return obj.project_count
+    employee_count = serializers.IntegerField(read_only=True)
+    department_count = serializers.IntegerField(read_only=True)
+    project_count = serializers.IntegerField(read_only=True)
 
 
-class DepartmentSerializer(serializers.ModelSerializer):
-    employee_count = serializers.SerializerMethodField()
-    project_count = serializers.SerializerMethodField()
-    def get_employee_count(self, obj) -> int:
-        return obj.employee_count
+class DepartmentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    expandable_fields = {'company': 'name'}
 
-    def get_project_count(self, obj) -> int:
-        return obj.project_count
+    employee_count = serializers.IntegerField(read_only=True)
+    project_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Department
         fields = '__all__'
 
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['company'] = instance.company.name
-        return representation
 
+class CompanyValuesSerializer(ValuesSerializer):
+    """``CompanySerializer`` output for rows of ``Company.objects.values()``."""
+    fields = {
+        'id': 'id',
+        'employee_count': 'employee_count',
+        'department_count': 'department_count',
+        'project_count': 'project_count',
+        'slug': 'slug',
+        'name': 'name',
+    }
+
+
+class DepartmentValuesSerializer(ValuesSerializer):
+    """``DepartmentSerializer`` output for rows of ``Department.objects.values()``."""
+    fields = {
+        'id': 'id',
+        'employee_count': 'employee_count',
+        'project_count': 'project_count',
+        'slug': 'slug',
+        'name': 'name',
+        'company': 'company__name',
+    }
+
+
+class ProjectSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    expandable_fields = {'company': 'name', 'department': 'name', 'assigned_employees': 'name'}
 
-class ProjectSerializer(serializers.ModelSerializer):
     company = serializers.SlugRelatedField(
         slug_field="slug",
         queryset=Company.objects.all()
@@ -52,9 +66,88 @@ class ProjectSerializer(serializers.ModelSerializer):
         model = Project
         fields = '__all__'
 
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['company'] = instance.company.name
-        representation['department'] = instance.department.name
-        representation['assigned_employees'] = [employee.name for employee in instance.assigned_employees.all()]
+
+class ProjectValuesSerializer(ValuesSerializer):
+    """
+    ``ProjectSerializer`` output for ``Project.objects.values()`` rows.
+
+    Assigned employees' names are read with one query per batch of rows, in
+    id order like the serializer's prefetch.
+    """
+    fields = {
+        'id': 'id',
+        'company': 'company__name',
+        'department': 'department__name',
+        'slug': 'slug',
+        'name': 'name',
+        'description': 'description',
+        'start_date': 'start_date',
+        'end_date': 'end_date',
+    }
+    computed_fields = ('assigned_employees',)
+
+    def load_related(self, rows):
+        self.assigned_employees = defaultdict(list)
+        through = Project.assigned_employees.through
+        assignments = through.objects.filter(project_id__in=[row['id'] for row in rows]).order_by('employee_id')
+        for project_id, name in assignments.values_list('project_id', 'employee__name'):
+            self.assigned_employees[project_id].append(name)
+
+    def to_representation(self, row):
+        representation = super().to_representation(row)
+        representation['assigned_employees'] = self.assigned_employees.get(row['id'], [])
         return representation
+
+
+class ProjectAssignmentSerializer(serializers.Serializer):
+    project = serializers.CharField()
+    employees = serializers.ListField(child=serializers.CharField(), allow_empty=True)
+
+
+class ProjectBulkAssignSerializer(serializers.Serializer):
+    """
+    Validates many ``(project, [employees])`` pairs and resolves their slugs to ids.
+
+    Each listed project ends up assigned to exactly the given employees.
+    ``validated_data['assignments']`` maps project ids to sets of employee ids.
+    Slugs are looked up ``batch_size`` at a time, as ``bulk_assign`` writes.
+    """
+    assignments = ProjectAssignmentSerializer(many=True, allow_empty=False)
+    batch_size = 1000
+
+    def validate_assignments(self, assignments):
+        counts = Counter(assignment['project'] for assignment in assignments)
+        duplicates = sorted(slug for slug, count in counts.items() if count > 1)
+        if duplicates:
+            raise serializers.ValidationError(f"Projects listed more than once: {', '.join(duplicates)}")
+        return assignments
+
+    def validate(self, attrs):
+        assignments = attrs['assignments']
+        employee_slugs = {slug for assignment in assignments for slug in assignment['employees']}
+        projects = self.ids_by_slug(Project, [a['project'] for a in assignments])
+        employees = self.ids_by_slug(Employee, list(employee_slugs))
+
+        errors = {}
+        missing_projects = sorted({a['project'] for a in assignments} - projects.keys())
+        if missing_projects:
+            errors['projects'] = [f"Unknown project slug: {slug}" for slug in missing_projects]
+        missing_employees = sorted(employee_slugs - employees.keys())
+        if missing_employees:
+            errors['employees'] = [f"Unknown employee slug: {slug}" for slug in missing_employees]
+        if errors:
+            raise serializers.ValidationError(errors)
+
+        return {
+            'assignments': {
+                projects[assignment['project']]: {employees[slug] for slug in assignment['employees']}
+                for assignment in assignments
+            }
+        }
+
+    def ids_by_slug(self, model, slugs):
+        ids = {}
+        for start in range(0, len(slugs), self.batch_size):
+            chunk = slugs[start:start + self.batch_size]
+            ids.update(model.objects.filter(slug__in=chunk).values_list('slug', 'id'))
+        return ids
@@ -0,0 +1,65 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from user.models import Employee
+from .cache import bump
+from .counters import COUNTED, adjust, deleted_targets
+from .models import Company, Department, Project
+
+MISSING = object()
+
+
+def bump_once(origin, *company_ids):
+    """Bump ``company_ids``, skipping those an earlier row of the same delete already bumped."""
+    if origin is None:
+        bump(*company_ids)
+        return
+    bumped = getattr(origin, '_bumped_companies', None)
+    if bumped is None:
+        bumped = origin._bumped_companies = set()
+    fresh = set(company_ids) - bumped
+    if fresh:
+        bumped |= fresh
+        bump(*fresh)
+
+
+@receiver([post_save, post_delete], sender=Company)
+def invalidate_company(sender, instance, origin=None, **kwargs):
+    bump_once(origin, instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Department)
+@receiver([post_save, post_delete], sender=Employee)
+@receiver([post_save, post_delete], sender=Project)
+def invalidate_company_members(sender, instance, origin=None, **kwargs):
+    # A row that moved between companies changes both of them. The rows of a
+    # cascade share their companies, which are bumped once for the delete.
+    bump_once(origin, instance.company_id, instance.loaded_value('company_id'))
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Employee)
+@receiver(post_save, sender=Project)
+def count_saved(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return  # fixtures carry their own counters
+    for attname, model, field in COUNTED[sender]:
+        current = getattr(instance, attname)
+        if created:
+            adjust(model, field, {current: 1})
+            continue
+        # Without the loaded row there is no telling whether the key moved.
+        previous = instance.loaded_value(attname, MISSING)
+        if previous is not MISSING and previous != current:
+            adjust(model, field, {previous: -1, current: 1})
+
+
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Employee)
+@receiver(post_delete, sender=Project)
+def count_deleted(sender, instance, origin=None, **kwargs):
+    # Rows deleted along with their company or department leave its counters alone.
+    deleted = deleted_targets(origin)
+    for attname, model, field in COUNTED[sender]:
+        target = instance.loaded_value(attname, getattr(instance, attname))
+        if target not in deleted.get(model, ()):
+            adjust(model, field, {target: -1})
@@ -4,6 +4,7 @@ from rest_framework import routers
 
 from .views import CompanyViewSet, DepartmentViewSet, ProjectViewSet
 from .views import CompanyAdminViewSet, DepartmentAdminViewSet, ProjectAdminViewSet
+from . import async_views
 
 
 
@@ -18,6 +19,10 @@ router.register('departments', DepartmentViewSet, basename='department')
 router.register('projects', ProjectViewSet, basename='project')
 
 urlpatterns = [
+    path('async/companies/', async_views.company_list, name='async-company-list'),
+    path('async/companies/<str:slug>/', async_views.company_detail, name='async-company-detail'),
+    path('async/departments/', async_views.department_list, name='async-department-list'),
+    path('async/departments/<str:slug>/', async_views.department_detail, name='async-department-detail'),
     path('admin-panel/', include(admin_router.urls)),
     path('', include(router.urls)),
 ]
\ No newline at end of file
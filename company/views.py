@@ -1,40 +1,67 @@
+from .cache import HierarchyCacheMixin
+from main.views import SparseFieldsetViewMixin, ValuesListViewMixin
+from .filters import DepartmentFilter, ProjectFilter
 from .models import Company, Department, Project
 
-from .serializers import CompanySerializer, DepartmentSerializer, ProjectSerializer
+from .serializers import CompanySerializer, DepartmentSerializer, ProjectSerializer, ProjectBulkAssignSerializer
+from .serializers import ProjectValuesSerializer
+from main.exports import CSVRenderer, NDJSONRenderer, export_response
 
 from rest_framework.permissions import IsAuthenticated,IsAdminUser
-from rest_framework import viewsets, mixins
-
-class CompanyViewSet(mixins.ListModelMixin,
+from rest_framework import viewsets, mixins, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+
+class CompanyViewSet(HierarchyCacheMixin,
+                     SparseFieldsetViewMixin,
+                     mixins.ListModelMixin,
                      mixins.RetrieveModelMixin,
                      viewsets.GenericViewSet):
 
     """
     API view set for listing and retrieving Company instances.
 
+    Responses are cached and carry an ETag; see ``company/cache.py``.
+
     Inherits from:
         - ListAPIView: Provides a read-only endpoint to list all companies.
         - RetrieveAPIView: Provides a read-only endpoint to retrieve a single company by slug.
 
     Attributes:
-        queryset (QuerySet): All Company objects from the database.
+        queryset (QuerySet): All Company objects; their department, employee and
+            project totals are stored columns.
         serializer_class (Serializer): Serializer class used for Company objects.
         permission_classes (list): List of permission classes to apply to the view.
         lookup_field (str): Field used to lookup Company instances.
+        authentication_classes (list): Stateless JWT authentication; the caller
+            is built from the token's claims, so a cached response needs no query.
+            The user isn't loaded, so a deactivated or deleted user can still read
+            companies until the access token expires (12 hours).
+        ordering_fields (list): Indexed columns ``?ordering=`` may name.
     """
 
+    authentication_classes = [JWTStatelessUserAuthentication]
     permission_classes = [IsAuthenticated]
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     lookup_field = 'slug'
+    ordering_fields = ['slug', 'name']
+
+    def company_id_for(self, instance):
+        return instance.pk
 
 
-class DepartmentViewSet(mixins.ListModelMixin,
-                         mixins.RetrieveModelMixin,
-                         viewsets.GenericViewSet):
+class DepartmentViewSet(HierarchyCacheMixin,
+                        SparseFieldsetViewMixin,
+                        mixins.ListModelMixin,
+                        mixins.RetrieveModelMixin,
+                        viewsets.GenericViewSet):
     """
     API view set for listing and retrieving Department instances.
 
+    Responses are cached and carry an ETag; see ``company/cache.py``.
+
     Inherits from:
         - ListAPIView: Provides a read-only endpoint to list all departments.
         - RetrieveAPIView: Provides a read-only endpoint to retrieve a single department by slug.
@@ -49,14 +76,22 @@ class DepartmentViewSet(mixins.ListModelMixin,
         serializer_class (Serializer): Serializer class used for Department objects.
         permission_classes (list): List of permission classes to apply to the view.
         lookup_field (str): Field used to lookup Department instances.
+        authentication_classes (list): Stateless JWT authentication, as for companies;
+            deactivated or deleted users can read departments until their token expires.
+        filterset_class (FilterSet): Query-string filters for the list.
     """
+    authentication_classes = [JWTStatelessUserAuthentication]
     permission_classes = [IsAuthenticated]
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     lookup_field = 'slug'
+    filterset_class = DepartmentFilter
+
+    def company_id_for(self, instance):
+        return instance.company_id
 
 
-class ProjectViewSet(viewsets.ModelViewSet):
+class ProjectViewSet(ValuesListViewMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API view set for managing Project instances.
 
@@ -67,43 +102,57 @@ class ProjectViewSet(viewsets.ModelViewSet):
         - RetrieveUpdateDestroyAPIView: Provides endpoints to retrieve, update, or delete an Project.
 
     Attributes:
-        queryset (QuerySet): All Project objects from the database.
+        queryset (QuerySet): All Project objects, with company, department and
+            assigned employees loaded up front.
         serializer_class (Serializer): Serializer class used for Project objects.
+        values_serializer_class (ValuesSerializer): Renders plain list pages from ``values()`` rows.
         permission_classes (list): List of permission classes to apply to the view.
         lookup_field (str): Field used to lookup Project instances.
+        filterset_class (FilterSet): Query-string filters for the list.
+        ordering_fields (list): Indexed columns ``?ordering=`` may name.
     """
 
-    queryset = Project.objects.all()
+    queryset = Project.objects.with_related()
     serializer_class = ProjectSerializer
+    values_serializer_class = ProjectValuesSerializer
     lookup_field = 'slug'
+    filterset_class = ProjectFilter
+    ordering_fields = ['slug', 'start_date', 'end_date']
+
+    @action(detail=False, methods=['post'], url_path='bulk-assign',
+            serializer_class=ProjectBulkAssignSerializer, permission_classes=[IsAuthenticated])
+    def bulk_assign(self, request):
+        """Set the assigned employees of many projects in one transaction."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = Project.objects.bulk_assign(serializer.validated_data['assignments'])
+        return Response(result, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request):
+        """Stream every project as CSV (``?format=csv``) or NDJSON (``?format=ndjson``)."""
+        queryset = Project.objects.order_by('slug')
+        return export_response(request, queryset, ProjectValuesSerializer, 'projects')
 
 
 #admin can CRUD COMPANY / DEPARTMENT / PROJECT
 
-class CompanyAdminViewSet(viewsets.ModelViewSet):
+class CompanyAdminViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     permission_classes = [IsAdminUser]
     lookup_field = 'slug'
 
 
-class DepartmentAdminViewSet(viewsets.ModelViewSet):
+class DepartmentAdminViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     permission_classes = [IsAdminUser]
     lookup_field = 'slug'
 
 
-class ProjectAdminViewSet(viewsets.ModelViewSet):
-    queryset = Project.objects.all()
+class ProjectAdminViewSet(SparseFieldsetViewMixin, viewsets.ModelViewSet):
+    queryset = Project.objects.with_related()
     serializer_class = ProjectSerializer
     permission_classes = [IsAdminUser]
     lookup_field = 'slug'
-
-
-class ProjectAdminViewSet(viewsets.ModelViewSet):
-    queryset = Project.objects.all()
-    serializer_class = ProjectSerializer
-    permission_classes = [IsAdminUser]
-    lookup_field = 'slug'   
-
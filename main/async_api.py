@@ -0,0 +1,176 @@
+import base64
+import binascii
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import close_old_connections
+from django.db.models import Q
+from django.http import JsonResponse
+from rest_framework.exceptions import APIException
+from rest_framework.utils.urls import replace_query_param
+from rest_framework_simplejwt.authentication import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+
+from user.authentication import CachedJWTAuthentication
+from .hashers import hashing_pool
+from .middleware import measure
+from .pagination import SlugCursorPagination
+
+
+class AsyncJWTAuthentication(CachedJWTAuthentication):
+    """``CachedJWTAuthentication`` whose cache misses run on the async ORM."""
+
+    async def aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        user = self.cached_user(validated_token)
+        if user is None:
+            try:
+                user = await self.user_model.objects.select_related('employee').aget(
+                    **{api_settings.USER_ID_FIELD: self.user_id(validated_token)})
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed("User not found", code="user_not_found") from e
+            self.remember(validated_token, user)
+        return self.check_user(user, validated_token)
+
+
+def error(detail, status):
+    return JsonResponse(detail if isinstance(detail, dict) else {'detail': detail}, status=status)
+
+
+def async_read_view(view):
+    """
+    Turn an ``async def`` view into an authenticated, read-only API endpoint.
+
+    Only ``GET`` is allowed and a valid JWT access token is required, as with
+    the ``IsAuthenticated`` DRF views. Errors use DRF's ``{"detail": ...}``
+    body so clients can share their error handling between both paths.
+    """
+    authentication = AsyncJWTAuthentication()
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method != 'GET':
+            response = error(f'Method "{request.method}" not allowed.', 405)
+            response['Allow'] = 'GET'
+            return response
+        try:
+            with measure('auth'):
+                result = await authentication.aauthenticate(request)
+        except APIException as exc:
+            return unauthorized(exc.detail, exc.status_code)
+        if result is None:
+            return unauthorized("Authentication credentials were not provided.", 401)
+        request.user, request.auth = result
+        return await view(request, *args, **kwargs)
+
+    def unauthorized(detail, status):
+        response = error(detail, status)
+        response['WWW-Authenticate'] = authentication.authenticate_header(None)
+        return response
+
+    return wrapper
+
+
+def hashing_view(view):
+    """
+    Serve the sync DRF ``view`` on the password hashing pool, as an async view.
+
+    For login and registration, where hashing the password is nearly all the
+    work: a burst of logins then queues on ``hashing_pool()`` instead of
+    taking the threads that run every other sync view. The pool's threads
+    hold their own database connections, closed as Django closes a request's.
+    """
+    def run(request, *args, **kwargs):
+        close_old_connections()
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            close_old_connections()
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        return await sync_to_async(run, thread_sensitive=False, executor=hashing_pool())(request, *args, **kwargs)
+
+    return wrapper
+
+
+async def retrieve(queryset, serializer, **lookup):
+    """Return the row matching ``lookup`` rendered by ``serializer``, or a DRF-style 404."""
+    try:
+        row = await queryset.values(*serializer.lookups()).aget(**lookup)
+    except queryset.model.DoesNotExist:
+        return error(f"No {queryset.model._meta.object_name} matches the given query.", 404)
+    with measure('serialize'):
+        data = serializer.to_representation(row)
+    return JsonResponse(data)
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    return values if isinstance(values, list) else None
+
+
+def keyset_filter(ordering, values):
+    """``WHERE (a, b) > (%s, %s)`` spelled out for the ORM."""
+    condition = Q()
+    for index, field in enumerate(ordering):
+        condition |= Q(**dict(zip(ordering[:index], values)), **{f'{field}__gt': values[index]})
+    return condition
+
+
+async def paginate(request, queryset, ordering, serializer):
+    """
+    Return one keyset-paginated page of ``queryset`` as a response.
+
+    Rows are read with ``values()`` and rendered by ``serializer`` (a
+    ``ValuesSerializer``). Like ``SlugCursorPagination``, the cursor holds the
+    ordering values of the last row, so every page is a single indexed range
+    scan; the body carries ``next`` and ``results``.
+    """
+    page_size = settings.REST_FRAMEWORK['PAGE_SIZE']
+    try:
+        requested = int(request.GET['page_size'])
+    except (KeyError, ValueError):
+        requested = 0
+    if requested > 0:
+        page_size = min(requested, SlugCursorPagination.max_page_size)
+    queryset = queryset.order_by(*ordering).values(*dict.fromkeys([*serializer.lookups(), *ordering]))
+
+    cursor = request.GET.get('cursor')
+    if cursor:
+        values = decode_cursor(cursor)
+        try:
+            if values is None or len(values) != len(ordering):
+                raise ValueError(cursor)
+            queryset = queryset.filter(keyset_filter(ordering, values))
+        except (ValidationError, ValueError, TypeError):
+            return error("Invalid cursor", 404)
+
+    rows = [row async for row in queryset[:page_size + 1]]
+    next_url = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = encode_cursor([rows[-1][field] for field in ordering])
+        next_url = replace_query_param(request.build_absolute_uri(), 'cursor', last)
+    with measure('serialize'):
+        results = [serializer.to_representation(row) for row in rows]
+    return JsonResponse({'next': next_url, 'results': results})
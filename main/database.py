@@ -0,0 +1,72 @@
+"""
+Build ``DATABASES['default']`` from environment variables.
+
+``DB_ENGINE=sqlite`` (the default) keeps the bundled SQLite file but switches
+it to WAL journaling with a busy timeout, so concurrent gunicorn workers wait
+for the write lock instead of failing with "database is locked". Tests get
+their own file, ``DB_TEST_NAME``.
+
+``DB_ENGINE=postgresql`` reads ``DB_NAME``, ``DB_USER``, ``DB_PASSWORD``,
+``DB_HOST`` and ``DB_PORT``. Connections come from psycopg's pool
+(``DB_POOL_MIN_SIZE``, ``DB_POOL_MAX_SIZE``, ``DB_POOL_TIMEOUT``), or are kept
+open for ``DB_CONN_MAX_AGE`` seconds when ``DB_POOL=false``. Django refuses
+to combine the two. Either way, ``CONN_HEALTH_CHECKS`` drops connections
+the server has closed before they are reused.
+"""
+import os
+
+SQLITE_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+)
+
+
+def _flag(value):
+    return str(value).lower() in ('1', 'true', 'yes', 'on')
+
+
+def database_config(base_dir, env=None):
+    env = os.environ if env is None else env
+    engine = env.get('DB_ENGINE', 'sqlite').lower()
+
+    if engine in ('postgres', 'postgresql'):
+        pooled = _flag(env.get('DB_POOL', 'true'))
+        config = {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': env.get('DB_NAME', 'cms'),
+            'USER': env.get('DB_USER', 'cms'),
+            'PASSWORD': env.get('DB_PASSWORD', ''),
+            'HOST': env.get('DB_HOST', 'localhost'),
+            'PORT': env.get('DB_PORT', '5432'),
+            'CONN_HEALTH_CHECKS': True,
+            'CONN_MAX_AGE': 0 if pooled else int(env.get('DB_CONN_MAX_AGE', 60)),
+            'OPTIONS': {},
+        }
+        if pooled:
+            config['OPTIONS']['pool'] = {
+                'min_size': int(env.get('DB_POOL_MIN_SIZE', 2)),
+                'max_size': int(env.get('DB_POOL_MAX_SIZE', 10)),
+                'timeout': float(env.get('DB_POOL_TIMEOUT', 10)),
+            }
+        return config
+
+    if engine == 'sqlite':
+        return {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': env.get('DB_NAME', base_dir / 'db.sqlite3'),
+            'CONN_MAX_AGE': int(env.get('DB_CONN_MAX_AGE', 60)),
+            # A file rather than Django's in-memory default, so tests run with
+            # the same journaling and locking as the server, across threads.
+            'TEST': {'NAME': env.get('DB_TEST_NAME', base_dir / 'test_db.sqlite3')},
+            'CONN_HEALTH_CHECKS': True,
+            'OPTIONS': {
+                'init_command': '; '.join(SQLITE_PRAGMAS),
+                # Seconds a writer waits on a locked database before giving up.
+                'timeout': float(env.get('DB_BUSY_TIMEOUT', 20)),
+                # Take the write lock when the transaction starts, so that two
+                # readers upgrading to writers can't deadlock each other.
+                'transaction_mode': 'IMMEDIATE',
+            },
+        }
+
+    raise ValueError(f"Unsupported DB_ENGINE {engine!r}, expected 'sqlite' or 'postgresql'.")
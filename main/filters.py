@@ -0,0 +1,78 @@
+"""
+Query-string filtering and ordering for list endpoints.
+
+A view names a ``filterset_class``, a ``FilterSet`` whose fields are the
+parameters it accepts, and lists the columns ``?ordering=`` may name in
+``ordering_fields``. Both backends are the REST framework defaults, so views
+without either attribute are left alone. Every filter and every ordering
+column is backed by an index (``tests/test_indexes.py`` checks the plans),
+and values that don't parse are a 400 rather than being ignored.
+"""
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+
+class FilterSet(serializers.Serializer):
+    """
+    A serializer over the query string, one field per filter.
+
+    A field's ``source`` is the ORM lookup its value is applied with
+    (``company__slug``, ``hired_on__gte``); a ``filter_<name>(queryset,
+    value)`` method takes over for predicates one lookup can't express.
+    Fields must not query the database, so filtering adds no queries.
+    """
+
+    def filter_queryset(self, queryset):
+        for field in self._writable_fields:
+            if field.source not in self.validated_data:
+                continue
+            value = self.validated_data[field.source]
+            method = getattr(self, f'filter_{field.field_name}', None)
+            queryset = method(queryset, value) if method else queryset.filter(**{field.source: value})
+        return queryset
+
+
+class FilterSetBackend(BaseFilterBackend):
+    """Filter by the view's ``filterset_class``, if it has one."""
+
+    def filter_queryset(self, request, queryset, view):
+        filterset_class = getattr(view, 'filterset_class', None)
+        if filterset_class is None:
+            return queryset
+        filterset = filterset_class(data=request.query_params)
+        filterset.is_valid(raise_exception=True)
+        return filterset.filter_queryset(queryset)
+
+
+class IndexedOrderingFilter(OrderingFilter):
+    """
+    ``?ordering=`` over the view's ``ordering_fields`` and nothing else.
+
+    Unlike ``OrderingFilter`` there is no fallback to every serializer field:
+    a view without ``ordering_fields`` can't be reordered, and unknown names
+    are rejected. Without the parameter this returns no ordering, so the
+    cursor paginator keeps its own; with it, the paginator's ordering follows
+    as a tiebreaker in the direction of the first column, so one index range
+    scan still serves each page.
+    """
+
+    def get_valid_fields(self, queryset, view, context={}):
+        return [(field, field) for field in getattr(view, 'ordering_fields', ())]
+
+    def remove_invalid_fields(self, queryset, fields, view, request):
+        valid = [name for name, _ in self.get_valid_fields(queryset, view, {'request': request})]
+        invalid = [term for term in fields if term.lstrip('-') not in valid]
+        if invalid:
+            message = f"Order by one of: {', '.join(valid)}." if valid else "This list has a fixed order."
+            raise serializers.ValidationError({self.ordering_param: [message]})
+        return fields
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        tiebreak = getattr(view.pagination_class, 'ordering', None) or ()
+        tiebreak = [tiebreak] if isinstance(tiebreak, str) else tiebreak
+        prefix = '-' if ordering[0].startswith('-') else ''
+        chosen = {term.lstrip('-') for term in ordering}
+        return [*ordering, *(prefix + field.lstrip('-') for field in tiebreak if field.lstrip('-') not in chosen)]
@@ -0,0 +1,63 @@
+"""
+Password hashers whose cost parameters are read from settings.
+
+``PASSWORD_HASHER`` picks the hasher for new passwords: scrypt (the default,
+from the standard library), argon2 (needs the ``argon2-cffi`` package) or
+Django's PBKDF2. The parameters are read on every use, so after a change of
+hasher or parameters Django's ``check_password`` saves a fresh hash the next
+time each user logs in; older hashes keep verifying until then.
+
+Login and registration spend nearly all their time in these hashers. The
+async endpoints run them on ``hashing_pool()``, ``PASSWORD_HASH_WORKERS``
+threads of their own: hashlib releases the GIL while hashing, so the pool
+uses that many cores without holding up the event loop or the threads that
+serve the other sync views.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    # hashlib refuses to use more than 32 MiB unless told otherwise, which a
+    # work factor above 2**14 needs. This is only a ceiling, not an allocation.
+    maxmem = 1 << 30
+
+    @property
+    def work_factor(self):
+        return settings.PASSWORD_SCRYPT_WORK_FACTOR
+
+    @property
+    def block_size(self):
+        return settings.PASSWORD_SCRYPT_BLOCK_SIZE
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_SCRYPT_PARALLELISM
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    @property
+    def time_cost(self):
+        return settings.PASSWORD_ARGON2_TIME_COST
+
+    @property
+    def memory_cost(self):
+        return settings.PASSWORD_ARGON2_MEMORY_COST
+
+    @property
+    def parallelism(self):
+        return settings.PASSWORD_ARGON2_PARALLELISM
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
+
+
+@cache
+def hashing_pool():
+    return ThreadPoolExecutor(settings.PASSWORD_HASH_WORKERS, thread_name_prefix='password-hash')
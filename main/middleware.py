@@ -0,0 +1,206 @@
+import json
+import logging
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import connections
+from rest_framework.serializers import BaseSerializer
+from rest_framework.views import APIView
+
+logger = logging.getLogger('main.metrics')
+
+# The metrics of the request being served; sync_to_async threads inherit it.
+current_metrics = ContextVar('current_metrics', default=None)
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.render_started = None
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.statements = Counter()
+        self.phases = {'auth': 0.0, 'serialize': 0.0}
+        self.measuring = False
+
+    def record_query(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_seconds += time.perf_counter() - started
+            self.queries += 1
+            self.statements[sql] += 1
+
+    @contextmanager
+    def measure(self, phase):
+        """Add the time spent in the block, less its SQL, to ``phase``; nested blocks count once."""
+        if self.measuring:
+            yield
+            return
+        self.measuring = True
+        started, db_seconds = time.perf_counter(), self.db_seconds
+        try:
+            yield
+        finally:
+            self.measuring = False
+            self.phases[phase] += time.perf_counter() - started - (self.db_seconds - db_seconds)
+
+    def timings(self):
+        """Return the per-phase durations in milliseconds."""
+        finished = time.perf_counter()
+        view_started = self.view_started or self.started
+        render_started = self.render_started or finished
+        db = self.db_seconds * 1000
+        auth, serialize = self.phases['auth'] * 1000, self.phases['serialize'] * 1000
+        return {
+            'db': db,
+            # Authentication and serialization, without their SQL.
+            'auth': auth,
+            'serialize': serialize,
+            # The rest of the view that isn't SQL: permission checks, filtering
+            # and queryset building.
+            'app': max((render_started - view_started) * 1000 - db - auth - serialize, 0.0),
+            'render': (finished - render_started) * 1000,
+            'total': (finished - self.started) * 1000,
+        }
+
+
+def measure(phase):
+    """Count the enclosed block as ``phase`` of the current request, if it is being measured."""
+    metrics = current_metrics.get()
+    return metrics.measure(phase) if metrics is not None else nullcontext()
+
+
+def measured(phase, function):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        with measure(phase):
+            return function(*args, **kwargs)
+    wrapper.measured = True
+    return wrapper
+
+
+def instrument_rest_framework():
+    """Time every DRF view's authentication and every serializer's ``data`` as phases of their own."""
+    if getattr(APIView.perform_authentication, 'measured', False):
+        return
+    APIView.perform_authentication = measured('auth', APIView.perform_authentication)
+    BaseSerializer.data = property(measured('serialize', BaseSerializer.data.fget))
+
+
+class RequestMetricsMiddleware:
+    """
+    Measure SQL, authentication, serialization, view and rendering time for every request.
+
+    DRF's ``perform_authentication`` and serializers' ``data`` are timed as
+    the ``auth`` and ``serialize`` phases (see ``instrument_rest_framework``);
+    other code can add to them with ``measure()``. The figures are sent back
+    as a ``Server-Timing`` header and logged as one JSON line on the
+    ``main.metrics`` logger. When a request runs more than
+    ``REQUEST_METRICS_QUERY_THRESHOLD`` queries or takes longer than
+    ``REQUEST_METRICS_SLOW_MS``, the statements it executed more than once are
+    logged as a warning, which is usually enough to spot an N+1.
+
+    Keep it last in ``MIDDLEWARE`` so that the render phase (which Django
+    runs after ``process_template_response``) is measured on its own.
+
+    The middleware works in both handler modes, so under ASGI it doesn't
+    force async views onto a thread. There the ORM runs its queries in the
+    request's ``sync_to_async`` thread, whose connections are the ones wrapped.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        instrument_rest_framework()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+            # Django adapts sync hooks with a thread hop each; async ones run as is.
+            self.process_view = self.aprocess_view
+            self.process_template_response = self.aprocess_template_response
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        metrics = request.metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        try:
+            with ExitStack() as stack:
+                self.wrap_connections(stack, metrics)
+                response = self.get_response(request)
+        finally:
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = request.metrics = RequestMetrics()
+        token = current_metrics.set(metrics)
+        stack = ExitStack()
+        await sync_to_async(self.wrap_connections)(stack, metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(stack.close)()
+            current_metrics.reset(token)
+        return self.finish(request, response, metrics)
+
+    def wrap_connections(self, stack, metrics):
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(metrics.record_query))
+
+    def finish(self, request, response, metrics):
+        timings = metrics.timings()
+        response['Server-Timing'] = ', '.join([
+            f'db;dur={timings["db"]:.1f};desc="{metrics.queries} queries"',
+            f'auth;dur={timings["auth"]:.1f}',
+            f'serialize;dur={timings["serialize"]:.1f}',
+            f'app;dur={timings["app"]:.1f}',
+            f'render;dur={timings["render"]:.1f}',
+            f'total;dur={timings["total"]:.1f}',
+        ])
+        self.log(request, response, metrics, timings)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.metrics.view_started = time.perf_counter()
+
+    def process_template_response(self, request, response):
+        request.metrics.render_started = time.perf_counter()
+        return response
+
+    async def aprocess_view(self, request, view_func, view_args, view_kwargs):
+        request.metrics.view_started = time.perf_counter()
+
+    async def aprocess_template_response(self, request, response):
+        request.metrics.render_started = time.perf_counter()
+        return response
+
+    def log(self, request, response, metrics, timings):
+        match = request.resolver_match
+        record = {
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match else None,
+            'status': response.status_code,
+            'queries': metrics.queries,
+            **{f'{phase}_ms': round(duration, 1) for phase, duration in timings.items()},
+        }
+        logger.info(json.dumps(record), extra={'metrics': record})
+
+        if (metrics.queries > settings.REQUEST_METRICS_QUERY_THRESHOLD
+                or timings['total'] > settings.REQUEST_METRICS_SLOW_MS):
+            duplicates = [
+                {'count': count, 'sql': sql}
+                for sql, count in metrics.statements.most_common(10) if count > 1
+            ]
+            if duplicates:
+                logger.warning(json.dumps({**record, 'duplicates': duplicates}),
+                               extra={'metrics': record, 'duplicates': duplicates})
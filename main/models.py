@@ -0,0 +1,32 @@
+from django.db.models import DEFERRED
+
+
+class LoadedValuesMixin:
+    """
+    Remember the column values a model instance was loaded with.
+
+    ``instance.loaded_value('company_id')`` returns what the row held before
+    any in-memory change, so signal handlers can tell when a foreign key moved.
+    It returns ``default`` for instances that weren't loaded from the database.
+    After a save the saved values count as loaded, so ``post_save`` handlers
+    see the previous row and a second save doesn't report the same move twice.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values) if value is not DEFERRED
+        }
+        return instance
+
+    def loaded_value(self, attname, default=None):
+        return getattr(self, '_loaded_values', {}).get(attname, default)
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        deferred = self.get_deferred_fields()
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields if field.attname not in deferred
+        }
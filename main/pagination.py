@@ -0,0 +1,18 @@
+from rest_framework.pagination import CursorPagination
+
+
+class SlugCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the unique (and therefore indexed) ``slug`` column.
+
+    The cursor encodes the last slug seen, so every page is a
+    ``WHERE slug > %s ORDER BY slug LIMIT n`` no matter how deep it is.
+    """
+    ordering = 'slug'
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+
+class CreatedAtCursorPagination(SlugCursorPagination):
+    """Keyset pagination for rows without a slug, backed by a ``(created_at, id)`` index."""
+    ordering = ('created_at', 'id')
@@ -0,0 +1,29 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` output, byte for byte, written by orjson.
+
+    DRF's compact UTF-8 defaults are what orjson writes too; datetimes,
+    decimals and anything else orjson would format its own way are handed to
+    DRF's encoder. Requests for indented output, or settings that change the
+    defaults, fall back to ``JSONRenderer``. Floats are the exception: orjson
+    may spell their exponents differently, so views that render them should
+    keep ``JSONRenderer``.
+    """
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            content = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:  # e.g. an integer beyond 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+        # Escaped by JSONRenderer so the output is also valid JavaScript.
+        return content.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
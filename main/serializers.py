@@ -0,0 +1,132 @@
+import datetime
+import uuid
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Prefetch
+from rest_framework.permissions import SAFE_METHODS
+
+
+def to_representation(value):
+    """Format a raw column value the way DRF's model serializer fields do."""
+    if isinstance(value, datetime.datetime):
+        value = value.isoformat()
+        return value[:-6] + 'Z' if value.endswith('+00:00') else value
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    return value
+
+
+class ValuesSerializer:
+    """
+    Render rows fetched with ``QuerySet.values()`` in the shape of a DRF serializer.
+
+    ``fields`` maps each output key to the ``values()`` lookup it is read from,
+    in the order the matching ``ModelSerializer`` emits them. No model
+    instances or serializer fields are built, so this is cheap enough to run
+    inside async views without a thread hop. Override ``to_representation``
+    for computed keys and list them in ``computed_fields``; ``load_related``
+    can fetch what they need once per batch of rows.
+    """
+    fields = {}
+    computed_fields = ()
+
+    @classmethod
+    def lookups(cls):
+        return list(dict.fromkeys(cls.fields.values()))
+
+    @classmethod
+    def output_fields(cls):
+        return [*cls.fields, *cls.computed_fields]
+
+    def load_related(self, rows):
+        pass
+
+    def to_representation(self, row):
+        return {name: to_representation(row[lookup]) for name, lookup in self.fields.items()}
+
+
+def requested_fieldset(request):
+    """
+    Parse ``?fields=`` and ``?expand=`` into two sets of names.
+
+    Either is ``None`` when its parameter is absent, meaning every field and
+    every expansion, which is what the API returned before these parameters
+    existed. Only reads honour them, so a write never loses input fields.
+    """
+    if request is None or request.method not in SAFE_METHODS:
+        return None, None
+
+    def names(param):
+        value = request.query_params.get(param)
+        return None if value is None else {name.strip() for name in value.split(',') if name.strip()}
+
+    return names('fields'), names('expand')
+
+
+class SparseFieldsetMixin:
+    """
+    ``?fields=`` and ``?expand=`` support for model serializers.
+
+    ``fields`` keeps only the listed keys. ``expandable_fields`` maps a
+    relation to the attribute shown when it is expanded (``{'company':
+    'name'}``). Without expansion the relation keeps its plain slug or id.
+    ``field_sources`` lists the model fields that computed keys read.
+
+    ``narrow_queryset`` loads only the columns the output needs, joins only
+    the relations it reads and prefetches only the many-to-many relations it
+    returns. Views apply it through ``main.views.SparseFieldsetViewMixin``.
+    """
+    expandable_fields = {}
+    field_sources = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fields, self.expanded = requested_fieldset(self.context.get('request'))
+        if fields is not None:
+            for name in set(self.fields) - fields:
+                self.fields.pop(name)
+
+    def is_expanded(self, name):
+        return name in self.expandable_fields and (self.expanded is None or name in self.expanded)
+
+    def to_representation(self, instance):
+        representation = super().to_representation(instance)
+        for name, attribute in self.expandable_fields.items():
+            if name in representation and self.is_expanded(name):
+                related = getattr(instance, name)
+                if hasattr(related, 'all'):
+                    representation[name] = [getattr(item, attribute) for item in related.all()]
+                else:
+                    representation[name] = getattr(related, attribute) if related is not None else None
+        return representation
+
+    def narrow_queryset(self, queryset, required=()):
+        """Restrict ``queryset`` to what this serializer's output reads, plus the ``required`` fields."""
+        opts = queryset.model._meta
+        only, select, prefetch = {opts.pk.name, *required}, [], []
+        for name, serializer_field in self.fields.items():
+            for source in self.field_sources.get(name, (serializer_field.source,)):
+                try:
+                    field = opts.get_field(source)
+                except FieldDoesNotExist:
+                    continue  # an annotation or a computed value
+                expanded = self.is_expanded(name)
+                if field.many_to_many:
+                    attribute = self.expandable_fields[name] if expanded else 'pk'
+                    related = field.related_model.objects.only(attribute).order_by('pk')
+                    prefetch.append(Prefetch(source, queryset=related))
+                elif field.many_to_one or field.one_to_one:
+                    only.add(source)
+                    # The plain value is rendered before an expansion replaces it.
+                    attributes = {getattr(serializer_field, 'slug_field', None),
+                                  self.expandable_fields[name] if expanded else None} - {None}
+                    if attributes:
+                        select.append(source)
+                        only.update(f'{source}__{attribute}' for attribute in attributes)
+                elif field.concrete:
+                    only.add(source)
+        queryset = queryset.select_related(None).prefetch_related(None).prefetch_related(*prefetch).only(*only)
+        # A bare select_related() would follow every foreign key.
+        return queryset.select_related(*select) if select else queryset
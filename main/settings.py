@@ -10,9 +10,12 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from datetime import timedelta
 from pathlib import Path
 
+from main.database import database_config
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
@@ -63,6 +66,11 @@ LOGGING = {
             'level': 'INFO',
             'propagate': True,
         },
+        'main.metrics': {
+            'handlers': ['console', 'file', 'error_file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
 
     },
 }
@@ -80,6 +88,7 @@ INSTALLED_APPS = [
     'user',
     'company',
     'performance_review',
+    'search',
     'rest_framework_simplejwt',
     'drf_spectacular',
 ]
@@ -88,8 +97,14 @@ AUTH_USER_MODEL = 'user.User'
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+        'user.authentication.CachedJWTAuthentication',
+    ),
+    'DEFAULT_FILTER_BACKENDS': (
+        'main.filters.FilterSetBackend',
+        'main.filters.IndexedOrderingFilter',
+    ),
+    'DEFAULT_PAGINATION_CLASS': 'main.pagination.SlugCursorPagination',
+    'PAGE_SIZE': 50,
 }
 
 SIMPLE_JWT = {
@@ -102,6 +117,64 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# Response cache for the company/department read endpoints (company/cache.py).
+# API_CACHE_BACKEND is one of locmem, file or redis; the redis backend needs
+# the `redis` package installed. The cache holds the versions that invalidate
+# entries, so all workers must share it: locmem is per process and is the
+# default only for a single worker, while several (WEB_CONCURRENCY, as gunicorn
+# reads it) default to file, which the workers of one host share. Use redis
+# across hosts.
+API_CACHE_BACKENDS = {
+    'locmem': ('django.core.cache.backends.locmem.LocMemCache', 'api'),
+    'file': ('django.core.cache.backends.filebased.FileBasedCache', '/var/tmp/cms-api-cache'),
+    'redis': ('django.core.cache.backends.redis.RedisCache', 'redis://127.0.0.1:6379/1'),
+}
+API_CACHE_BACKEND, API_CACHE_DEFAULT_LOCATION = API_CACHE_BACKENDS[os.environ.get(
+    'API_CACHE_BACKEND', 'file' if int(os.environ.get('WEB_CONCURRENCY', 1)) > 1 else 'locmem')]
+API_CACHE_ALIAS = 'api'
+API_CACHE_TIMEOUT = int(os.environ.get('API_CACHE_TIMEOUT', 3600))
+# Seconds the review pipeline summary may be served stale; 0 disables caching.
+REVIEW_SUMMARY_CACHE_TIMEOUT = int(os.environ.get('REVIEW_SUMMARY_CACHE_TIMEOUT', 30))
+
+AUTH_USER_CACHE_ALIAS = 'auth'
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    API_CACHE_ALIAS: {
+        'BACKEND': API_CACHE_BACKEND,
+        'LOCATION': os.environ.get('API_CACHE_LOCATION', API_CACHE_DEFAULT_LOCATION),
+    },
+    # Authenticated users, per process (user/authentication.py). A save drops
+    # the entry in its own process; other processes see it after the timeout.
+    AUTH_USER_CACHE_ALIAS: {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'auth-users',
+        'TIMEOUT': int(os.environ.get('AUTH_USER_CACHE_TIMEOUT', 60)),
+        'OPTIONS': {'MAX_ENTRIES': int(os.environ.get('AUTH_USER_CACHE_SIZE', 10000))},
+    },
+}
+
+# Bulk employee uploads through /api/employees/import/
+EMPLOYEE_IMPORT_BATCH_SIZE = 1000
+EMPLOYEE_IMPORT_WORKERS = int(os.environ.get('EMPLOYEE_IMPORT_WORKERS', 0))
+
+# Matches ranked per /api/search/ query whose every word is a prefix of at
+# most SEARCH_CAPPED_PREFIX_LENGTH characters (search/models.py); later ones
+# are never returned, which keeps such queries fast. Others rank every match.
+SEARCH_MAX_MATCHES = int(os.environ.get('SEARCH_MAX_MATCHES', 500))
+SEARCH_CAPPED_PREFIX_LENGTH = int(os.environ.get('SEARCH_CAPPED_PREFIX_LENGTH', 2))
+
+# Serve plain list requests for employees, projects and reviews from
+# values() rows rendered by orjson (main.views.ValuesListViewMixin); 0 turns
+# this off and every list goes through the model serializers.
+FAST_LIST_RESPONSES = bool(int(os.environ.get('FAST_LIST_RESPONSES', 1)))
+
+# Rows fetched per round trip, and sent per streamed chunk, by the
+# /export/ endpoints (main/exports.py).
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 2000))
+
 SPECTACULAR_SETTINGS = {
     "TITLE": "CMS Backend",
     "DESCRIPTION": "Company Management System API",
@@ -117,8 +190,13 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'main.middleware.RequestMetricsMiddleware',
 ]
 
+# Requests above either threshold get their repeated SQL statements logged.
+REQUEST_METRICS_QUERY_THRESHOLD = int(os.environ.get('REQUEST_METRICS_QUERY_THRESHOLD', 30))
+REQUEST_METRICS_SLOW_MS = int(os.environ.get('REQUEST_METRICS_SLOW_MS', 500))
+
 ROOT_URLCONF = 'main.urls'
 
 TEMPLATES = [
@@ -139,14 +217,37 @@ TEMPLATES = [
 WSGI_APPLICATION = 'main.wsgi.application'
 
 
+# Configured from DB_* environment variables; see main/database.py.
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_config(BASE_DIR),
 }
 
 
+# Password hashing (main/hashers.py). PASSWORD_HASHER is one of scrypt
+# (default), argon2 or pbkdf2; the argon2 hasher needs the `argon2-cffi`
+# package installed. Hashes made by the others, or with other parameters,
+# still verify and are replaced on the user's next login.
+PASSWORD_HASHER_CLASSES = {
+    'scrypt': 'main.hashers.ScryptPasswordHasher',
+    'argon2': 'main.hashers.Argon2PasswordHasher',
+    'pbkdf2': 'main.hashers.PBKDF2PasswordHasher',
+}
+PASSWORD_HASHER = os.environ.get('PASSWORD_HASHER', 'scrypt')
+PASSWORD_HASHERS = [
+    PASSWORD_HASHER_CLASSES[PASSWORD_HASHER],
+    *(path for name, path in PASSWORD_HASHER_CLASSES.items() if name != PASSWORD_HASHER),
+]
+# The defaults are Django's, which meet the OWASP minimums.
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.environ.get('PASSWORD_SCRYPT_WORK_FACTOR', 2**14))
+PASSWORD_SCRYPT_BLOCK_SIZE = int(os.environ.get('PASSWORD_SCRYPT_BLOCK_SIZE', 8))
+PASSWORD_SCRYPT_PARALLELISM = int(os.environ.get('PASSWORD_SCRYPT_PARALLELISM', 5))
+PASSWORD_ARGON2_TIME_COST = int(os.environ.get('PASSWORD_ARGON2_TIME_COST', 2))
+PASSWORD_ARGON2_MEMORY_COST = int(os.environ.get('PASSWORD_ARGON2_MEMORY_COST', 102400))  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.environ.get('PASSWORD_ARGON2_PARALLELISM', 8))
+PASSWORD_PBKDF2_ITERATIONS = int(os.environ.get('PASSWORD_PBKDF2_ITERATIONS', 1_000_000))
+# Threads hashing for the async login and register endpoints, per process.
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -6,6 +6,7 @@ urlpatterns = [
     path('api/', include('user.urls')),
     path('api/', include('company.urls')),
     path('api/', include('performance_review.urls')),
+    path('api/', include('search.urls')),
 
 
 ]
@@ -0,0 +1,64 @@
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+
+from .middleware import measure
+from .renderers import ORJSONRenderer
+from .serializers import SparseFieldsetMixin, requested_fieldset
+
+
+class SparseFieldsetViewMixin:
+    """
+    Narrow the queryset of read requests to what ``?fields=`` / ``?expand=`` ask for.
+
+    Works with serializers that use ``SparseFieldsetMixin``. The lookup field
+    and the page ordering (the paginator's, or ``?ordering=``) are always
+    loaded, since the view reads them. Detail views inherit the default
+    paginator without using it, so ordering fields the model lacks are skipped.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.method not in SAFE_METHODS:
+            return queryset
+        serializer = self.get_serializer()
+        if not isinstance(serializer, SparseFieldsetMixin):
+            return queryset
+        ordering = next((
+            backend().get_ordering(self.request, queryset, self)
+            for backend in self.filter_backends if hasattr(backend, 'get_ordering')
+        ), None) or getattr(self.paginator, 'ordering', None) or ()
+        ordering = [field.lstrip('-') for field in ([ordering] if isinstance(ordering, str) else ordering)]
+        fields = {field.name for field in queryset.model._meta.concrete_fields} | {'pk'}
+        required = [name for name in [self.lookup_field, *ordering] if name in fields]
+        return serializer.narrow_queryset(queryset, required)
+
+
+class ValuesListViewMixin:
+    """
+    Serve plain JSON list requests from ``values()`` rows.
+
+    With ``FAST_LIST_RESPONSES`` on, a list request without ``?fields=`` or
+    ``?expand=`` reads its page with ``values()`` and renders it with
+    ``values_serializer_class`` (a ``ValuesSerializer``), so no model
+    instances or serializer fields are built per row, and orjson writes the
+    body. Filters, ordering and cursor pagination are the view's own, and the
+    body is the same, byte for byte, as the serializer's.
+    """
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    values_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if not (settings.FAST_LIST_RESPONSES and isinstance(request.accepted_renderer, JSONRenderer)
+                and requested_fieldset(request) == (None, None)):
+            return super().list(request, *args, **kwargs)
+        serializer = self.values_serializer_class()
+        queryset = self.filter_queryset(self.get_queryset())
+        ordering = [field.lstrip('-') for field in self.paginator.get_ordering(request, queryset, self)]
+        rows = self.paginate_queryset(
+            queryset.prefetch_related(None).values(*dict.fromkeys([*serializer.lookups(), *ordering]))
+        )
+        with measure('serialize'):
+            serializer.load_related(rows)
+            data = [serializer.to_representation(row) for row in rows]
+        return self.get_paginated_response(data)
@@ -1,8 +1,21 @@
 from django.contrib import admin
-from .models import PerformanceReview
+from .models import PerformanceReview, ReviewTransition
+
+
+class ReviewTransitionInline(admin.TabularInline):
+    model = ReviewTransition
+    fields = ['created_at', 'from_stage', 'stage', 'reviewed_by', 'approved_by']
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
 
 @admin.register(PerformanceReview)
 class PerformanceReviewAdmin(admin.ModelAdmin):
     list_display = ['employee', 'stage', 'scheduled_date', 'reviewed_by', 'approved_by']
     list_filter = ['stage', 'scheduled_date']
-    readonly_fields = ['created_at', 'updated_at']
\ No newline at end of file
+    readonly_fields = ['created_at', 'updated_at']
+    inlines = [ReviewTransitionInline]
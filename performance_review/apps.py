@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class PerformanceReviewConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'performance_review'
+
+    def ready(self):
+        import performance_review.signals
@@ -0,0 +1,17 @@
+from main.async_api import async_read_view, paginate, retrieve
+from .models import PerformanceReview
+from .serializers import PerformanceReviewCreateValuesSerializer, PerformanceReviewValuesSerializer
+
+
+@async_read_view
+async def review_list(request):
+    queryset = PerformanceReview.objects.all()
+    employee_slug = request.GET.get('employee_slug')
+    if employee_slug:
+        queryset = queryset.filter(employee__slug=employee_slug)
+    return await paginate(request, queryset, ('created_at', 'id'), PerformanceReviewCreateValuesSerializer())
+
+
+@async_read_view
+async def review_detail(request, pk):
+    return await retrieve(PerformanceReview.objects.all(), PerformanceReviewValuesSerializer(), pk=pk)
@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from main.filters import FilterSet
+from .models import PerformanceReview
+
+
+class PerformanceReviewFilter(FilterSet):
+    """Reviews of one employee, or in a stage, or scheduled in ``scheduled_from``..``scheduled_to``."""
+    employee_slug = serializers.SlugField(source='employee__slug', required=False)
+    stage = serializers.ChoiceField(choices=PerformanceReview.REVIEW_STAGES, required=False)
+    scheduled_from = serializers.DateTimeField(source='scheduled_date__gte', required=False)
+    scheduled_to = serializers.DateTimeField(source='scheduled_date__lte', required=False)
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 10:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('performance_review', '0003_alter_performancereview_approved_by_and_more'),
+        ('user', '0008_alter_employee_company_alter_employee_department'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='performancereview',
+            index=models.Index(fields=['created_at', 'id'], name='review_created_id_idx'),
+        ),
+    ]
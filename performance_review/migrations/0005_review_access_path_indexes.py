@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-18 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('performance_review', '0004_performancereview_created_id_idx'),
+        ('user', '0009_employee_company_dept_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='performancereview',
+            index=models.Index(fields=['employee', 'created_at'], name='review_employee_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='performancereview',
+            index=models.Index(fields=['stage', 'scheduled_date'], name='review_stage_scheduled_idx'),
+        ),
+    ]
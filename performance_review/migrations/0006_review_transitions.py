@@ -0,0 +1,42 @@
+# Generated by Django 5.2.5 on 2026-10-18 11:07
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('performance_review', '0005_review_access_path_indexes'),
+        ('user', '0009_employee_company_dept_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReviewTransition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_stage', models.CharField(blank=True, choices=[('pending_review', 'Pending Review'), ('review_scheduled', 'Review Scheduled'), ('feedback_provided', 'Feedback Provided'), ('under_approval', 'Under Approval'), ('review_approved', 'Review Approved'), ('review_rejected', 'Review Rejected')], max_length=20, null=True)),
+                ('stage', models.CharField(choices=[('pending_review', 'Pending Review'), ('review_scheduled', 'Review Scheduled'), ('feedback_provided', 'Feedback Provided'), ('under_approval', 'Under Approval'), ('review_approved', 'Review Approved'), ('review_rejected', 'Review Rejected')], max_length=20)),
+                ('scheduled_date', models.DateTimeField(blank=True, null=True)),
+                ('feedback', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('approved_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='user.employee')),
+                ('review', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='transitions', to='performance_review.performancereview')),
+                ('reviewed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='user.employee')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['review', 'created_at'], name='transition_review_created_idx'), models.Index(fields=['stage', 'created_at'], name='transition_stage_created_idx')],
+            },
+        ),
+        # Existing reviews get one event for the stage they are in, entered at
+        # their last update; their earlier history was never recorded.
+        migrations.RunSQL(
+            """
+            INSERT INTO performance_review_reviewtransition (review_id, stage, created_at)
+            SELECT id, stage, updated_at FROM performance_review_performancereview
+            """,
+            migrations.RunSQL.noop,
+        ),
+    ]
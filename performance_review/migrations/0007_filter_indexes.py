@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('performance_review', '0006_review_transitions'),
+        ('user', '0010_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='performancereview',
+            index=models.Index(fields=['scheduled_date'], name='review_scheduled_idx'),
+        ),
+    ]
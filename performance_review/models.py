@@ -1,8 +1,110 @@
-from django.db import models
+from itertools import islice
+
+from django.db import connection, models, transaction
+from django.db.models import Count, Q
+from django.utils import timezone
 from user.models import Employee
 import uuid
 from django.core.exceptions import ValidationError
 
+
+class TransitionConflict(Exception):
+    """The review left the stage a transition was checked against before it was written."""
+
+
+class PerformanceReviewQuerySet(models.QuerySet):
+    def bulk_transition(self, ids, new_stage, batch_size=1000, **kwargs):
+        """
+        Move many reviews to ``new_stage`` without loading them as instances.
+
+        The current stages are read, and the rows locked where the database
+        supports it, in one query per batch and checked against
+        ``PerformanceReview.TRANSITIONS`` in memory. The valid rows are then
+        moved with one ``UPDATE ... WHERE id IN (...) AND stage = %s`` per
+        source stage. If that misses rows whose stage changed in the meantime,
+        it is rolled back and each row is moved by its own conditional UPDATE,
+        so only rows this call moved are reported as transitioned and get a
+        history event; the rest are conflicts. Returns ``{id: (status, from_stage)}``
+        where status is ``transitioned``, ``invalid``, ``conflict`` or
+        ``not_found``.
+        """
+        values = self.model.transition_values(new_stage, **kwargs)
+        values['updated_at'] = timezone.now()
+        results = {}
+        ids = iter(dict.fromkeys(ids))
+        while batch := list(islice(ids, batch_size)):
+            by_stage = {}
+            with transaction.atomic():
+                for pk, stage in self.filter(pk__in=batch).select_for_update().values_list('pk', 'stage'):
+                    if new_stage in self.model.TRANSITIONS.get(stage, ()):
+                        by_stage.setdefault(stage, []).append(pk)
+                    else:
+                        results[pk] = ('invalid', stage)
+                for stage, pks in by_stage.items():
+                    moved = self._move(pks, stage, values)
+                    for pk in pks:
+                        results[pk] = ('transitioned' if pk in moved else 'conflict', stage)
+                    ReviewTransition.objects.bulk_create(
+                        ReviewTransition.record(pk, stage, values) for pk in pks if pk in moved)
+            for pk in batch:
+                results.setdefault(pk, ('not_found', None))
+        return results
+
+    def _move(self, pks, stage, values):
+        """Write ``values`` to the ``pks`` still in ``stage``; return the set this call moved."""
+        savepoint = transaction.savepoint()
+        if self.filter(pk__in=pks, stage=stage).update(**values) == len(pks):
+            transaction.savepoint_commit(savepoint)
+            return set(pks)
+        # Another request moved some of them: a row is ours only if its own UPDATE matched.
+        transaction.savepoint_rollback(savepoint)
+        return {pk for pk in pks if self.filter(pk=pk, stage=stage).update(**values)}
+
+    def summary(self, now=None):
+        """
+        Review counts by stage for every company and department, plus overdue ones.
+
+        A review is overdue when it is still ``review_scheduled`` and its
+        ``scheduled_date`` has passed. Everything comes from one grouped query
+        with a filtered ``COUNT`` per stage; the company and overall totals
+        are summed from its rows.
+        """
+        now = now or timezone.now()
+        stages = [stage for stage, _ in self.model.REVIEW_STAGES]
+        rows = (
+            self.order_by()
+            .values('employee__company__slug', 'employee__company__name',
+                    'employee__department__slug', 'employee__department__name')
+            .annotate(
+                total=Count('pk'),
+                overdue=Count('pk', filter=Q(stage='review_scheduled', scheduled_date__lt=now)),
+                **{stage: Count('pk', filter=Q(stage=stage)) for stage in stages},
+            )
+            .order_by('employee__company__slug', 'employee__department__slug')
+        )
+
+        def bucket(**identity):
+            return {**identity, 'total': 0, 'overdue': 0, 'by_stage': dict.fromkeys(stages, 0)}
+
+        def add(target, row):
+            target['total'] += row['total']
+            target['overdue'] += row['overdue']
+            for stage in stages:
+                target['by_stage'][stage] += row[stage]
+
+        totals, companies = bucket(), {}
+        for row in rows:
+            slug = row['employee__company__slug']
+            company = companies.get(slug)
+            if company is None:
+                company = companies[slug] = bucket(company=slug, name=row['employee__company__name'], departments=[])
+            department = bucket(department=row['employee__department__slug'], name=row['employee__department__name'])
+            for target in (totals, company, department):
+                add(target, row)
+            company['departments'].append(department)
+        return {'generated_at': now, **totals, 'companies': list(companies.values())}
+
+
 class PerformanceReview(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     REVIEW_STAGES = (
@@ -24,37 +126,178 @@ class PerformanceReview(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    TRANSITIONS = {
+        'pending_review': ['review_scheduled'],
+        'review_scheduled': ['feedback_provided'],
+        'feedback_provided': ['under_approval'],
+        'under_approval': ['review_approved', 'review_rejected'],
+        'review_rejected': ['feedback_provided'],
+        'review_approved': []
+    }
+
+    objects = PerformanceReviewQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='review_created_id_idx'),
+            models.Index(fields=['employee', 'created_at'], name='review_employee_created_idx'),
+            models.Index(fields=['stage', 'scheduled_date'], name='review_stage_scheduled_idx'),
+            models.Index(fields=['scheduled_date'], name='review_scheduled_idx'),
+        ]
+
     def __str__(self):
         return f"Performance Review - {self.employee.user} - {self.stage}"
 
     def can_transition_to(self, new_stage):
-        transitions = {
-            'pending_review': ['review_scheduled'],
-            'review_scheduled': ['feedback_provided'],
-            'feedback_provided': ['under_approval'],
-            'under_approval': ['review_approved', 'review_rejected'],
-            'review_rejected': ['feedback_provided'],
-            'review_approved': []
-        }
-        return new_stage in transitions.get(self.stage, [])
+        return new_stage in self.TRANSITIONS.get(self.stage, [])
+
+    @classmethod
+    def transition_values(cls, new_stage, **kwargs):
+        """The fields a move to ``new_stage`` writes, keyed by field name."""
+        values = {'stage': new_stage}
+
+        if new_stage == 'review_scheduled':
+            values['scheduled_date'] = kwargs.get('scheduled_date')
+
+        if new_stage == 'feedback_provided':
+            values['feedback'] = kwargs.get('feedback')
+            values['reviewed_by'] = kwargs.get('reviewed_by')
+
+        if new_stage in ['review_approved', 'review_rejected']:
+            values['approved_by'] = kwargs.get('approved_by')
+
+        return values
 
     def transition_to(self, new_stage, **kwargs):
+        """
+        Move the review to ``new_stage`` if it is still in the stage it was loaded with.
+
+        The write is a compare-and-swap, ``UPDATE ... WHERE id = %s AND
+        stage = %s``, touching only the fields the transition sets. When
+        another request moved the review first, nothing is written and
+        ``TransitionConflict`` is raised; no row lock is taken.
+        """
         if not self.can_transition_to(new_stage):
             raise ValidationError(
                 f"Invalid transition from {self.stage} to {new_stage}"
             )
 
-        self.stage = new_stage
+        values = self.transition_values(new_stage, **kwargs)
+        values['updated_at'] = timezone.now()
+        with transaction.atomic():
+            updated = type(self)._default_manager.filter(pk=self.pk, stage=self.stage).update(**values)
+            if not updated:
+                raise TransitionConflict(f"Review {self.pk} is no longer in stage {self.stage}")
+            ReviewTransition.record(self.pk, self.stage, values).save()
 
-        if new_stage == 'review_scheduled':
-            self.scheduled_date = kwargs.get('scheduled_date')
+        for field, value in values.items():
+            setattr(self, field, value)
+        return True
 
-        if new_stage == 'feedback_provided':
-            self.feedback = kwargs.get('feedback')
-            self.reviewed_by = kwargs.get('reviewed_by')
 
-        if new_stage in ['review_approved', 'review_rejected']:
-            self.approved_by = kwargs.get('approved_by')
+class ReviewTransitionQuerySet(models.QuerySet):
+    PERCENTILES = (50, 90, 95)
 
-        self.save()
-        return True
+    def dwell_times(self, company_id=None, department_id=None):
+        """
+        Per-stage statistics of how long reviews stayed in each stage, in seconds.
+
+        A review's stay in a stage runs from the event that entered it to the
+        next event of the same review (``LEAD``); stays that haven't ended yet
+        are left out. Percentiles use the nearest-rank method over
+        ``ROW_NUMBER`` and ``COUNT`` windows, so the whole computation runs in
+        one SQL statement on both SQLite and PostgreSQL.
+        """
+        qn = connection.ops.quote_name
+        if connection.vendor == 'postgresql':
+            seconds = 'EXTRACT(EPOCH FROM (left_at - entered_at))'
+        else:
+            seconds = '(julianday(left_at) - julianday(entered_at)) * 86400.0'
+        conditions, params = [], []
+        if company_id is not None:
+            conditions.append(f'employee.{qn("company_id")} = %s')
+            params.append(company_id)
+        if department_id is not None:
+            conditions.append(f'employee.{qn("department_id")} = %s')
+            params.append(department_id)
+        where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+        percentiles = ''.join(
+            f', MAX(CASE WHEN position = ({rank} * total + 99) / 100 THEN seconds END) AS p{rank}'
+            for rank in self.PERCENTILES
+        )
+
+        sql = f"""
+            WITH stays AS (
+                SELECT event.{qn("stage")} AS stage,
+                       event.{qn("created_at")} AS entered_at,
+                       LEAD(event.{qn("created_at")}) OVER (
+                           PARTITION BY event.{qn("review_id")}
+                           ORDER BY event.{qn("created_at")}, event.{qn("id")}
+                       ) AS left_at
+                FROM {qn(ReviewTransition._meta.db_table)} event
+                JOIN {qn(PerformanceReview._meta.db_table)} review ON review.{qn("id")} = event.{qn("review_id")}
+                JOIN {qn(Employee._meta.db_table)} employee ON employee.{qn("id")} = review.{qn("employee_id")}
+                {where}
+            ),
+            ranked AS (
+                SELECT stage,
+                       {seconds} AS seconds,
+                       ROW_NUMBER() OVER (PARTITION BY stage ORDER BY {seconds}) AS position,
+                       COUNT(*) OVER (PARTITION BY stage) AS total
+                FROM stays
+                WHERE left_at IS NOT NULL
+            )
+            SELECT stage, total AS count, AVG(seconds) AS mean, MIN(seconds) AS min, MAX(seconds) AS max{percentiles}
+            FROM ranked
+            GROUP BY stage, total
+            ORDER BY stage
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        # PostgreSQL returns the EXTRACT arithmetic as Decimal.
+        return [
+            {name: value if name in ('stage', 'count') else float(value) for name, value in row.items()}
+            for row in rows
+        ]
+
+
+class ReviewTransition(models.Model):
+    """
+    One stage change of a ``PerformanceReview``, kept for reporting.
+
+    Rows are only ever inserted: creating a review records the stage it starts
+    in (``from_stage`` is null) and every transition records the fields it
+    wrote, which the review itself overwrites on the next transition.
+    """
+    review = models.ForeignKey(PerformanceReview, on_delete=models.CASCADE, related_name='transitions')
+    from_stage = models.CharField(max_length=20, choices=PerformanceReview.REVIEW_STAGES, null=True, blank=True)
+    stage = models.CharField(max_length=20, choices=PerformanceReview.REVIEW_STAGES)
+    scheduled_date = models.DateTimeField(blank=True, null=True)
+    feedback = models.TextField(blank=True, null=True)
+    reviewed_by = models.ForeignKey(Employee, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    approved_by = models.ForeignKey(Employee, on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    created_at = models.DateTimeField(default=timezone.now)
+
+    objects = ReviewTransitionQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['review', 'created_at'], name='transition_review_created_idx'),
+            models.Index(fields=['stage', 'created_at'], name='transition_stage_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.review_id}: {self.from_stage} -> {self.stage}"
+
+    @classmethod
+    def record(cls, review_id, from_stage, values):
+        """An unsaved event for a transition that wrote ``values`` (as built by ``transition_to``)."""
+        fields = {name: value for name, value in values.items() if name != 'updated_at'}
+        return cls(review_id=review_id, from_stage=from_stage, created_at=values['updated_at'], **fields)
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Review transitions are append-only.")
+        super().save(*args, **kwargs)
@@ -2,8 +2,10 @@ from rest_framework import serializers
 from .models import PerformanceReview
 from user.serializers import EmployeeSerializer
 from user.models import Employee
+from company.models import Company, Department
+from main.serializers import SparseFieldsetMixin, ValuesSerializer
 
-class PerformanceReviewSerializer(serializers.ModelSerializer):
+class PerformanceReviewSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     employee = serializers.SlugRelatedField(
         queryset=Employee.objects.all(),
         slug_field='slug'
@@ -15,7 +17,7 @@ class PerformanceReviewSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
     
-class PerformanceReviewCreateSerializer(serializers.ModelSerializer):
+class PerformanceReviewCreateSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     employee = serializers.SlugRelatedField(
         queryset=Employee.objects.all(),
         slug_field='slug'
@@ -38,8 +40,73 @@ class PerformanceReviewCreateSerializer(serializers.ModelSerializer):
         }
 
 
+class PerformanceReviewValuesSerializer(ValuesSerializer):
+    """``PerformanceReviewSerializer`` output for ``PerformanceReview.objects.values()`` rows."""
+    fields = {
+        'id': 'id',
+        'employee': 'employee__slug',
+        'stage': 'stage',
+        'scheduled_date': 'scheduled_date',
+        'feedback': 'feedback',
+        'created_at': 'created_at',
+        'updated_at': 'updated_at',
+        'reviewed_by': 'reviewed_by',
+        'approved_by': 'approved_by',
+    }
+
+
+class PerformanceReviewCreateValuesSerializer(ValuesSerializer):
+    """``PerformanceReviewCreateSerializer`` output, which is also what the list endpoint returns."""
+    fields = {
+        'employee': 'employee__slug',
+        'stage': 'stage',
+        'scheduled_date': 'scheduled_date',
+        'feedback': 'feedback',
+        'reviewed_by': 'reviewed_by',
+        'approved_by': 'approved_by',
+    }
+
+
 class PerformanceReviewTransitionSerializer(serializers.Serializer):
     stage = serializers.ChoiceField(choices=PerformanceReview.REVIEW_STAGES)
     feedback = serializers.CharField(required=False, allow_blank=True, allow_null=True)
     reviewed_by = serializers.PrimaryKeyRelatedField(queryset=Employee.objects.all(), required=False)
     approved_by = serializers.PrimaryKeyRelatedField(queryset=Employee.objects.all(), required=False)
+
+
+class PerformanceReviewBulkTransitionSerializer(PerformanceReviewTransitionSerializer):
+    ids = serializers.ListField(child=serializers.UUIDField(), allow_empty=False, max_length=10000)
+    scheduled_date = serializers.DateTimeField(required=False, allow_null=True)
+
+
+class ReviewDwellTimeQuerySerializer(serializers.Serializer):
+    company = serializers.SlugRelatedField(slug_field='slug', queryset=Company.objects.all(), required=False)
+    department = serializers.SlugRelatedField(slug_field='slug', queryset=Department.objects.all(), required=False)
+
+    def validate(self, attrs):
+        if not attrs:
+            raise serializers.ValidationError("Pass a company or a department slug.")
+        return attrs
+
+
+class ReviewSummaryCountsSerializer(serializers.Serializer):
+    total = serializers.IntegerField()
+    overdue = serializers.IntegerField()
+    by_stage = serializers.DictField(child=serializers.IntegerField())
+
+
+class ReviewSummaryDepartmentSerializer(ReviewSummaryCountsSerializer):
+    department = serializers.CharField(allow_null=True)
+    name = serializers.CharField(allow_null=True)
+
+
+class ReviewSummaryCompanySerializer(ReviewSummaryCountsSerializer):
+    company = serializers.CharField(allow_null=True)
+    name = serializers.CharField(allow_null=True)
+    departments = ReviewSummaryDepartmentSerializer(many=True)
+
+
+class PerformanceReviewSummarySerializer(ReviewSummaryCountsSerializer):
+    """The shape of ``PerformanceReviewQuerySet.summary()``, for the API schema."""
+    generated_at = serializers.DateTimeField()
+    companies = ReviewSummaryCompanySerializer(many=True)
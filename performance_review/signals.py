@@ -0,0 +1,9 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from .models import PerformanceReview, ReviewTransition
+
+
+@receiver(post_save, sender=PerformanceReview)
+def record_initial_stage(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        ReviewTransition.objects.create(review=instance, stage=instance.stage, created_at=instance.created_at)
@@ -1,9 +1,16 @@
 from django.urls import path, include
 from .views import *
+from . import async_views
 
 
 urlpatterns = [
     path('performance-reviews/', PerformanceReviewListCreateView.as_view(), name='performance-review-list-create'),
+    path('performance-reviews/bulk-transition/', PerformanceReviewBulkTransitionView.as_view(), name='performance-review-bulk-transition'),
+    path('performance-reviews/summary/', PerformanceReviewSummaryView.as_view(), name='performance-review-summary'),
+    path('performance-reviews/export/', PerformanceReviewExportView.as_view(), name='performance-review-export'),
+    path('performance-reviews/dwell-times/', PerformanceReviewDwellTimeView.as_view(), name='performance-review-dwell-times'),
     path('performance-reviews/<uuid:pk>/', PerformanceReviewRetrieveUpdateDestroyView.as_view(), name='performance-review-detail'),
     path('performance-reviews/<uuid:pk>/transition/', PerformanceReviewTransitionView.as_view(), name='performance-review-transition'),
+    path('async/performance-reviews/', async_views.review_list, name='async-performance-review-list'),
+    path('async/performance-reviews/<uuid:pk>/', async_views.review_detail, name='async-performance-review-detail'),
 ]
\ No newline at end of file
@@ -1,23 +1,53 @@
 from rest_framework.response import Response
-from .models import PerformanceReview
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
+from company.cache import api_cache
+from .filters import PerformanceReviewFilter
+from .models import PerformanceReview, ReviewTransition, TransitionConflict
 from .serializers import PerformanceReviewSerializer, PerformanceReviewCreateSerializer, PerformanceReviewTransitionSerializer
+from .serializers import PerformanceReviewBulkTransitionSerializer, ReviewDwellTimeQuerySerializer
+from .serializers import PerformanceReviewCreateValuesSerializer, PerformanceReviewValuesSerializer
+from .serializers import PerformanceReviewSummarySerializer
 from rest_framework import generics, permissions, status
 from rest_framework.generics import GenericAPIView
+from main.exports import CSVRenderer, NDJSONRenderer, export_response
+from main.pagination import CreatedAtCursorPagination
+from main.views import SparseFieldsetViewMixin, ValuesListViewMixin
 
 
-class PerformanceReviewListCreateView(generics.ListCreateAPIView):
+class PerformanceReviewListCreateView(ValuesListViewMixin, SparseFieldsetViewMixin, generics.ListCreateAPIView):
     queryset = PerformanceReview.objects.all()
     serializer_class = PerformanceReviewCreateSerializer
+    values_serializer_class = PerformanceReviewCreateValuesSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
+    filterset_class = PerformanceReviewFilter
+    ordering_fields = ['created_at']
 
-    def get_queryset(self):
-        employee_slug = self.request.query_params.get('employee_slug')
-        queryset = PerformanceReview.objects.all()
-        if employee_slug:
-            queryset = queryset.filter(employee__slug=employee_slug)
-        return queryset
 
-class PerformanceReviewRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
+class PerformanceReviewExportView(GenericAPIView):
+    """
+    Stream every review as CSV (``?format=csv``) or NDJSON (``?format=ndjson``).
+
+    Takes the list endpoint's filters and rows are in its ``(created_at, id)``
+    order.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    renderer_classes = [CSVRenderer, NDJSONRenderer]
+    filterset_class = PerformanceReviewFilter
+
+    @extend_schema(
+        parameters=[OpenApiParameter('format', enum=['csv', 'ndjson'], description="Export file format.")],
+        responses={(200, CSVRenderer.media_type): OpenApiTypes.STR, (200, NDJSONRenderer.media_type): OpenApiTypes.STR},
+    )
+    def get(self, request):
+        queryset = self.filter_queryset(PerformanceReview.objects.order_by('created_at', 'id'))
+        return export_response(request, queryset, PerformanceReviewValuesSerializer, 'performance-reviews')
+
+
+class PerformanceReviewRetrieveUpdateDestroyView(SparseFieldsetViewMixin, generics.RetrieveUpdateDestroyAPIView):
     queryset = PerformanceReview.objects.all()
     serializer_class = PerformanceReviewSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -32,8 +62,95 @@ class PerformanceReviewTransitionView(GenericAPIView):
         review = self.get_object()
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        review.transition_to(serializer.validated_data.pop('stage'), **serializer.validated_data)
+        stage = serializer.validated_data.pop('stage')
+        try:
+            review.transition_to(stage, **serializer.validated_data)
+        except ValidationError as exc:
+            return Response({"detail": exc.messages[0]}, status=status.HTTP_400_BAD_REQUEST)
+        except TransitionConflict:
+            return Response(
+                {"detail": "The review was moved to another stage by a concurrent request; reload it and retry."},
+                status=status.HTTP_409_CONFLICT
+            )
         return Response(
-            {"detail": f"Transitioned to {serializer.validated_data.get('stage')} successfully."},
+            {"detail": f"Transitioned to {stage} successfully."},
             status=status.HTTP_200_OK
-        )
\ No newline at end of file
+        )
+
+
+class PerformanceReviewBulkTransitionView(GenericAPIView):
+    """
+    Move many reviews to one stage in a single request.
+
+    Every id gets a result: ``transitioned``, ``invalid`` (the transition
+    table doesn't allow it from the review's current stage), ``conflict``
+    (the stage changed while the request ran) or ``not_found``.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    queryset = PerformanceReview.objects.all()
+    serializer_class = PerformanceReviewBulkTransitionSerializer
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        stage = data.pop('stage')
+        outcomes = self.get_queryset().bulk_transition(data.pop('ids'), stage, **data)
+
+        results = [
+            {'id': str(pk), 'status': outcome, 'from_stage': from_stage}
+            for pk, (outcome, from_stage) in outcomes.items()
+        ]
+        return Response({
+            'stage': stage,
+            'transitioned': sum(result['status'] == 'transitioned' for result in results),
+            'results': results,
+        }, status=status.HTTP_200_OK)
+
+
+class PerformanceReviewDwellTimeView(GenericAPIView):
+    """
+    How long reviews of a company's or department's employees stay in each stage.
+
+    For every stage: the number of finished stays and their mean, min, max
+    and 50th/90th/95th percentile duration in seconds.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ReviewDwellTimeQuerySerializer
+
+    def get(self, request):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        company = serializer.validated_data.get('company')
+        department = serializer.validated_data.get('department')
+        stages = ReviewTransition.objects.dwell_times(
+            company_id=company.pk if company else None,
+            department_id=department.pk if department else None,
+        )
+        return Response({
+            'company': company.slug if company else None,
+            'department': department.slug if department else None,
+            'stages': stages,
+        }, status=status.HTTP_200_OK)
+
+
+class PerformanceReviewSummaryView(GenericAPIView):
+    """
+    Review pipeline counts for dashboards: by stage, per company and department.
+
+    The result is cached for ``REVIEW_SUMMARY_CACHE_TIMEOUT`` seconds, so it
+    can lag behind the latest transitions by that much.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    queryset = PerformanceReview.objects.all()
+    cache_key = 'performance-review:summary'
+
+    @extend_schema(responses=PerformanceReviewSummarySerializer)
+    def get(self, request):
+        timeout = settings.REVIEW_SUMMARY_CACHE_TIMEOUT
+        summary = api_cache().get(self.cache_key) if timeout else None
+        if summary is None:
+            summary = self.get_queryset().summary()
+            if timeout:
+                api_cache().set(self.cache_key, summary, timeout)
+        return Response(summary, status=status.HTTP_200_OK)
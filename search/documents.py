@@ -0,0 +1,69 @@
+"""
+``SearchDocument`` rows for companies, departments, employees and projects.
+
+``INDEXED`` gives, per model, its document kind and the fields holding the
+name and the body text. ``search/signals.py`` indexes single saves and
+deletes; code that writes with ``bulk_create`` calls ``index_instances``
+itself, and ``manage.py reindex`` rebuilds every document from scratch.
+"""
+from itertools import islice
+
+from company.models import Company, Department, Project
+from user.models import Employee
+from .models import SearchDocument
+
+KINDS = SearchDocument.KINDS
+
+INDEXED = {
+    Company: (KINDS.COMPANY, 'name', None),
+    Department: (KINDS.DEPARTMENT, 'name', None),
+    Employee: (KINDS.EMPLOYEE, 'name', 'position'),
+    Project: (KINDS.PROJECT, 'name', 'description'),
+}
+
+BATCH_SIZE = 2000
+
+
+def indexed_fields(model):
+    _, name, body = INDEXED[model]
+    return {'slug', name, body} - {None}
+
+
+def document(kind, pk, slug, name, body=''):
+    return SearchDocument(kind=kind, object_id=pk, slug=slug, name=name, body=body or '')
+
+
+def index_instances(instances):
+    """Write the documents of ``instances``, all of one ``INDEXED`` model, replacing any they have."""
+    instances = list(instances)
+    if not instances:
+        return
+    kind, name, body = INDEXED[type(instances[0])]
+    SearchDocument.objects.bulk_create(
+        [
+            document(kind, instance.pk, instance.slug, getattr(instance, name), getattr(instance, body) if body else '')
+            for instance in instances
+        ],
+        batch_size=BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['kind', 'object_id'],
+        update_fields=['slug', 'name', 'body'],
+    )
+
+
+def unindex(model, pks):
+    SearchDocument.objects.filter(kind=INDEXED[model][0], object_id__in=pks).delete()
+
+
+def rebuild():
+    """Replace every document with one written from its object's current row; return how many there are."""
+    SearchDocument.objects.all().delete()
+    total = 0
+    for model, (kind, name, body) in INDEXED.items():
+        rows = model.objects.order_by().values_list('pk', 'slug', name, *([body] if body else []))
+        rows = rows.iterator(chunk_size=BATCH_SIZE)
+        while batch := list(islice(rows, BATCH_SIZE)):
+            SearchDocument.objects.bulk_create([document(kind, *row) for row in batch])
+            total += len(batch)
+    SearchDocument.objects.optimize()
+    return total
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from search.documents import rebuild
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the search documents of every company, department, employee and project. "
+        "Run it after writing rows in ways that skip model signals, such as QuerySet.update() or raw SQL."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            total = rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} documents."))
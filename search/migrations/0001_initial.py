@@ -0,0 +1,99 @@
+# Generated by Django 5.2.5 on 2026-10-18 12:02
+
+from itertools import islice
+
+from django.db import migrations, models
+
+TABLE = 'search_searchdocument'
+FTS_TABLE = 'search_searchdocument_fts'
+
+# The full-text index lives outside Django's schema and the database keeps it
+# in step with the documents: a generated tsvector column under a GIN index on
+# PostgreSQL, an external-content FTS5 table fed by triggers on SQLite. SQLite
+# rebuilds a table to alter its columns, which drops the triggers, so a
+# migration that does so must create them again.
+POSTGRESQL_INDEX = [
+    f"""ALTER TABLE {TABLE} ADD COLUMN vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', name), 'A') || setweight(to_tsvector('simple', body), 'B')
+    ) STORED""",
+    f"CREATE INDEX search_document_vector_idx ON {TABLE} USING gin (vector)",
+]
+SQLITE_INDEX = [
+    f"""CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        name, body, content='{TABLE}', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='1 2 3'
+    )""",
+    f"""CREATE TRIGGER search_document_insert AFTER INSERT ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, name, body) VALUES (new.id, new.name, new.body);
+    END""",
+    f"""CREATE TRIGGER search_document_delete AFTER DELETE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, body) VALUES ('delete', old.id, old.name, old.body);
+    END""",
+    f"""CREATE TRIGGER search_document_update AFTER UPDATE ON {TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, name, body) VALUES ('delete', old.id, old.name, old.body);
+        INSERT INTO {FTS_TABLE}(rowid, name, body) VALUES (new.id, new.name, new.body);
+    END""",
+]
+
+SOURCES = [
+    ('company', 'Company', 'company', 'name', None),
+    ('company', 'Department', 'department', 'name', None),
+    ('user', 'Employee', 'employee', 'name', 'position'),
+    ('company', 'Project', 'project', 'name', 'description'),
+]
+
+
+def create_index(apps, schema_editor):
+    statements = POSTGRESQL_INDEX if schema_editor.connection.vendor == 'postgresql' else SQLITE_INDEX
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(f"ALTER TABLE {TABLE} DROP COLUMN vector")
+        return
+    for trigger in ('insert', 'delete', 'update'):
+        schema_editor.execute(f"DROP TRIGGER search_document_{trigger}")
+    schema_editor.execute(f"DROP TABLE {FTS_TABLE}")
+
+
+def fill_documents(apps, schema_editor):
+    SearchDocument = apps.get_model('search', 'SearchDocument')
+    for app_label, model_name, kind, name, body in SOURCES:
+        fields = ['pk', 'slug', name, *([body] if body else [])]
+        rows = apps.get_model(app_label, model_name).objects.order_by().values_list(*fields).iterator(chunk_size=2000)
+        while batch := list(islice(rows, 2000)):
+            SearchDocument.objects.bulk_create([
+                SearchDocument(kind=kind, object_id=row[0], slug=row[1], name=row[2], body=row[3] if body else '')
+                for row in batch
+            ])
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('company', '0009_stored_counters'),
+        ('user', '0009_employee_company_dept_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('company', 'Company'), ('department', 'Department'), ('employee', 'Employee'), ('project', 'Project')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('slug', models.CharField(max_length=255)),
+                ('name', models.CharField(max_length=255)),
+                ('body', models.TextField(blank=True)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id'), name='search_document_object_uniq')],
+            },
+        ),
+        migrations.RunPython(create_index, drop_index),
+        migrations.RunPython(fill_documents, migrations.RunPython.noop),
+    ]
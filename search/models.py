@@ -0,0 +1,101 @@
+from django.conf import settings
+from django.db import connection, models
+
+
+def match_cap(words):
+    """
+    How many matches of ``words`` are ranked, or ``None`` for all of them.
+
+    Only queries whose every word is at most ``SEARCH_CAPPED_PREFIX_LENGTH``
+    characters are capped, at ``SEARCH_MAX_MATCHES``: a prefix that short
+    matches most documents, and scoring them all would cost more than the
+    order is worth. Any longer word narrows the matches enough to rank them all.
+    """
+    if all(len(word) <= settings.SEARCH_CAPPED_PREFIX_LENGTH for word in words):
+        return settings.SEARCH_MAX_MATCHES
+    return None
+
+
+class SearchDocumentQuerySet(models.QuerySet):
+    def search(self, words, kind=None, limit=50, offset=0):
+        """
+        The documents matching every one of ``words`` as a word prefix, best match first.
+
+        Each row is a dict of ``kind``, ``slug`` and ``name``. On PostgreSQL the
+        GIN-indexed ``vector`` column finds the matches and ``ts_rank`` orders
+        them; on SQLite the FTS5 table and ``bm25`` do. Either way a match in the
+        name outranks one in the body. Every match is ranked before the page
+        is cut, except for queries of very short prefixes (see ``match_cap``),
+        where only the first ``SEARCH_MAX_MATCHES`` in index order are.
+        """
+        qn = connection.ops.quote_name
+        table = qn(SearchDocument._meta.db_table)
+        same_kind = 'AND document.kind = %s' if kind is not None else ''
+        cap = match_cap(words)
+        capped = 'LIMIT %s' if cap is not None else ''
+        if connection.vendor == 'postgresql':
+            query = ' & '.join(f'{word}:*' for word in words)
+            matches = f"""
+                SELECT document.id, document.kind, document.slug, document.name,
+                       ts_rank(document.vector, to_tsquery('simple', %s)) AS score
+                FROM {table} document
+                WHERE document.vector @@ to_tsquery('simple', %s) {same_kind}
+                {capped}
+            """
+            params, order = [query, query], 'score DESC'
+        else:
+            # Quoted, so the words are never read as FTS5 operators. CROSS JOIN
+            # keeps SQLite from driving the query from the kind index instead
+            # of the full-text one, probing FTS5 once per document of that kind.
+            query = ' '.join(f'"{word}"*' for word in words)
+            fts = qn(SearchDocument.FTS_TABLE)
+            matches = f"""
+                SELECT document.id, document.kind, document.slug, document.name,
+                       bm25({fts}, {SearchDocument.NAME_WEIGHT}, 1.0) AS score
+                FROM {fts} CROSS JOIN {table} document ON document.id = {fts}.rowid
+                WHERE {fts} MATCH %s {same_kind}
+                {capped}
+            """
+            params, order = [query], 'score'
+        params += [*([kind] if kind is not None else []), *([cap] if cap is not None else []), limit, offset]
+        sql = f'SELECT kind, slug, name FROM ({matches}) matches ORDER BY {order}, id LIMIT %s OFFSET %s'
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            columns = [column[0] for column in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+    def optimize(self):
+        """Merge the SQLite full-text index into one segment, as after a bulk load; PostgreSQL needs nothing."""
+        if connection.vendor == 'sqlite':
+            fts = connection.ops.quote_name(SearchDocument.FTS_TABLE)
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {fts}({fts}) VALUES ('optimize')")
+
+
+class SearchDocument(models.Model):
+    """The searchable text of one company, department, employee or project; see ``search/documents.py``."""
+    class KINDS(models.TextChoices):
+        COMPANY = 'company', 'Company'
+        DEPARTMENT = 'department', 'Department'
+        EMPLOYEE = 'employee', 'Employee'
+        PROJECT = 'project', 'Project'
+
+    # Full-text index over name and body, outside Django's schema (see 0001_initial).
+    FTS_TABLE = 'search_searchdocument_fts'
+    NAME_WEIGHT = 10.0
+
+    kind = models.CharField(max_length=20, choices=KINDS.choices)
+    object_id = models.BigIntegerField()
+    slug = models.CharField(max_length=255)
+    name = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+
+    objects = SearchDocumentQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['kind', 'object_id'], name='search_document_object_uniq'),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}: {self.name}"
@@ -0,0 +1,24 @@
+import re
+
+from django.conf import settings
+from rest_framework import serializers
+
+from main.pagination import SlugCursorPagination
+from .models import SearchDocument
+
+WORD = re.compile(r'[^\W_]+')
+MAX_WORDS = 8
+
+
+class SearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField()
+    type = serializers.ChoiceField(choices=SearchDocument.KINDS.choices, required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=SlugCursorPagination.max_page_size,
+                                     default=settings.REST_FRAMEWORK['PAGE_SIZE'])
+    offset = serializers.IntegerField(min_value=0, default=0)
+
+    def validate_q(self, value):
+        words = WORD.findall(value.lower())[:MAX_WORDS]
+        if not words:
+            raise serializers.ValidationError("Enter at least one letter or digit.")
+        return words
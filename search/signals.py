@@ -0,0 +1,44 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from company.models import Company, Department, Project
+from user.models import Employee
+from .documents import index_instances, indexed_fields, unindex
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_save, sender=Department)
+@receiver(post_save, sender=Employee)
+@receiver(post_save, sender=Project)
+def index_saved(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and not indexed_fields(sender) & set(update_fields):
+        return
+    index_instances([instance])
+
+
+@receiver(pre_delete, sender=Company)
+@receiver(pre_delete, sender=Department)
+@receiver(pre_delete, sender=Employee)
+@receiver(pre_delete, sender=Project)
+def collect_deleted(sender, instance, origin=None, **kwargs):
+    # Every row of a delete gets pre_delete before any is removed, so the whole
+    # cascade is known by the time the first post_delete arrives.
+    if origin is not None:
+        unindexed = getattr(origin, '_unindexed', None)
+        if unindexed is None:
+            unindexed = origin._unindexed = {}
+        unindexed.setdefault(sender, set()).add(instance.pk)
+
+
+@receiver(post_delete, sender=Company)
+@receiver(post_delete, sender=Department)
+@receiver(post_delete, sender=Employee)
+@receiver(post_delete, sender=Project)
+def unindex_deleted(sender, instance, origin=None, **kwargs):
+    # One delete per model for a cascade; the rows after the first find their pks gone.
+    pks = getattr(origin, '_unindexed', {}).get(sender)
+    if pks is None:
+        unindex(sender, [instance.pk])
+    elif pks:
+        unindex(sender, pks)
+        pks.clear()
@@ -0,0 +1,66 @@
+from django.conf import settings
+from rest_framework import permissions, status
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from .models import SearchDocument, match_cap
+from .serializers import SearchQuerySerializer
+
+DETAIL_VIEWS = {
+    SearchDocument.KINDS.COMPANY: 'company-detail',
+    SearchDocument.KINDS.DEPARTMENT: 'department-detail',
+    SearchDocument.KINDS.EMPLOYEE: 'employee-detail',
+    SearchDocument.KINDS.PROJECT: 'project-detail',
+}
+
+
+class SearchView(GenericAPIView):
+    """
+    Companies, departments, employees and projects matching ``q``, best match first.
+
+    Every word of ``q`` must begin a word of the name, of an employee's
+    position or of a project's description; name matches rank higher.
+    ``type`` keeps one kind of result, and ``limit``/``offset`` page through
+    them with ``next`` and ``previous`` links.
+
+    Every match is ranked, except when each word of ``q`` is a prefix of one
+    or two letters: then only the first ``SEARCH_MAX_MATCHES`` matches in index
+    order are, ``next`` stops at the last page within them and later offsets
+    are empty. A longer word finds what such a query leaves out.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = SearchQuerySerializer
+
+    def get(self, request):
+        serializer = self.get_serializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        words, limit, offset = (serializer.validated_data[field] for field in ('q', 'limit', 'offset'))
+        cap, rows = match_cap(words), []
+        if cap is None or offset < cap:
+            # One row past the page tells whether there is a next one, without counting every match.
+            rows = SearchDocument.objects.search(words, serializer.validated_data.get('type'), limit + 1, offset)
+
+        url = request.build_absolute_uri()
+        next_url = None
+        if len(rows) > limit and (cap is None or offset + limit < cap):
+            next_url = replace_query_param(url, 'offset', offset + limit)
+        previous_url = None
+        if offset > limit:
+            previous_url = replace_query_param(url, 'offset', offset - limit)
+        elif offset:
+            previous_url = remove_query_param(url, 'offset')
+        return Response({
+            'next': next_url,
+            'previous': previous_url,
+            'results': [
+                {
+                    'type': row['kind'],
+                    'slug': row['slug'],
+                    'name': row['name'],
+                    'url': reverse(DETAIL_VIEWS[row['kind']], args=[row['slug']], request=request),
+                }
+                for row in rows[:limit]
+            ],
+        }, status=status.HTTP_200_OK)
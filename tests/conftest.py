@@ -0,0 +1,43 @@
+import pytest
+from django.core.cache import caches
+from django.db.models.signals import post_save
+from rest_framework.test import APIClient
+
+from user.models import User
+from user.signals import create_employee
+
+
+@pytest.fixture
+def disable_employee_signal():
+    post_save.disconnect(create_employee, sender=User)
+    yield
+    post_save.connect(create_employee, sender=User)
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def staff_user(db, disable_employee_signal):
+    return User.objects.create_user(
+        username="staff",
+        email="staff@example.com",
+        password="password123",
+        role=User.ROLES.ADMIN,
+        is_staff=True,
+    )
+
+
+@pytest.fixture
+def staff_client(api_client, staff_user):
+    api_client.force_authenticate(user=staff_user)
+    return api_client
+
+
+@pytest.fixture(autouse=True)
+def clear_api_cache(settings):
+    caches[settings.API_CACHE_ALIAS].clear()
+    # Rolled-back test data can reuse user ids.
+    caches[settings.AUTH_USER_CACHE_ALIAS].clear()
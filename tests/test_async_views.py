@@ -0,0 +1,106 @@
+import re
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from company.models import Company, Department
+from performance_review.models import PerformanceReview
+from user.models import Employee
+
+
+@pytest.fixture
+def dataset(db, staff_user):
+    company = Company.objects.create(name="acme")
+    departments = [Department.objects.create(name=name, company=company) for name in ("Sales", "Support")]
+    employees = [
+        Employee.objects.create(name=f"Employee {index}", company=company, department=departments[index % 2],
+                                position="Engineer", hired_on="2024-01-0%d" % (index + 1))
+        for index in range(5)
+    ]
+    for employee in employees:
+        PerformanceReview.objects.create(employee=employee, feedback=f"Review of {employee.name}")
+    return company, departments, employees
+
+
+@pytest.fixture
+def client(staff_user):
+    return Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(staff_user)}")
+
+
+def walk(client, url):
+    results = []
+    while url:
+        body = client.get(url).json()
+        results.extend(body['results'])
+        url = body['next']
+    return results
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('sync_name, async_name', [
+    ('company-list', 'async-company-list'),
+    ('department-list', 'async-department-list'),
+    ('employee-list', 'async-employee-list'),
+    ('performance-review-list-create', 'async-performance-review-list'),
+])
+def test_lists_match_drf(client, staff_client, dataset, sync_name, async_name):
+    response = client.get(reverse(async_name))
+
+    assert response.status_code == 200
+    assert response.json()['results'] == staff_client.get(reverse(sync_name)).json()['results']
+
+
+@pytest.mark.django_db
+def test_details_match_drf(client, staff_client, dataset):
+    company, departments, employees = dataset
+    review = PerformanceReview.objects.first()
+    pairs = [
+        ('company-detail', 'async-company-detail', company.slug),
+        ('department-detail', 'async-department-detail', departments[0].slug),
+        ('employee-detail', 'async-employee-detail', employees[0].slug),
+        ('performance-review-detail', 'async-performance-review-detail', review.pk),
+    ]
+    for sync_name, async_name, key in pairs:
+        response = client.get(reverse(async_name, args=[key]))
+        assert response.status_code == 200
+        assert response.json() == staff_client.get(reverse(sync_name, args=[key])).json()
+
+
+@pytest.mark.django_db
+def test_cursor_pages_cover_every_row_once(client, dataset):
+    employees = walk(client, reverse('async-employee-list') + '?page_size=2')
+    reviews = walk(client, reverse('async-performance-review-list') + '?page_size=2')
+
+    assert [row['slug'] for row in employees] == sorted(Employee.objects.values_list('slug', flat=True))
+    assert [row['employee'] for row in reviews] == list(
+        PerformanceReview.objects.order_by('created_at', 'id').values_list('employee__slug', flat=True))
+
+
+@pytest.mark.django_db
+def test_errors_use_drf_bodies(client, dataset):
+    anonymous = Client().get(reverse('async-company-list'))
+    assert anonymous.status_code == 401
+    assert anonymous['WWW-Authenticate'] == 'Bearer realm="api"'
+
+    bad_token = Client(HTTP_AUTHORIZATION="Bearer nonsense").get(reverse('async-company-list'))
+    assert bad_token.status_code == 401
+    assert bad_token.json()['detail'] == "Given token not valid for any token type"
+
+    assert client.post(reverse('async-company-list')).status_code == 405
+    missing = client.get(reverse('async-employee-detail', args=['nobody']))
+    assert missing.status_code == 404
+    assert missing.json() == {'detail': "No Employee matches the given query."}
+    assert client.get(reverse('async-performance-review-list') + '?cursor=bm9wZQ').status_code == 404
+
+
+@pytest.mark.django_db
+def test_asgi_handler_records_queries(staff_user, dataset):
+    headers = {'Authorization': f"Bearer {AccessToken.for_user(staff_user)}"}
+    response = async_to_sync(AsyncClient().get)(reverse('async-company-list'), headers=headers)
+
+    assert response.status_code == 200
+    # One query for the token's user and one for the page.
+    assert re.search(r'db;dur=[\d.]+;desc="2 queries"', response['Server-Timing'])
@@ -0,0 +1,85 @@
+import pytest
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from company.models import Company
+from user.authentication import CachedJWTAuthentication
+from user.models import Employee, User
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_user(username="ada", email="ada@example.com", password="password123")
+
+
+def authenticate(user, token=None):
+    token = token or AccessToken.for_user(user)
+    request = APIRequestFactory().get('/', HTTP_AUTHORIZATION=f"Bearer {token}")
+    with CaptureQueriesContext(connection) as queries:
+        authenticated, _ = CachedJWTAuthentication().authenticate(request)
+        employee = authenticated.employee
+    return authenticated, employee, len(queries)
+
+
+@pytest.mark.django_db
+def test_users_are_cached_with_their_employee(user):
+    first, employee, queries = authenticate(user)
+    assert queries == 1
+    assert employee == Employee.objects.get(user=user)
+
+    second, _, queries = authenticate(user)
+    assert queries == 0
+    assert second == first and second is not first
+
+
+@pytest.mark.django_db
+def test_saving_the_user_or_employee_drops_the_entry(user):
+    authenticate(user)
+    employee = Employee.objects.get(user=user)
+    employee.position = "Lead"
+    employee.save()
+
+    _, employee, queries = authenticate(user)
+    assert (queries, employee.position) == (1, "Lead")
+
+    user.is_active = False
+    user.save()
+    with pytest.raises(AuthenticationFailed):
+        authenticate(user)
+
+
+@pytest.mark.django_db
+def test_another_token_version_is_loaded_again(user, monkeypatch):
+    # simplejwt rebinds api_settings on setting_changed; the modules holding it wouldn't see that.
+    monkeypatch.setattr(api_settings, 'CHECK_REVOKE_TOKEN', True)
+    old_token = AccessToken.for_user(user)
+    authenticate(user, old_token)
+    # Changed by another process: this one's entry is left as it was.
+    user.set_password("changed456")
+    User.objects.filter(pk=user.pk).update(password=user.password)
+
+    _, _, queries = authenticate(user, AccessToken.for_user(user))
+    assert queries == 1
+    with pytest.raises(AuthenticationFailed):
+        authenticate(user, old_token)
+
+
+@pytest.mark.django_db
+def test_hierarchy_reads_authenticate_from_claims(user):
+    company = Company.objects.create(name="acme")
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    url = reverse('company-detail', args=[company.slug])
+    client.get(url)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+
+    assert response.status_code == 200
+    assert len(queries) == 0
+    assert Client().get(url).status_code == 401
@@ -0,0 +1,115 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from company.models import Company, Department, Project
+from company.serializers import ProjectBulkAssignSerializer
+from user.models import Employee
+
+
+@pytest.fixture
+def department(db):
+    company = Company.objects.create(name="Acme")
+    return Department.objects.create(name="Ops", company=company)
+
+
+@pytest.fixture
+def employees(department):
+    return [
+        Employee.objects.create(name=f"Employee {index}", slug=f"employee-{index}",
+                                company=department.company, department=department)
+        for index in range(4)
+    ]
+
+
+@pytest.fixture
+def projects(department):
+    return [
+        Project.objects.create(name=f"Project {index}", company=department.company, department=department,
+                               description="", start_date="2025-01-01", end_date="2025-12-31")
+        for index in range(3)
+    ]
+
+
+def assigned(project):
+    return sorted(project.assigned_employees.values_list('slug', flat=True))
+
+
+@pytest.mark.django_db
+def test_bulk_assign_applies_diffs(staff_client, projects, employees):
+    first, second, third = projects
+    first.assigned_employees.set(employees[:2])
+    second.assigned_employees.set(employees)
+
+    payload = {'assignments': [
+        {'project': first.slug, 'employees': ['employee-1', 'employee-2']},
+        {'project': second.slug, 'employees': []},
+        {'project': third.slug, 'employees': ['employee-3']},
+    ]}
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_client.post(reverse('project-bulk-assign'), payload, format='json')
+
+    assert response.status_code == 200
+    assert response.data == {'projects': 3, 'added': 2, 'removed': 5}
+    assert assigned(first) == ['employee-1', 'employee-2']
+    assert assigned(second) == []
+    assert assigned(third) == ['employee-3']
+    # two slug lookups, one read of the through table, one insert, one delete, plus the transaction
+    assert len(queries) <= 7
+
+
+@pytest.mark.django_db
+def test_bulk_assign_rejects_unknown_slugs(staff_client, projects, employees):
+    projects[0].assigned_employees.set(employees[:1])
+    payload = {'assignments': [
+        {'project': projects[0].slug, 'employees': ['employee-1', 'nobody']},
+        {'project': 'missing', 'employees': []},
+    ]}
+
+    response = staff_client.post(reverse('project-bulk-assign'), payload, format='json')
+
+    assert response.status_code == 400
+    assert response.data['employees'] == ["Unknown employee slug: nobody"]
+    assert response.data['projects'] == ["Unknown project slug: missing"]
+    assert assigned(projects[0]) == ['employee-0']
+
+
+@pytest.mark.django_db
+def test_bulk_assign_rejects_repeated_projects(staff_client, projects):
+    entry = {'project': projects[0].slug, 'employees': []}
+
+    response = staff_client.post(reverse('project-bulk-assign'), {'assignments': [entry, entry]}, format='json')
+
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_bulk_assign_chunks_reads_and_deletes(projects, employees):
+    for project in projects:
+        project.assigned_employees.set(employees)
+    assignments = {project.pk: set() for project in projects}
+
+    with CaptureQueriesContext(connection) as queries:
+        result = Project.objects.bulk_assign(assignments, batch_size=2)
+
+    sql = [query['sql'] for query in queries]
+    assert result == {'projects': 3, 'added': 0, 'removed': 12}
+    assert len([statement for statement in sql if statement.startswith('SELECT')]) == 2
+    assert len([statement for statement in sql if statement.startswith('DELETE')]) == 6
+    assert not any(project.assigned_employees.exists() for project in projects)
+
+
+@pytest.mark.django_db
+def test_bulk_assign_looks_slugs_up_in_chunks(projects, employees, monkeypatch):
+    monkeypatch.setattr(ProjectBulkAssignSerializer, 'batch_size', 2)
+    data = {'assignments': [{'project': project.slug, 'employees': [employee.slug for employee in employees]}
+                            for project in projects]}
+
+    with CaptureQueriesContext(connection) as queries:
+        serializer = ProjectBulkAssignSerializer(data=data)
+        assert serializer.is_valid(), serializer.errors
+
+    assert len(queries) == 4
+    assert serializer.validated_data['assignments'] == {
+        project.pk: {employee.pk for employee in employees} for project in projects}
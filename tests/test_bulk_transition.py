@@ -0,0 +1,98 @@
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from company.models import Company, Department
+from performance_review.models import PerformanceReview
+from user.models import Employee
+
+
+@pytest.fixture
+def employee(db):
+    company = Company.objects.create(name="acme")
+    department = Department.objects.create(name="Sales", company=company)
+    return Employee.objects.create(name="Reviewer", company=company, department=department)
+
+
+def make_reviews(employee, stage, count):
+    return [PerformanceReview.objects.create(employee=employee, stage=stage) for _ in range(count)]
+
+
+@pytest.mark.django_db
+def test_bulk_transition_reports_every_id(staff_client, employee):
+    approving = make_reviews(employee, 'under_approval', 3)
+    done = make_reviews(employee, 'review_approved', 1)
+    missing = uuid.uuid4()
+
+    response = staff_client.post(reverse('performance-review-bulk-transition'), {
+        'ids': [str(review.pk) for review in approving + done] + [str(missing)],
+        'stage': 'review_approved',
+        'approved_by': employee.pk,
+    }, format='json')
+
+    assert response.status_code == 200
+    assert response.data['transitioned'] == 3
+    results = {result['id']: result for result in response.data['results']}
+    for review in approving:
+        assert results[str(review.pk)] == {'id': str(review.pk), 'status': 'transitioned',
+                                           'from_stage': 'under_approval'}
+    assert results[str(done[0].pk)]['status'] == 'invalid'
+    assert results[str(missing)] == {'id': str(missing), 'status': 'not_found', 'from_stage': None}
+
+    for review in approving:
+        before = review.updated_at
+        review.refresh_from_db()
+        assert review.stage == 'review_approved'
+        assert review.approved_by == employee
+        assert review.updated_at > before
+
+
+@pytest.mark.django_db
+def test_one_update_per_source_stage(employee):
+    reviews = make_reviews(employee, 'review_scheduled', 20) + make_reviews(employee, 'review_rejected', 20)
+
+    with CaptureQueriesContext(connection) as queries:
+        results = PerformanceReview.objects.bulk_transition(
+            [review.pk for review in reviews], 'feedback_provided', feedback="Solid work", reviewed_by=employee)
+
+    updates = [query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE')]
+    assert len(updates) == 2
+    assert {outcome for outcome, _ in results.values()} == {'transitioned'}
+    assert PerformanceReview.objects.filter(stage='feedback_provided', feedback="Solid work").count() == 40
+
+
+@pytest.mark.django_db
+def test_bulk_transition_validates_payload(staff_client, employee):
+    url = reverse('performance-review-bulk-transition')
+
+    assert staff_client.post(url, {'ids': [], 'stage': 'review_approved'}, format='json').status_code == 400
+    assert staff_client.post(url, {'ids': [str(uuid.uuid4())], 'stage': 'archived'}, format='json').status_code == 400
+
+
+class RacingTransitions(dict):
+    """``TRANSITIONS`` that let another request move ``review`` as soon as the stages have been read."""
+
+    def __init__(self, transitions, review, stage):
+        super().__init__(transitions)
+        self.pending = (review, stage)
+
+    def get(self, *args):
+        if self.pending:
+            review, stage = self.pending
+            self.pending = None
+            PerformanceReview.objects.filter(pk=review.pk).update(stage=stage)
+        return super().get(*args)
+
+
+@pytest.mark.django_db
+def test_rows_moved_concurrently_are_conflicts(employee, monkeypatch):
+    reviews = make_reviews(employee, 'review_scheduled', 3)
+    monkeypatch.setattr(PerformanceReview, 'TRANSITIONS',
+                        RacingTransitions(PerformanceReview.TRANSITIONS, reviews[1], 'feedback_provided'))
+
+    results = PerformanceReview.objects.bulk_transition([review.pk for review in reviews], 'feedback_provided')
+
+    assert [results[review.pk][0] for review in reviews] == ['transitioned', 'conflict', 'transitioned']
@@ -0,0 +1,135 @@
+import io
+import json
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from company.models import Company, Department, Project
+from user.models import Employee
+
+
+@pytest.fixture
+def companies(db):
+    acme, other = Company.objects.create(name="acme"), Company.objects.create(name="other")
+    return acme, other, Department.objects.create(name="Sales", company=acme), \
+        Department.objects.create(name="Ops", company=other)
+
+
+def counts(*instances):
+    for instance in instances:
+        instance.refresh_from_db()
+    return [
+        (instance.department_count, instance.employee_count, instance.project_count)
+        if isinstance(instance, Company) else (instance.employee_count, instance.project_count)
+        for instance in instances
+    ]
+
+
+def make_project(department):
+    return Project.objects.create(name="Platform", company=department.company, department=department,
+                                  description="", start_date="2025-01-01", end_date="2025-12-31")
+
+
+@pytest.mark.django_db
+def test_counters_follow_creates_moves_and_deletes(companies):
+    acme, other, sales, ops = companies
+    employee = Employee.objects.create(name="Ada", company=acme, department=sales)
+    make_project(sales)
+    assert counts(acme, other, sales, ops) == [(1, 1, 1), (1, 0, 0), (1, 1), (0, 0)]
+
+    employee.company, employee.department = other, ops
+    employee.save()
+    employee.save()  # saving again must not move it twice
+    assert counts(acme, other, sales, ops) == [(1, 0, 1), (1, 1, 0), (0, 1), (1, 0)]
+
+    Employee.objects.get().delete()
+    sales.delete()
+    assert counts(acme, other, ops) == [(0, 0, 0), (1, 0, 0), (0, 0)]
+
+
+@pytest.mark.django_db
+def test_saving_a_stale_instance_keeps_the_counters(companies):
+    acme, _, sales, _ = companies
+    stale = Company.objects.get(pk=acme.pk)
+    Employee.objects.create(name="Ada", company=acme, department=sales)
+
+    stale.name = "acme inc"
+    stale.save()
+
+    assert counts(acme) == [(1, 1, 0)]
+    assert acme.slug == "acme inc"
+
+
+@pytest.mark.django_db
+def test_api_reads_the_columns(staff_client, companies):
+    acme, _, sales, _ = companies
+    Company.objects.filter(pk=acme.pk).update(employee_count=41)
+
+    assert staff_client.get(f"/api/companies/{acme.slug}/").data['employee_count'] == 41
+    assert staff_client.get(f"/api/departments/{sales.slug}/").data['employee_count'] == 0
+
+
+@pytest.mark.django_db
+def test_recount_rebuilds_every_counter(companies):
+    acme, other, sales, ops = companies
+    Employee.objects.create(name="Ada", company=acme, department=sales)
+    make_project(ops)
+    Company.objects.update(department_count=7, employee_count=7, project_count=7)
+    Department.objects.update(employee_count=7, project_count=7)
+
+    out = io.StringIO()
+    call_command('recount', stdout=out)
+
+    assert counts(acme, other, sales, ops) == [(1, 1, 0), (1, 0, 1), (1, 0), (0, 1)]
+    assert "Recounted 2 companies and 2 departments" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_bulk_writers_keep_the_counters(staff_client, companies):
+    acme, _, sales, _ = companies
+    lines = [{'email': f"user{index}@example.com", 'company': "acme", 'department': sales.slug} for index in range(3)]
+    upload = SimpleUploadedFile("people.jsonl", "\n".join(json.dumps(line) for line in lines).encode())
+    staff_client.post("/api/employees/import/", {'file': upload}, format='multipart')
+    assert counts(acme, sales) == [(1, 3, 0), (3, 0)]
+
+    call_command('seed_bulk', companies=2, departments=2, employees=30, projects=3, stdout=io.StringIO())
+
+    for company in Company.objects.filter(name__startswith="Seed"):
+        assert company.department_count == company.departments.count() == 2
+        assert company.employee_count == company.employees.count() == 15
+        assert company.project_count == company.projects.count() == 3
+    for department in Department.objects.all():
+        assert department.employee_count == department.employees.count()
+        assert department.project_count == department.projects.count()
+
+
+@pytest.mark.django_db
+def test_cascade_deletes_skip_the_counters_of_deleted_rows(companies):
+    acme, other, sales, ops = companies
+    for index in range(20):
+        Employee.objects.create(name=f"Employee {index}", company=acme, department=sales)
+    make_project(sales)
+    Employee.objects.create(name="Elsewhere", company=other, department=sales)
+
+    with CaptureQueriesContext(connection) as queries:
+        acme.delete()
+    updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE "company_')]
+
+    # Only the employee of another company, who worked in the deleted department, is uncounted.
+    assert len(updates) == 1
+    assert counts(other, ops) == [(1, 0, 0), (0, 0)]
+
+
+@pytest.mark.django_db
+def test_drifted_counters_stop_at_zero(companies):
+    acme, _, sales, _ = companies
+    employee = Employee.objects.create(name="Ada", company=acme, department=sales)
+    Company.objects.update(employee_count=0)
+    Department.objects.update(employee_count=0)
+
+    employee.delete()
+
+    assert counts(acme, sales) == [(1, 0, 0), (0, 0)]
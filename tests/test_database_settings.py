@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+from django.db.utils import ConnectionHandler
+
+from main.database import database_config
+
+BASE_DIR = Path('/srv/cms')
+
+
+def test_sqlite_is_the_default():
+    config = database_config(BASE_DIR, env={})
+
+    assert config['ENGINE'] == 'django.db.backends.sqlite3'
+    assert config['NAME'] == BASE_DIR / 'db.sqlite3'
+    assert config['TEST']['NAME'] == BASE_DIR / 'test_db.sqlite3'
+    assert 'PRAGMA journal_mode=WAL' in config['OPTIONS']['init_command']
+    assert config['OPTIONS']['timeout'] == 20
+    assert config['OPTIONS']['transaction_mode'] == 'IMMEDIATE'
+
+
+def test_postgresql_uses_the_connection_pool():
+    config = database_config(BASE_DIR, env={
+        'DB_ENGINE': 'postgresql', 'DB_NAME': 'cms', 'DB_HOST': 'db', 'DB_POOL_MAX_SIZE': '20',
+    })
+
+    assert config['ENGINE'] == 'django.db.backends.postgresql'
+    assert config['HOST'] == 'db'
+    assert config['OPTIONS']['pool'] == {'min_size': 2, 'max_size': 20, 'timeout': 10.0}
+    # Django rejects persistent connections alongside a pool.
+    assert config['CONN_MAX_AGE'] == 0
+    assert config['CONN_HEALTH_CHECKS'] is True
+
+
+def test_postgresql_without_pool_keeps_connections_open():
+    config = database_config(BASE_DIR, env={'DB_ENGINE': 'postgres', 'DB_POOL': 'false', 'DB_CONN_MAX_AGE': '300'})
+
+    assert 'pool' not in config['OPTIONS']
+    assert config['CONN_MAX_AGE'] == 300
+    assert config['CONN_HEALTH_CHECKS'] is True
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        database_config(BASE_DIR, env={'DB_ENGINE': 'oracle'})
+
+
+def test_sqlite_file_connection_applies_pragmas(tmp_path, django_db_blocker):
+    wrapper = ConnectionHandler({'default': database_config(tmp_path, env={'DB_BUSY_TIMEOUT': '5'})})['default']
+    try:
+        with django_db_blocker.unblock(), wrapper.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode')
+            journal_mode = cursor.fetchone()[0]
+            cursor.execute('PRAGMA busy_timeout')
+            busy_timeout = cursor.fetchone()[0]
+    finally:
+        wrapper.close()
+
+    assert journal_mode == 'wal'
+    assert busy_timeout == 5000
@@ -0,0 +1,52 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from user.models import Employee, User
+
+
+def make_user(email):
+    return User.objects.create_user(username=email, email=email, password="password123", role=User.ROLES.MANAGER)
+
+
+@pytest.mark.django_db
+def test_slug_comes_from_email_prefix_in_one_insert():
+    user = make_user("jane@example.com")
+
+    with CaptureQueriesContext(connection) as queries:
+        employee = Employee.objects.create(user=user, name="Jane")
+
+    assert employee.slug == "jane"
+    assert len([query for query in queries if query['sql'].startswith('INSERT INTO "user_employee"')]) == 1
+    assert len([query for query in queries if query['sql'].startswith('SELECT')]) == 0
+
+
+@pytest.mark.django_db
+def test_shared_prefix_across_domains_gets_unique_slugs():
+    slugs = [
+        Employee.objects.create(user=make_user(f"john@{domain}"), name="John").slug
+        for domain in ("a.com", "b.com", "c.com")
+    ]
+
+    assert slugs == ["john", "john-1", "john-2"]
+
+
+@pytest.mark.django_db
+def test_saving_again_keeps_slug():
+    employee = Employee.objects.create(user=make_user("kim@example.com"), name="Kim")
+    employee.name = "Kim Lee"
+    employee.save()
+
+    employee.refresh_from_db()
+    assert employee.slug == "kim"
+
+
+@pytest.mark.django_db
+def test_allocate_slugs_for_bulk_create():
+    Employee.objects.create(name="Ann", slug="ann")
+    Employee.objects.create(name="Ann", slug="ann-1")
+    batch = [Employee(name="Ann"), Employee(name="Ann"), Employee(name="Bob"), Employee(name="Pre", slug="pre")]
+
+    Employee.objects.bulk_create(Employee.objects.allocate_slugs(batch))
+
+    assert [employee.slug for employee in batch] == ["ann-2", "ann-3", "bob", "pre"]
@@ -0,0 +1,113 @@
+import csv
+import io
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken
+
+from company.models import Company, Department, Project
+from performance_review.models import PerformanceReview
+from user.models import Employee
+
+
+@pytest.fixture
+def dataset(db):
+    company = Company.objects.create(name="acme")
+    department = Department.objects.create(name="Sales", company=company)
+    employees = [
+        Employee.objects.create(name=f"Employee {index}", company=company, department=department,
+                                address="1 Main St, Springfield", hired_on="2024-01-0%d" % (index + 1))
+        for index in range(5)
+    ]
+    Employee.objects.create(name="Unassigned")
+    project = Project.objects.create(name="Platform", company=company, department=department, description="",
+                                     start_date="2025-01-01", end_date="2025-12-31")
+    project.assigned_employees.set(employees[:2])
+    for employee in employees:
+        PerformanceReview.objects.create(employee=employee)
+    return employees
+
+
+def export(client, url_name, **params):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(reverse(url_name), params)
+        body = b''.join(response.streaming_content).decode()
+    assert response.status_code == 200
+    return response, body, len(queries)
+
+
+@pytest.mark.django_db
+def test_ndjson_matches_the_list_endpoint(staff_client, dataset):
+    response, body, _ = export(staff_client, 'employee-export', format='ndjson')
+
+    assert response['Content-Type'] == 'application/x-ndjson'
+    assert response['Content-Disposition'] == 'attachment; filename="employees.ndjson"'
+    rows = [json.loads(line) for line in body.splitlines()]
+    listed = staff_client.get(reverse('employee-list'), {'page_size': 100}).json()['results']
+    assert rows == listed
+
+
+@pytest.mark.django_db
+def test_csv_has_a_header_and_one_line_per_row(staff_client, dataset):
+    response, body, _ = export(staff_client, 'project-export', format='csv')
+
+    assert response['Content-Type'].startswith('text/csv')
+    rows = list(csv.DictReader(io.StringIO(body)))
+    assert list(rows[0]) == ['id', 'company', 'department', 'slug', 'name', 'description', 'start_date', 'end_date',
+                             'assigned_employees']
+    assert (rows[0]['company'], rows[0]['assigned_employees']) == ("acme", "Employee 0; Employee 1")
+
+    _, body, _ = export(staff_client, 'employee-export', format='csv')
+    employees = list(csv.DictReader(io.StringIO(body)))
+    assert employees[0]['address'] == "1 Main St, Springfield"
+    assert {employee['company'] for employee in employees} == {"acme", ""}
+
+
+@pytest.mark.django_db
+def test_rows_are_read_in_chunks(staff_client, dataset, settings):
+    settings.EXPORT_CHUNK_SIZE = 2
+
+    response, body, queries = export(staff_client, 'performance-review-export', format='ndjson')
+
+    assert response.streaming
+    assert [json.loads(line)['employee'] for line in body.splitlines()] == [employee.slug for employee in dataset]
+    assert queries == 1
+    _, _, queries = export(staff_client, 'project-export', format='ndjson')
+    assert queries == 2  # the rows, plus the assignments of their one chunk
+    assert len(list(staff_client.get(reverse('employee-export'), {'format': 'csv'}).streaming_content)) == 1 + 3
+
+
+@pytest.mark.django_db
+def test_reviews_export_filters_by_employee(staff_client, dataset):
+    _, body, _ = export(staff_client, 'performance-review-export', format='ndjson', employee_slug=dataset[0].slug)
+
+    assert [json.loads(line)['employee'] for line in body.splitlines()] == [dataset[0].slug]
+
+
+@pytest.mark.django_db
+def test_export_requires_authentication(api_client, dataset):
+    response = api_client.get(reverse('employee-export'), {'format': 'ndjson'})
+
+    assert response.status_code == 401
+    assert json.loads(response.content) == {'detail': "Authentication credentials were not provided."}
+    assert api_client.get(reverse('employee-export'), {'format': 'xml'}).status_code == 404
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_streams_under_asgi(staff_user, dataset):
+    headers = {'Authorization': f"Bearer {AccessToken.for_user(staff_user)}"}
+
+    async def fetch():
+        response = await AsyncClient().get(reverse('employee-export') + '?format=ndjson', headers=headers)
+        return response, b''.join([chunk async for chunk in response.streaming_content])
+
+    response, body = async_to_sync(fetch)()
+
+    assert response.status_code == 200
+    assert response.is_async
+    assert len(body.decode().splitlines()) == len(dataset) + 1
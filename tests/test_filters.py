@@ -0,0 +1,156 @@
+import json
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from company.models import Company, Department, Project
+from performance_review.models import PerformanceReview
+from user.models import Employee
+
+
+@pytest.fixture
+def hierarchy(db):
+    acme = Company.objects.create(name="acme")
+    globex = Company.objects.create(name="globex")
+    platform = Department.objects.create(name="Platform", company=acme)
+    sales = Department.objects.create(name="Sales", company=acme)
+    research = Department.objects.create(name="Research", company=globex)
+    return platform, sales, research
+
+
+def listed(client, name, key='slug', **params):
+    response = client.get(reverse(name), params)
+    assert response.status_code == 200, response.data
+    return [row[key] for row in response.data['results']]
+
+
+def collect(client, url):
+    rows = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200, response.data
+        rows += response.data['results']
+        url = response.data['next']
+    return rows
+
+
+@pytest.mark.django_db
+def test_employees_filter_by_company_department_position_and_hire_date(staff_client, hierarchy):
+    platform, sales, research = hierarchy
+    for slug, department, position, hired_on in [
+        ("ada", platform, "Engineer", "2020-03-01"),
+        ("bob", sales, "Engineer", "2022-06-15"),
+        ("cy", sales, "Manager", None),
+        ("dee", research, "Engineer", "2024-01-10"),
+    ]:
+        Employee.objects.create(slug=slug, name=slug.title(), company=department.company, department=department,
+                                position=position, hired_on=hired_on)
+
+    assert listed(staff_client, 'employee-list', company="acme") == ["ada", "bob", "cy"]
+    assert listed(staff_client, 'employee-list', department=sales.slug) == ["bob", "cy"]
+    assert listed(staff_client, 'employee-list', position="Engineer", company="acme") == ["ada", "bob"]
+    assert listed(staff_client, 'employee-list', hired_from="2021-01-01") == ["bob", "dee"]
+    assert listed(staff_client, 'employee-list', hired_from="2020-03-01", hired_to="2022-06-15") == ["ada", "bob"]
+    assert listed(staff_client, 'employee-list', company="initech") == []
+
+    response = staff_client.get(reverse('employee-list'), {'hired_from': "last week"})
+    assert response.status_code == 400
+    assert list(response.data) == ['hired_from']
+
+
+@pytest.mark.django_db
+def test_projects_filter_by_hierarchy_and_active_window(staff_client, hierarchy):
+    platform, sales, research = hierarchy
+    for name, department, start, end in [
+        ("billing", platform, "2024-01-01", "2024-03-31"),
+        ("crm", sales, "2024-03-01", "2024-09-30"),
+        ("lab", research, "2024-10-01", "2025-06-30"),
+    ]:
+        Project.objects.create(name=name, description="", company=department.company,
+                               department=department, start_date=start, end_date=end)
+
+    def projects(**params):
+        return listed(staff_client, 'project-list', key='name', **params)
+
+    assert projects(company="acme") == ["billing", "crm"]
+    assert projects(department=research.slug) == ["lab"]
+    assert projects(active_from="2024-03-15", active_to="2024-03-20") == ["billing", "crm"]
+    assert projects(active_from="2024-04-01") == ["crm", "lab"]
+    assert projects(active_to="2024-02-01", company="acme") == ["billing"]
+
+
+@pytest.mark.django_db
+def test_reviews_filter_by_employee_stage_and_schedule(staff_client, hierarchy):
+    platform, _, _ = hierarchy
+    ada = Employee.objects.create(slug="ada", name="Ada", company=platform.company, department=platform)
+    bob = Employee.objects.create(slug="bob", name="Bob", company=platform.company, department=platform)
+    now = timezone.now()
+    PerformanceReview.objects.create(employee=ada, feedback="soon", stage='review_scheduled',
+                                     scheduled_date=now + timedelta(days=2))
+    PerformanceReview.objects.create(employee=bob, feedback="later", stage='review_scheduled',
+                                     scheduled_date=now + timedelta(days=20))
+    PerformanceReview.objects.create(employee=bob, feedback="pending")
+
+    def reviews(**params):
+        return listed(staff_client, 'performance-review-list-create', key='feedback', **params)
+
+    assert reviews(employee_slug="bob") == ["later", "pending"]
+    assert reviews(stage='pending_review') == ["pending"]
+    window = {'scheduled_from': now.isoformat(), 'scheduled_to': (now + timedelta(days=7)).isoformat()}
+    assert reviews(stage='review_scheduled', **window) == ["soon"]
+    assert reviews(scheduled_from=(now + timedelta(days=7)).isoformat()) == ["later"]
+    assert reviews(ordering='-created_at') == ["pending", "later", "soon"]
+    assert staff_client.get(reverse('performance-review-list-create'), {'stage': 'done'}).status_code == 400
+
+    response = staff_client.get(reverse('performance-review-export'), {'format': 'ndjson', 'stage': 'pending_review'})
+    assert [json.loads(line)['feedback'] for line in b''.join(response.streaming_content).splitlines()] == ["pending"]
+
+
+@pytest.mark.django_db
+def test_departments_filter_by_company_through_the_cache(staff_client, hierarchy):
+    platform, sales, research = hierarchy
+
+    assert listed(staff_client, 'department-list', company="acme") == sorted([platform.slug, sales.slug])
+    assert listed(staff_client, 'department-list', company="globex") == [research.slug]
+    assert len(listed(staff_client, 'department-list')) == 3
+
+
+@pytest.mark.django_db
+def test_ordering_is_whitelisted_and_pages_through_ties(staff_client, hierarchy):
+    platform, _, _ = hierarchy
+    for index in range(7):
+        Project.objects.create(name=f"p{index}", description="", company=platform.company,
+                               department=platform, start_date=date(2024, 1, 1 + index % 3), end_date=date(2025, 1, 1))
+
+    rows = collect(staff_client, reverse('project-list') + '?ordering=-start_date&page_size=2')
+    assert [(row['start_date'], row['slug']) for row in rows] == sorted(
+        [(row['start_date'], row['slug']) for row in rows], reverse=True)
+    assert len(rows) == 7
+
+    for params in ({'ordering': 'name'}, {'ordering': 'slug,description'}):
+        response = staff_client.get(reverse('project-list'), params)
+        assert response.status_code == 400
+        assert response.data == {'ordering': ["Order by one of: slug, start_date, end_date."]}
+    response = staff_client.get(reverse('department-list'), {'ordering': 'slug'})
+    assert response.data == {'ordering': ["This list has a fixed order."]}
+
+    assert listed(staff_client, 'company-list', ordering='-name') == ["globex", "acme"]
+
+
+@pytest.mark.django_db
+def test_filters_and_ordering_add_no_queries(staff_client, hierarchy):
+    platform, _, _ = hierarchy
+    for index in range(3):
+        Employee.objects.create(slug=f"e{index}", name=f"Name {2 - index}", company=platform.company,
+                                department=platform, position="Engineer")
+
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_client.get(reverse('employee-list'), {
+            'company': "acme", 'position': "Engineer", 'ordering': "name", 'fields': "slug", 'page_size': 2,
+        })
+    assert len(queries) == 1
+    assert [row['slug'] for row in response.data['results']] == ["e2", "e1"]
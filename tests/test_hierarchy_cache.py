@@ -0,0 +1,127 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from company.cache import bump_now
+from company.models import Company, Department, Project
+from user.models import Employee
+
+
+@pytest.fixture
+def department(db):
+    company = Company.objects.create(name="acme")
+    return Department.objects.create(name="ops", company=company)
+
+
+def get(client, url, **headers):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, headers=headers)
+    return response, len(queries)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', ['company-list', 'department-list'])
+def test_list_is_served_from_cache(staff_client, department, url_name):
+    first, _ = get(staff_client, reverse(url_name))
+    second, queries = get(staff_client, reverse(url_name))
+
+    assert queries == 0
+    assert second.data == first.data
+    assert second['ETag'] == first['ETag']
+
+
+@pytest.mark.django_db
+def test_matching_etag_returns_not_modified(staff_client, department):
+    url = reverse('department-detail', args=[department.slug])
+    etag = staff_client.get(url)['ETag']
+
+    response, queries = get(staff_client, url, if_none_match=etag)
+
+    assert response.status_code == 304
+    assert queries == 0
+
+
+@pytest.mark.django_db
+def test_saving_an_employee_invalidates_its_company(staff_client, department, django_capture_on_commit_callbacks):
+    url = reverse('company-detail', args=[department.company.slug])
+    before = staff_client.get(url)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Employee.objects.create(name="New", slug="new", company=department.company, department=department)
+    after, _ = get(staff_client, url, if_none_match=before['ETag'])
+
+    assert after.status_code == 200
+    assert after.data['employee_count'] == before.data['employee_count'] + 1
+
+
+@pytest.mark.django_db
+def test_moving_a_department_invalidates_both_companies(staff_client, department,
+                                                        django_capture_on_commit_callbacks):
+    other = Company.objects.create(name="globex")
+    urls = [reverse('company-detail', args=[slug]) for slug in (department.company.slug, other.slug)]
+    before = [staff_client.get(url).data['department_count'] for url in urls]
+
+    department = Department.objects.get(pk=department.pk)
+    department.company = other
+    with django_capture_on_commit_callbacks(execute=True):
+        department.save()
+
+    assert [staff_client.get(url).data['department_count'] for url in urls] == [before[0] - 1, before[1] + 1]
+
+
+@pytest.mark.django_db
+def test_other_companies_stay_cached(staff_client, department):
+    other = Company.objects.create(name="globex")
+    url = reverse('company-detail', args=[other.slug])
+    staff_client.get(url)
+
+    Employee.objects.create(name="New", slug="new", company=department.company)
+    _, queries = get(staff_client, url)
+
+    assert queries == 0
+
+
+@pytest.mark.django_db
+def test_versions_change_when_the_write_commits(staff_client, department, django_capture_on_commit_callbacks):
+    url = reverse('company-detail', args=[department.company.slug])
+    etag = staff_client.get(url)['ETag']
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        Employee.objects.create(name="New", slug="new", company=department.company, department=department)
+        # Until the commit, readers keep the entry built from committed rows.
+        assert get(staff_client, url, if_none_match=etag)[0].status_code == 304
+    for callback in callbacks:
+        callback()
+
+    assert get(staff_client, url, if_none_match=etag)[0].status_code == 200
+
+
+@pytest.mark.django_db
+def test_a_cascade_bumps_its_company_once(staff_client, department, django_capture_on_commit_callbacks):
+    company = department.company
+    for index in range(5):
+        Employee.objects.create(name=f"E{index}", slug=f"e{index}", company=company, department=department)
+        Project.objects.create(name=f"P{index}", company=company, department=department, description="",
+                               start_date="2025-01-01", end_date="2025-12-31")
+    url = reverse('company-list')
+    etag = staff_client.get(url)['ETag']
+
+    pk = company.pk
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        company.delete()
+
+    bumps = [callback.args for callback in callbacks if getattr(callback, 'func', None) is bump_now]
+    assert bumps == [((pk,),)]
+    assert get(staff_client, url, if_none_match=etag)[0].status_code == 200
+
+
+@pytest.mark.django_db
+def test_if_none_match_is_parsed_as_a_list(staff_client, department):
+    url = reverse('department-detail', args=[department.slug])
+    etag = staff_client.get(url)['ETag']
+
+    for header in (f'"other", W/{etag}', '*', f'{etag}, "other"'):
+        assert get(staff_client, url, if_none_match=header)[0].status_code == 304
+    for header in (etag[1:-1], f'"x{etag[1:-1]}x"', f'"{etag}"'):
+        assert get(staff_client, url, if_none_match=header)[0].status_code == 200
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+
+from company.models import Company, Department
+from user.models import Employee, User
+
+
+@pytest.fixture
+def department(db):
+    company = Company.objects.create(name="acme")
+    return Department.objects.create(name="ops", company=company)
+
+
+def test_import_csv_command(tmp_path, department, disable_employee_signal):
+    User.objects.create_user(username="taken", email="taken@example.com", password="password123")
+    path = tmp_path / "employees.csv"
+    path.write_text(
+        "email,username,password,name,position,hired_on,company,department\n"
+        "ann@a.com,ann,secret123,Ann,Engineer,2024-01-02,acme,ops-acme\n"
+        "ann@b.com,ann-b,,Ann B,Engineer,,acme,\n"
+        "taken@example.com,other,,Dup,,,,\n"
+        "bob@a.com,bob,,Bob,,,nope,\n"
+        "eve@a.com,eve,,Eve,,yesterday,,\n"
+    )
+
+    call_command('import_employees', str(path), batch_size=2, workers=2)
+
+    employees = Employee.objects.select_related('user', 'department').order_by('slug')
+    assert [(e.slug, e.user.email, e.department_id) for e in employees] == [
+        ("ann", "ann@a.com", department.id),
+        ("ann-1", "ann@b.com", None),
+    ]
+    assert employees[0].user.check_password("secret123")
+    assert not employees[1].user.has_usable_password()
+
+
+def test_import_endpoint_accepts_jsonl(staff_client, department):
+    lines = [{'email': f"user{index}@example.com", 'name': f"User {index}", 'company': "acme"} for index in range(5)]
+    upload = SimpleUploadedFile("people.jsonl", "\n".join(json.dumps(line) for line in lines).encode())
+
+    response = staff_client.post(reverse('employee-import-file'), {'file': upload}, format='multipart')
+
+    assert response.status_code == 200
+    assert response.data['created'] == 5
+    assert response.data['skipped'] == 0
+    assert Employee.objects.filter(company=department.company).count() == 5
+
+
+def test_import_endpoint_is_admin_only(api_client, department, disable_employee_signal):
+    user = User.objects.create_user(username="plain", email="plain@example.com", password="password123")
+    api_client.force_authenticate(user=user)
+    upload = SimpleUploadedFile("people.csv", b"email\nx@example.com\n")
+
+    response = api_client.post(reverse('employee-import-file'), {'file': upload}, format='multipart')
+
+    assert response.status_code == 403
+
+
+def test_import_endpoint_reports_unreadable_rows(staff_client, department, settings):
+    settings.EMPLOYEE_IMPORT_BATCH_SIZE = 2
+    lines = [json.dumps({'email': f"user{index}@example.com"}) for index in range(3)]
+    lines[2:2] = ['{"email": ', '[1, 2]', '{"email": 5}']
+    upload = SimpleUploadedFile("people.jsonl", ("\n".join(lines) + "\n").encode())
+
+    response = staff_client.post(reverse('employee-import-file'), {'file': upload}, format='multipart')
+
+    assert response.status_code == 200
+    assert (response.data['created'], response.data['skipped']) == (3, 3)
+    assert [(error['row'], error['error'].split(':')[0]) for error in response.data['errors']] == [
+        (3, "Could not read the row"), (4, "Expected an object."), (5, "Values must be strings."),
+    ]
+    assert User.objects.count() == 4
+
+
+def test_import_command_reports_undecodable_text(tmp_path, department, disable_employee_signal, capsys):
+    path = tmp_path / "employees.csv"
+    rows = "".join(f"user{index}@example.com,User {index}\n" for index in range(2000))
+    path.write_bytes(b"email,name\n" + rows.encode() + b"eve@example.com,\xff\n")
+
+    call_command('import_employees', str(path), batch_size=500, workers=0)
+
+    # The decoder reads ahead, so the rows it had buffered before the bad byte go with it.
+    assert 1000 <= Employee.objects.count() < 2000
+    assert "Could not decode the rest of the file" in capsys.readouterr().err
@@ -0,0 +1,118 @@
+import io
+from datetime import date, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from company.models import Department, Project
+from company.views import CompanyViewSet, DepartmentViewSet, ProjectViewSet
+from performance_review.models import PerformanceReview
+from performance_review.views import PerformanceReviewListCreateView
+from user.models import Employee
+from user.views import EmployeeViewSet
+
+
+@pytest.fixture(scope='module')
+def dataset(django_db_setup, django_db_blocker):
+    """About 100k reviews over 20k employees, with planner statistics gathered."""
+    with django_db_blocker.unblock():
+        call_command('seed_bulk', companies=10, departments=10, employees=20_000, projects=500,
+                     reviews=5, batch_size=10_000, stdout=io.StringIO())
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        yield
+        call_command('flush', interactive=False)
+
+
+def plan(queryset):
+    return queryset.explain()
+
+
+@pytest.mark.django_db
+def test_review_history_uses_employee_created_index(dataset):
+    slug = Employee.objects.values_list('slug', flat=True).first()
+    queryset = PerformanceReview.objects.filter(employee__slug=slug).order_by('created_at')
+
+    assert PerformanceReview.objects.count() == 100_000
+    assert 'review_employee_created_idx' in plan(queryset)
+
+
+@pytest.mark.django_db
+def test_scheduled_reviews_use_stage_scheduled_index(dataset):
+    queryset = PerformanceReview.objects.filter(stage='review_scheduled', scheduled_date__lt=timezone.now())
+
+    assert 'review_stage_scheduled_idx' in plan(queryset)
+
+
+@pytest.mark.django_db
+def test_department_staff_uses_company_department_index(dataset):
+    department = Department.objects.first()
+    queryset = Employee.objects.filter(company=department.company_id, department=department)
+
+    assert 'employee_company_dept_idx' in plan(queryset)
+
+
+@pytest.mark.django_db
+def test_company_department_projects_use_company_department_index(dataset):
+    department = Department.objects.first()
+    queryset = Project.objects.filter(company=department.company_id, department=department)
+
+    assert 'project_company_dept_idx' in plan(queryset)
+
+
+@pytest.mark.django_db
+def test_active_projects_use_department_dates_index(dataset):
+    department = Department.objects.first()
+    day = date(2022, 1, 1)
+    queryset = Project.objects.filter(department=department, start_date__lte=day, end_date__gte=day - timedelta(days=30))
+
+    assert 'project_dept_dates_idx' in plan(queryset)
+
+
+FILTERED_LISTS = [
+    (ProjectViewSet, {'company': 'x'}),
+    (ProjectViewSet, {'department': 'x'}),
+    (ProjectViewSet, {'active_from': '2022-01-01'}),
+    (ProjectViewSet, {'active_to': '2022-01-01'}),
+    (EmployeeViewSet, {'company': 'x', 'department': 'x'}),
+    (EmployeeViewSet, {'position': 'Engineer'}),
+    (EmployeeViewSet, {'hired_from': '2022-01-01', 'hired_to': '2022-02-01'}),
+    (PerformanceReviewListCreateView, {'stage': 'review_scheduled'}),
+    (PerformanceReviewListCreateView, {'scheduled_from': '2030-01-01T00:00:00Z'}),
+    (DepartmentViewSet, {'company': 'x'}),
+]
+
+
+def list_queryset(view_class, params):
+    """The queryset the list endpoint pages through for ``params``."""
+    view = view_class()
+    view.request = Request(APIRequestFactory().get('/', params))
+    view.format_kwarg = None
+    view.action = 'list'
+    view.kwargs = {}
+    queryset = view.filter_queryset(view.get_queryset())
+    return queryset.order_by(*view.paginator.get_ordering(view.request, queryset, view))
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('view_class, params', FILTERED_LISTS)
+def test_list_filters_use_an_index(dataset, view_class, params):
+    table = view_class.queryset.model._meta.db_table
+    # Unordered, so the planner can't prefer walking the ordering index instead.
+    queryset = list_queryset(view_class, params).order_by()
+
+    assert f'SEARCH {table} USING INDEX' in plan(queryset)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('view_class', [CompanyViewSet, EmployeeViewSet, ProjectViewSet, PerformanceReviewListCreateView])
+def test_list_orderings_are_read_from_an_index(dataset, view_class):
+    for field in view_class.ordering_fields:
+        for term in (field, f'-{field}'):
+            queryset = list_queryset(view_class, {'ordering': term})
+
+            assert 'TEMP B-TREE' not in plan(queryset), term
@@ -0,0 +1,39 @@
+import pytest
+from django.urls import reverse
+
+from company.models import Company
+from performance_review.models import PerformanceReview
+from user.models import Employee
+
+
+def collect_pages(client, url):
+    pages = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        pages.append(response.data['results'])
+        url = response.data['next']
+    return pages
+
+
+@pytest.mark.django_db
+def test_companies_are_paginated_by_slug(staff_client):
+    for index in range(5):
+        Company.objects.create(name=f"Company {index}")
+
+    pages = collect_pages(staff_client, reverse('company-list') + '?page_size=2')
+
+    assert [len(page) for page in pages] == [2, 2, 1]
+    slugs = [row['slug'] for page in pages for row in page]
+    assert slugs == sorted(slugs) == sorted(Company.objects.values_list('slug', flat=True))
+
+
+@pytest.mark.django_db
+def test_reviews_are_paginated_by_creation(staff_client):
+    employee = Employee.objects.create(name="Employee", slug="employee")
+    for _ in range(3):
+        PerformanceReview.objects.create(employee=employee)
+
+    pages = collect_pages(staff_client, reverse('performance-review-list-create') + '?page_size=2')
+
+    assert [len(page) for page in pages] == [2, 1]
@@ -0,0 +1,73 @@
+import threading
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.contrib.auth import hashers
+from django.test import AsyncClient
+from django.urls import reverse
+
+from user.models import User
+
+CREDENTIALS = {'email': "ada@example.com", 'password': "correct horse"}
+REGISTRATION = {**CREDENTIALS, 'username': "ada", 'role': User.ROLES.EMPLOYEE}
+
+
+@pytest.fixture
+def cheap_hashing(settings):
+    settings.PASSWORD_SCRYPT_WORK_FACTOR = 2**10
+    settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+    return settings
+
+
+def stored_hash():
+    return User.objects.get(email=CREDENTIALS['email']).password
+
+
+@pytest.mark.django_db
+def test_new_passwords_use_the_configured_scrypt(api_client, cheap_hashing):
+    response = api_client.post(reverse('register'), REGISTRATION, format='json')
+
+    assert response.status_code == 201
+    algorithm, work_factor, _, block_size, parallelism, _ = stored_hash().split('$')
+    assert (algorithm, work_factor, block_size, parallelism) == ("scrypt", "1024", "8", "5")
+
+
+@pytest.mark.django_db
+def test_login_rehashes_with_the_current_hasher_and_parameters(api_client, cheap_hashing):
+    password = hashers.make_password(CREDENTIALS['password'], hasher='pbkdf2_sha256')
+    User.objects.create(username="ada", email=CREDENTIALS['email'], password=password)
+
+    assert api_client.post(reverse('token_obtain_pair'), {**CREDENTIALS, 'password': "wrong"}).status_code == 401
+    assert stored_hash().startswith("pbkdf2_sha256$1000$")
+    assert api_client.post(reverse('token_obtain_pair'), CREDENTIALS).status_code == 200
+    assert stored_hash().startswith("scrypt$1024$")
+
+    cheap_hashing.PASSWORD_SCRYPT_WORK_FACTOR = 2**11
+    assert api_client.post(reverse('token_obtain_pair'), CREDENTIALS).status_code == 200
+    assert stored_hash().startswith("scrypt$2048$")
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_login_and_register_hash_on_the_pool(api_client, cheap_hashing):
+    threads = set()
+    verify_password = hashers.verify_password
+
+    def record_thread(*args, **kwargs):
+        threads.add(threading.current_thread().name)
+        return verify_password(*args, **kwargs)
+
+    async def post(url_name, data):
+        response = await AsyncClient().post(reverse(url_name), data, content_type='application/json')
+        return response.status_code, response.json()
+
+    assert async_to_sync(post)('async-register', REGISTRATION)[0] == 201
+    with mock.patch.object(hashers, 'verify_password', record_thread):
+        status, body = async_to_sync(post)('async-token-obtain-pair', CREDENTIALS)
+        failed = async_to_sync(post)('async-token-obtain-pair', {**CREDENTIALS, 'password': "wrong"})
+
+    assert status == 200 and set(body) == {'refresh', 'access'}
+    assert failed == (401, api_client.post(reverse('token_obtain_pair'), {**CREDENTIALS, 'password': "wrong"}).json())
+    assert threads and all(name.startswith("password-hash") for name in threads)
+    duplicate = (400, api_client.post(reverse('register'), REGISTRATION).json())
+    assert async_to_sync(post)('async-register', REGISTRATION) == duplicate
@@ -0,0 +1,76 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from company.models import Company, Department, Project
+from user.models import Employee
+
+
+def make_company(index):
+    company = Company.objects.create(name=f"Company {index}")
+    department = Department.objects.create(name="Engineering", company=company)
+    for number in range(2):
+        Employee.objects.create(
+            name=f"Employee {index}-{number}",
+            slug=f"employee-{index}-{number}",
+            company=company,
+            department=department,
+        )
+    Project.objects.create(
+        name="Platform",
+        company=company,
+        department=department,
+        description="",
+        start_date="2025-01-01",
+        end_date="2025-12-31",
+    )
+    return company
+
+
+def count_queries(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(queries), response
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', ['company-list', 'admin-company-list'])
+def test_company_list_query_count_is_constant(staff_client, django_capture_on_commit_callbacks, url_name):
+    url = reverse(url_name)
+    make_company(0)
+    baseline, _ = count_queries(staff_client, url)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        for index in range(1, 10):
+            make_company(index)
+    queries, response = count_queries(staff_client, url)
+
+    assert queries == baseline
+    assert str(response.data).count("'employee_count': 2") == 10
+
+
+@pytest.mark.django_db
+def test_company_counts_are_stored():
+    company = make_company(0)
+    company.refresh_from_db()
+
+    assert (company.department_count, company.employee_count, company.project_count) == (1, 2, 1)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url_name', ['project-list', 'admin-project-list'])
+def test_project_list_query_count_is_constant(staff_client, url_name):
+    url = reverse(url_name)
+    make_company(0)
+    baseline, _ = count_queries(staff_client, url)
+
+    for index in range(1, 10):
+        company = make_company(index)
+        company.projects.get().assigned_employees.set(company.employees.all())
+    queries, response = count_queries(staff_client, url)
+
+    assert queries == baseline
+    assert len(response.data['results']) == 10
+    assert response.data['results'][-1]['assigned_employees'] == ["Employee 9-0", "Employee 9-1"]
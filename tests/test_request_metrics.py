@@ -0,0 +1,95 @@
+import json
+import logging
+import re
+import time
+from unittest import mock
+
+import pytest
+from django.test import Client
+from django.urls import reverse
+from rest_framework_simplejwt.authentication import JWTStatelessUserAuthentication
+from rest_framework_simplejwt.tokens import AccessToken
+
+from company.models import Company, Department
+from company.serializers import DepartmentSerializer
+from company.views import DepartmentViewSet
+
+
+@pytest.fixture
+def departments(db):
+    company = Company.objects.create(name="acme")
+    return [Department.objects.create(name=f"Team {index}", company=company) for index in range(5)]
+
+
+@pytest.fixture
+def metrics_log(caplog):
+    # main.metrics doesn't propagate to the root logger caplog listens on.
+    logger = logging.getLogger('main.metrics')
+    logger.addHandler(caplog.handler)
+    yield caplog
+    logger.removeHandler(caplog.handler)
+
+
+def server_timing(response):
+    return dict(re.findall(r'(\w+);dur=([\d.]+)', response['Server-Timing']))
+
+
+@pytest.mark.django_db
+def test_server_timing_header(staff_client, departments):
+    response = staff_client.get(reverse('company-list'))
+
+    timings = server_timing(response)
+    assert set(timings) == {'db', 'auth', 'serialize', 'app', 'render', 'total'}
+    assert float(timings['total']) >= float(timings['db'])
+    assert 'desc="1 queries"' in response['Server-Timing']
+
+
+@pytest.mark.django_db
+def test_structured_log_line(staff_client, departments, metrics_log):
+    staff_client.get(reverse('company-list'))
+
+    record = json.loads(metrics_log.records[-1].getMessage())
+    assert record['view'] == 'company-list'
+    assert record['status'] == 200
+    assert record['queries'] == 1
+    assert {'auth_ms', 'serialize_ms', 'app_ms'} <= set(record)
+
+
+@pytest.mark.django_db
+def test_authentication_and_serialization_are_timed_apart(staff_user, departments, monkeypatch):
+    def slow(function, seconds):
+        def wrapper(*args, **kwargs):
+            time.sleep(seconds)
+            return function(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(JWTStatelessUserAuthentication, 'authenticate',
+                        slow(JWTStatelessUserAuthentication.authenticate, 0.05))
+    monkeypatch.setattr(DepartmentSerializer, 'to_representation', slow(DepartmentSerializer.to_representation, 0.02))
+    client = Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(staff_user)}")
+    response = client.get(reverse('department-list'))
+
+    timings = {phase: float(duration) for phase, duration in server_timing(response).items()}
+    assert 50 <= timings['auth'] < 100
+    assert 100 <= timings['serialize'] < 150
+    assert timings['app'] < 50
+
+
+@pytest.mark.django_db
+def test_repeated_statements_are_logged_over_threshold(staff_client, departments, metrics_log, settings):
+    settings.REQUEST_METRICS_QUERY_THRESHOLD = 3
+    # Without select_related each department loads its company on its own: an N+1.
+    with mock.patch.object(DepartmentViewSet, 'get_queryset', lambda view: Department.objects.order_by('slug')):
+        staff_client.get(reverse('department-list'))
+
+    warnings = [record for record in metrics_log.records if record.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    duplicates = json.loads(warnings[0].getMessage())['duplicates']
+    assert duplicates[0]['count'] == len(departments)
+
+
+@pytest.mark.django_db
+def test_nothing_extra_is_logged_under_threshold(staff_client, departments, metrics_log):
+    staff_client.get(reverse('department-list'))
+
+    assert [record.levelno for record in metrics_log.records] == [logging.INFO]
@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+import pytest
+from django.urls import reverse
+from django.utils import timezone
+
+from company.models import Company, Department
+from performance_review.models import PerformanceReview, ReviewTransition, TransitionConflict
+from user.models import Employee
+
+START = timezone.now() - timedelta(days=30)
+
+
+@pytest.fixture
+def company(db):
+    return Company.objects.create(name="acme")
+
+
+@pytest.fixture
+def employee(company):
+    department = Department.objects.create(name="Sales", company=company)
+    return Employee.objects.create(name="Reviewee", company=company, department=department)
+
+
+def history(review):
+    return list(review.transitions.order_by('created_at', 'id').values_list('from_stage', 'stage'))
+
+
+def with_stays(employee, *hours):
+    """A review whose successive stages lasted ``hours``, plus one still open."""
+    review = PerformanceReview.objects.create(employee=employee)
+    review.transitions.all().delete()
+    stages = ['pending_review', 'review_scheduled', 'feedback_provided', 'under_approval', 'review_approved']
+    entered = START
+    for index, duration in enumerate([*hours, 1]):
+        ReviewTransition.objects.create(review=review, from_stage=stages[index - 1] if index else None,
+                                        stage=stages[index], created_at=entered)
+        entered += timedelta(hours=duration)
+    return review
+
+
+@pytest.mark.django_db
+def test_every_change_appends_an_event(employee):
+    review = PerformanceReview.objects.create(employee=employee)
+    review.transition_to('review_scheduled')
+    PerformanceReview.objects.bulk_transition([review.pk], 'feedback_provided', feedback="Good", reviewed_by=employee)
+
+    assert history(review) == [
+        (None, 'pending_review'),
+        ('pending_review', 'review_scheduled'),
+        ('review_scheduled', 'feedback_provided'),
+    ]
+    last = review.transitions.latest('created_at')
+    assert (last.feedback, last.reviewed_by) == ("Good", employee)
+
+
+@pytest.mark.django_db
+def test_lost_race_and_invalid_moves_leave_no_event(employee):
+    review = PerformanceReview.objects.create(employee=employee)
+    stale = PerformanceReview.objects.get(pk=review.pk)
+    review.transition_to('review_scheduled')
+
+    with pytest.raises(TransitionConflict):
+        stale.transition_to('review_scheduled')
+    PerformanceReview.objects.bulk_transition([review.pk], 'review_approved')
+
+    assert len(history(review)) == 2
+
+
+class RivalFirst(dict):
+    """``TRANSITIONS`` under which another request moves ``rival``, recording it, once the stages are read."""
+
+    def __init__(self, rival, stage):
+        super().__init__(PerformanceReview.TRANSITIONS)
+        self.rival = (rival, stage)
+
+    def get(self, *args):
+        if self.rival:
+            (rival, stage), self.rival = self.rival, None
+            rival.transition_to(stage)
+        return super().get(*args)
+
+
+@pytest.mark.django_db
+def test_a_move_another_request_made_first_is_recorded_once(employee, monkeypatch):
+    reviews = [PerformanceReview.objects.create(employee=employee) for _ in range(2)]
+    monkeypatch.setattr(PerformanceReview, 'TRANSITIONS',
+                        RivalFirst(PerformanceReview.objects.get(pk=reviews[0].pk), 'review_scheduled'))
+
+    PerformanceReview.objects.bulk_transition([review.pk for review in reviews], 'review_scheduled')
+
+    expected = [(None, 'pending_review'), ('pending_review', 'review_scheduled')]
+    assert [history(review) for review in reviews] == [expected, expected]
+
+
+@pytest.mark.django_db
+def test_events_are_append_only(employee):
+    event = PerformanceReview.objects.create(employee=employee).transitions.get()
+    event.stage = 'review_approved'
+
+    with pytest.raises(ValueError):
+        event.save()
+
+
+@pytest.mark.django_db
+def test_dwell_time_percentiles(employee, company):
+    for hours in range(1, 11):
+        with_stays(employee, hours, 2 * hours)
+    other = Company.objects.create(name="other")
+    with_stays(Employee.objects.create(name="Elsewhere", company=other), 1000, 1000)
+
+    stages = {row['stage']: row for row in ReviewTransition.objects.dwell_times(company_id=company.pk)}
+
+    pending = stages['pending_review']
+    assert pending['count'] == 10
+    assert pending['p50'] == pytest.approx(5 * 3600)
+    assert pending['p90'] == pytest.approx(9 * 3600)
+    assert pending['p95'] == pytest.approx(10 * 3600)
+    assert pending['mean'] == pytest.approx(5.5 * 3600)
+    assert stages['review_scheduled']['max'] == pytest.approx(20 * 3600)
+    # Only finished stays count; the reviews are still in feedback_provided.
+    assert set(stages) == {'pending_review', 'review_scheduled'}
+
+
+@pytest.mark.django_db
+def test_dwell_time_endpoint(staff_client, employee, company):
+    with_stays(employee, 3)
+    url = reverse('performance-review-dwell-times')
+
+    response = staff_client.get(url, {'department': employee.department.slug})
+
+    assert response.status_code == 200
+    assert response.data['department'] == employee.department.slug
+    assert response.data['stages'][0]['stage'] == 'pending_review'
+    assert response.data['stages'][0]['p50'] == pytest.approx(3 * 3600)
+    assert staff_client.get(url).status_code == 400
+    assert staff_client.get(url, {'company': 'nope'}).status_code == 400
@@ -0,0 +1,69 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from company.models import Company, Department
+from performance_review.models import PerformanceReview
+from user.models import Employee
+
+
+@pytest.fixture
+def pipeline(db):
+    now = timezone.now()
+    acme = Company.objects.create(name="acme")
+    sales = Department.objects.create(name="Sales", company=acme)
+    support = Department.objects.create(name="Support", company=acme)
+    other = Company.objects.create(name="other")
+    ops = Department.objects.create(name="Ops", company=other)
+
+    def review(department, stage, scheduled_date=None):
+        employee = Employee.objects.create(name="Reviewee", company=department.company, department=department)
+        return PerformanceReview.objects.create(employee=employee, stage=stage, scheduled_date=scheduled_date)
+
+    review(sales, 'pending_review')
+    review(sales, 'review_scheduled', now - timedelta(days=2))
+    review(sales, 'review_scheduled', now + timedelta(days=2))
+    review(support, 'review_approved')
+    review(ops, 'review_scheduled', now - timedelta(hours=1))
+    return acme, sales, support, other
+
+
+@pytest.mark.django_db
+def test_summary_is_one_query(pipeline):
+    acme, sales, support, other = pipeline
+
+    with CaptureQueriesContext(connection) as queries:
+        summary = PerformanceReview.objects.summary()
+
+    assert len(queries) == 1
+    assert (summary['total'], summary['overdue']) == (5, 2)
+    assert summary['by_stage']['review_scheduled'] == 3
+    companies = {company['company']: company for company in summary['companies']}
+    assert companies[acme.slug]['total'] == 4
+    assert companies[acme.slug]['overdue'] == 1
+    assert companies[other.slug]['overdue'] == 1
+    departments = {department['department']: department for department in companies[acme.slug]['departments']}
+    assert departments[sales.slug]['by_stage'] == {
+        'pending_review': 1, 'review_scheduled': 2, 'feedback_provided': 0,
+        'under_approval': 0, 'review_approved': 0, 'review_rejected': 0,
+    }
+    assert departments[support.slug]['by_stage']['review_approved'] == 1
+
+
+@pytest.mark.django_db
+def test_summary_endpoint_is_cached_briefly(staff_client, pipeline, settings):
+    url = reverse('performance-review-summary')
+    assert staff_client.get(url).data['total'] == 5
+    PerformanceReview.objects.create(employee=Employee.objects.first())
+
+    with CaptureQueriesContext(connection) as queries:
+        cached = staff_client.get(url)
+    assert cached.data['total'] == 5
+    assert len(queries) == 0
+
+    settings.REVIEW_SUMMARY_CACHE_TIMEOUT = 0
+    assert staff_client.get(url).data['total'] == 6
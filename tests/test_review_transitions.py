@@ -0,0 +1,88 @@
+import threading
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from company.models import Company, Department
+from performance_review.models import PerformanceReview, TransitionConflict
+from performance_review.views import PerformanceReviewTransitionView
+from user.models import Employee
+
+
+@pytest.fixture
+def review(db):
+    company = Company.objects.create(name="acme")
+    department = Department.objects.create(name="Sales", company=company)
+    employee = Employee.objects.create(name="Reviewee", company=company, department=department)
+    return PerformanceReview.objects.create(employee=employee, feedback="Keep me")
+
+
+@pytest.mark.django_db
+def test_transition_writes_only_the_changed_fields(staff_client, review):
+    url = reverse('performance-review-transition', args=[review.pk])
+
+    with CaptureQueriesContext(connection) as queries:
+        response = staff_client.post(url, {'stage': 'review_scheduled'}, format='json')
+
+    assert response.status_code == 200
+    assert response.data == {'detail': "Transitioned to review_scheduled successfully."}
+    update = next(query['sql'] for query in queries.captured_queries if query['sql'].startswith('UPDATE'))
+    assert '"feedback"' not in update
+    assert '"stage" = ' in update.split('WHERE')[1]
+    review.refresh_from_db()
+    assert (review.stage, review.feedback) == ('review_scheduled', "Keep me")
+
+
+@pytest.mark.django_db
+def test_invalid_transition_is_a_bad_request(staff_client, review):
+    url = reverse('performance-review-transition', args=[review.pk])
+
+    response = staff_client.post(url, {'stage': 'review_approved'}, format='json')
+
+    assert response.status_code == 400
+    assert response.data == {'detail': "Invalid transition from pending_review to review_approved"}
+
+
+@pytest.mark.django_db
+def test_losing_the_race_is_a_conflict(staff_client, review):
+    stale = PerformanceReview.objects.get(pk=review.pk)
+    PerformanceReview.objects.get(pk=review.pk).transition_to('review_scheduled')
+
+    with mock.patch.object(PerformanceReviewTransitionView, 'get_object', return_value=stale):
+        response = staff_client.post(reverse('performance-review-transition', args=[review.pk]),
+                                     {'stage': 'review_scheduled'}, format='json')
+
+    assert response.status_code == 409
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_transitions_have_one_winner(review):
+    # The test database is a file (see main/database.py), so each thread gets
+    # its own connection to the same database, as gunicorn workers would.
+    threads = 8
+    barrier = threading.Barrier(threads)
+    outcomes = []
+
+    def transition():
+        try:
+            instance = PerformanceReview.objects.get(pk=review.pk)
+            barrier.wait()
+            try:
+                instance.transition_to('review_scheduled')
+                outcomes.append('won')
+            except TransitionConflict:
+                outcomes.append('conflict')
+        finally:
+            connection.close()
+
+    workers = [threading.Thread(target=transition) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert sorted(outcomes) == ['conflict'] * (threads - 1) + ['won']
+    assert PerformanceReview.objects.get(pk=review.pk).stage == 'review_scheduled'
@@ -0,0 +1,30 @@
+from drf_spectacular.generators import SchemaGenerator
+
+
+def generate():
+    return SchemaGenerator().get_schema(request=None, public=True)
+
+
+def test_token_authenticated_endpoints_document_the_bearer_scheme():
+    schema = generate()
+
+    assert schema['components']['securitySchemes']['jwtAuth']['scheme'] == 'bearer'
+    assert {'jwtAuth': []} in schema['paths']['/api/employees/']['get']['security']
+    assert {'jwtAuth': []} in schema['paths']['/api/projects/bulk-assign/']['post']['security']
+
+
+def test_review_summary_documents_its_response():
+    schema = generate()
+
+    response = schema['paths']['/api/performance-reviews/summary/']['get']['responses']['200']
+    assert response['content']['application/json']['schema'] == {
+        '$ref': '#/components/schemas/PerformanceReviewSummary'}
+    assert {'generated_at', 'total', 'overdue', 'by_stage', 'companies'} <= set(
+        schema['components']['schemas']['PerformanceReviewSummary']['properties'])
+
+
+def test_review_export_documents_its_formats():
+    operation = generate()['paths']['/api/performance-reviews/export/']['get']
+
+    assert set(operation['responses']['200']['content']) == {'text/csv', 'application/x-ndjson'}
+    assert [parameter['name'] for parameter in operation['parameters']] == ['format']
@@ -0,0 +1,153 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from company.models import Company, Department, Project
+from user.models import Employee
+
+
+@pytest.fixture
+def acme(db):
+    company = Company.objects.create(name="acme")
+    department = Department.objects.create(name="Platform Engineering", company=company)
+    return company, department
+
+
+def make_project(department, name, description):
+    return Project.objects.create(name=name, company=department.company, department=department,
+                                  description=description, start_date="2025-01-01", end_date="2025-12-31")
+
+
+def search(client, **params):
+    response = client.get(reverse('search'), params)
+    assert response.status_code == 200, response.data
+    return response.data
+
+
+def found(client, q, **params):
+    return [(row['type'], row['name']) for row in search(client, q=q, **params)['results']]
+
+
+@pytest.mark.django_db
+def test_documents_follow_saves_and_deletes(staff_client, acme):
+    company, department = acme
+    employee = Employee.objects.create(name="Ada Lovelace", position="Analyst", company=company, department=department)
+
+    assert found(staff_client, "ada lov") == [('employee', "Ada Lovelace")]
+    assert found(staff_client, "analy") == [('employee', "Ada Lovelace")]
+    assert found(staff_client, "ada grace") == []
+
+    employee.name = "Grace Hopper"
+    employee.save()
+    assert found(staff_client, "ada") == []
+    assert found(staff_client, "hopp") == [('employee', "Grace Hopper")]
+
+    company.delete()
+    assert found(staff_client, "hopp") == found(staff_client, "acme") == found(staff_client, "platform") == []
+
+
+@pytest.mark.django_db
+def test_results_are_ranked_and_link_to_their_object(staff_client, acme):
+    _, department = acme
+    make_project(department, "Atlas", "Move billing onto the platform")
+    project = make_project(department, "Platform", "")
+
+    data = search(staff_client, q="platf")
+
+    assert [(row['type'], row['name']) for row in data['results']] == [
+        ('project', "Platform"), ('department', "Platform Engineering"), ('project', "Atlas"),
+    ]
+    assert data['results'][0]['url'] == f"http://testserver{reverse('project-detail', args=[project.slug])}"
+    assert found(staff_client, "platf", type='project') == [('project', "Platform"), ('project', "Atlas")]
+
+
+@pytest.mark.django_db
+def test_pages_follow_limit_and_offset(staff_client, acme, settings):
+    _, department = acme
+    for index in range(5):
+        make_project(department, f"Migration {index}", "")
+
+    with CaptureQueriesContext(connection) as queries:
+        first = search(staff_client, q="migration", limit=2)
+    assert len(queries) == 1
+
+    second = staff_client.get(first['next']).data
+    third = staff_client.get(second['next']).data
+    assert first['previous'] is None
+    assert [len(page['results']) for page in (first, second, third)] == [2, 2, 1]
+    assert third['next'] is None
+    assert staff_client.get(second['previous']).data == first
+    names = [row['name'] for page in (first, second, third) for row in page['results']]
+    assert sorted(names) == [f"Migration {index}" for index in range(5)]
+
+    settings.SEARCH_MAX_MATCHES = 3
+    assert len(search(staff_client, q="migration")['results']) == 5
+    assert len(search(staff_client, q="mi")['results']) == 3
+    first = search(staff_client, q="mi", limit=2)
+    last = staff_client.get(first['next']).data
+    assert len(last['results']) == 1
+    assert last['next'] is None
+    with CaptureQueriesContext(connection) as queries:
+        assert search(staff_client, q="mi", offset=3)['results'] == []
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_name_matches_outrank_many_earlier_body_matches(staff_client, acme, settings):
+    _, department = acme
+    settings.SEARCH_MAX_MATCHES = 3
+    for index in range(5):
+        make_project(department, f"Plan {index}", "Move billing to the new ledger")
+    make_project(department, "Ledger", "")
+
+    assert found(staff_client, "ledger", limit=1) == [('project', "Ledger")]
+
+
+@pytest.mark.django_db
+def test_queries_are_validated(staff_client, acme):
+    assert APIClient().get(reverse('search'), {'q': "acme"}).status_code == 401
+    assert staff_client.get(reverse('search')).data == {'q': ["This field is required."]}
+    assert staff_client.get(reverse('search'), {'q': "-*\"'"}).data == {'q': ["Enter at least one letter or digit."]}
+    assert staff_client.get(reverse('search'), {'q': "acme", 'type': "user"}).status_code == 400
+    # FTS5 and tsquery operators are searched for as words.
+    assert found(staff_client, 'acme OR "x" NEAR(') == []
+    assert found(staff_client, 'acme-') == [('company', "acme")]
+
+
+@pytest.mark.django_db
+def test_bulk_writers_and_reindex_keep_the_documents(staff_client, acme):
+    call_command('seed_bulk', companies=2, departments=1, employees=4, projects=1, stdout=io.StringIO())
+    assert len(found(staff_client, "seed", type='company')) == 2
+    assert len(found(staff_client, "seed", type='employee')) == 0
+    assert len(search(staff_client, q="e", type='employee')['results']) > 0
+
+    Employee.objects.update(name="Renamed")
+    assert found(staff_client, "renamed") == []
+
+    out = io.StringIO()
+    call_command('reindex', stdout=out)
+
+    assert len(found(staff_client, "renamed")) == Employee.objects.count() == 4
+    assert "Indexed 12 documents" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_a_cascade_unindexes_each_kind_in_one_query(staff_client, acme):
+    company, department = acme
+    for index in range(5):
+        Employee.objects.create(name=f"Staff {index}", company=company, department=department)
+        make_project(department, f"Plan {index}", "")
+    Employee.objects.create(name="Staff elsewhere")
+
+    with CaptureQueriesContext(connection) as queries:
+        company.delete()
+
+    unindexing = [query for query in queries if 'DELETE FROM "search_searchdocument"' in query['sql']]
+    assert len(unindexing) == 4
+    assert found(staff_client, "staff") == [('employee', "Staff elsewhere")]
+    assert found(staff_client, "plan") == found(staff_client, "acme") == []
@@ -0,0 +1,57 @@
+import io
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from company.models import Company, Department, Project
+from user.models import Employee, User
+
+
+def snapshot():
+    return {
+        'companies': list(Company.objects.order_by('slug').values_list('slug', flat=True)),
+        'employees': list(Employee.objects.order_by('slug').values_list(
+            'slug', 'name', 'position', 'hired_on', 'department__slug')),
+        'projects': list(Project.objects.order_by('slug').values_list('slug', 'start_date', 'end_date')),
+        'assignments': sorted(Project.assigned_employees.through.objects.values_list(
+            'project__slug', 'employee__slug')),
+    }
+
+
+@pytest.mark.django_db
+def test_seed_bulk_creates_requested_cardinalities():
+    with CaptureQueriesContext(connection) as queries:
+        call_command('seed_bulk', companies=3, departments=2, employees=100, projects=4, assignments=3,
+                     batch_size=40, stdout=io.StringIO())
+
+    assert Company.objects.count() == 3
+    assert Department.objects.count() == 6
+    assert Employee.objects.count() == User.objects.count() == 100
+    assert Project.objects.count() == 12
+    assert Project.assigned_employees.through.objects.count() == 36
+    assert len(queries) < 60
+    assert User.objects.first().check_password('password123')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_seed_bulk_is_deterministic():
+    options = dict(companies=2, departments=3, employees=50, projects=5, seed=7, stdout=io.StringIO())
+    call_command('seed_bulk', **options)
+    first = snapshot()
+    User.objects.all().delete()
+    Company.objects.all().delete()
+
+    call_command('seed_bulk', **options)
+
+    assert snapshot() == first
+
+
+@pytest.mark.django_db
+def test_seed_bulk_runs_again_with_another_seed():
+    for seed in (1, 2):
+        call_command('seed_bulk', companies=1, departments=1, employees=5, projects=1, seed=seed, stdout=io.StringIO())
+
+    assert User.objects.filter(username__startswith="seed2-").count() == 5
+    assert Employee.objects.count() == 10
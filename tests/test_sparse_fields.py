@@ -0,0 +1,91 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from company.models import Company, Department, Project
+from performance_review.models import PerformanceReview
+from user.models import Employee
+
+
+@pytest.fixture
+def project(db):
+    company = Company.objects.create(name="acme")
+    department = Department.objects.create(name="Sales", company=company)
+    employee = Employee.objects.create(name="Ada", company=company, department=department, hired_on="2024-01-01")
+    project = Project.objects.create(name="Platform", company=company, department=department, description="",
+                                     start_date="2025-01-01", end_date="2025-12-31")
+    project.assigned_employees.add(employee)
+    return project
+
+
+def get(client, url, **params):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url, params)
+    assert response.status_code == 200
+    return response.data, [query['sql'] for query in queries.captured_queries]
+
+
+@pytest.mark.django_db
+def test_default_output_is_unchanged(staff_client, project):
+    data, _ = get(staff_client, reverse('project-detail', args=[project.slug]))
+
+    assert (data['company'], data['department'], data['assigned_employees']) == ("acme", "Sales", ["Ada"])
+    employee, _ = get(staff_client, reverse('employee-detail', args=["ada"]))
+    assert list(employee) == ['slug', 'company', 'department', 'name', 'mobile', 'address', 'position', 'hired_on',
+                              'get_days_employed']
+
+
+@pytest.mark.django_db
+def test_fields_selects_only_the_requested_columns(staff_client, project):
+    data, queries = get(staff_client, reverse('project-list'), fields='slug,name')
+
+    assert data['results'] == [{'slug': project.slug, 'name': "Platform"}]
+    select = queries[-1]
+    assert 'JOIN' not in select and '"description"' not in select
+    assert not any('assigned_employees' in query for query in queries)
+
+
+@pytest.mark.django_db
+def test_expand_controls_joins(staff_client, project):
+    url = reverse('project-detail', args=[project.slug])
+
+    plain, queries = get(staff_client, url, expand='')
+    assert (plain['company'], plain['department']) == (project.company.slug, project.department.slug)
+    assert plain['assigned_employees'] == [Employee.objects.get().pk]
+    assert not any('"company_company"."name"' in query for query in queries)
+
+    expanded, _ = get(staff_client, url, expand='company', fields='company,department')
+    assert expanded == {'company': "acme", 'department': project.department.slug}
+
+
+@pytest.mark.django_db
+def test_computed_fields_load_their_sources(staff_client, project):
+    data, queries = get(staff_client, reverse('employee-list'), fields='get_days_employed', expand='')
+
+    assert list(data['results'][0]) == ['get_days_employed']
+    assert data['results'][0]['get_days_employed'] > 0
+    assert len(queries) == 1
+
+
+@pytest.mark.django_db
+def test_writes_ignore_the_parameters(staff_client, project):
+    employee = Employee.objects.get()
+    url = reverse('performance-review-list-create') + '?fields=stage'
+
+    response = staff_client.post(url, {'employee': employee.slug}, format='json')
+
+    assert response.status_code == 201
+    assert response.data['employee'] == employee.slug
+    assert PerformanceReview.objects.count() == 1
+    assert list(staff_client.get(url).data['results'][0]) == ['stage']
+
+
+@pytest.mark.django_db
+def test_review_list_is_narrowed(staff_client, project):
+    PerformanceReview.objects.create(employee=Employee.objects.get(), feedback="Long feedback")
+
+    data, queries = get(staff_client, reverse('performance-review-list-create'), fields='stage')
+
+    assert data['results'] == [{'stage': 'pending_review'}]
+    assert '"feedback"' not in queries[-1]
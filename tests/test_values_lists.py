@@ -0,0 +1,106 @@
+import datetime
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from company.models import Company, Department, Project
+from company.serializers import ProjectSerializer
+from main.renderers import ORJSONRenderer
+from performance_review.models import PerformanceReview
+from performance_review.serializers import PerformanceReviewCreateSerializer
+from user.models import Employee
+from user.serializers import EmployeeSerializer
+
+
+@pytest.fixture
+def dataset(db):
+    company = Company.objects.create(name="acme")
+    department = Department.objects.create(name="Research & Développement", company=company)
+    employees = [
+        Employee.objects.create(name=f"Émile {index} \"quoted\"\t", company=company, department=department,
+                                mobile="+1 555", address="1 Main St\nSpringfield", position="Engineer",
+                                hired_on=datetime.date(2024, 1, 1 + index) if index % 2 else None)
+        for index in range(5)
+    ]
+    Employee.objects.create(name="Unassigned")
+    for index in range(3):
+        project = Project.objects.create(name=f"Project {index}", company=company, department=department,
+                                         description="Ünïcode 😀", start_date="2024-01-01", end_date="2024-12-31")
+        project.assigned_employees.set(reversed(employees[index:]))
+    now = timezone.now()
+    for index, employee in enumerate(employees):
+        PerformanceReview.objects.create(employee=employee, stage='review_scheduled', feedback=None if index else "ok",
+                                         scheduled_date=now + datetime.timedelta(days=index, microseconds=index),
+                                         reviewed_by=employees[0] if index else None)
+    return employees
+
+
+def pages(client, url):
+    """Every page's raw body, following the cursor links."""
+    bodies = []
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        bodies.append(response.content)
+        url = response.json()['next']
+    return bodies
+
+
+LISTS = [
+    reverse('employee-list') + '?page_size=2',
+    reverse('employee-list') + '?company=acme&ordering=-name&page_size=2',
+    reverse('project-list') + '?page_size=2',
+    reverse('project-list') + '?ordering=-start_date&page_size=2',
+    reverse('performance-review-list-create') + '?page_size=2',
+    reverse('performance-review-list-create') + '?stage=review_scheduled&ordering=-created_at&page_size=3',
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('url', LISTS)
+def test_values_lists_match_the_serializers_byte_for_byte(staff_client, dataset, settings, monkeypatch, url):
+    settings.FAST_LIST_RESPONSES = False
+    with CaptureQueriesContext(connection) as queries:
+        expected = pages(staff_client, url)
+    serialized_queries = len(queries)
+
+    settings.FAST_LIST_RESPONSES = True
+    for serializer in (EmployeeSerializer, ProjectSerializer, PerformanceReviewCreateSerializer):
+        monkeypatch.setattr(serializer, 'to_representation', lambda *args: pytest.fail("serializer used"))
+    with CaptureQueriesContext(connection) as queries:
+        assert pages(staff_client, url) == expected
+    assert len(queries) <= serialized_queries
+    assert len(expected) > 1
+
+
+@pytest.mark.django_db
+def test_other_reads_keep_the_serializers(staff_client, dataset, settings):
+    sparse = staff_client.get(reverse('employee-list'), {'fields': 'slug,company', 'expand': ''})
+    assert sparse.json()['results'][0] == {'slug': dataset[0].slug, 'company': dataset[0].company_id}
+
+    browsable = staff_client.get(reverse('project-list'), HTTP_ACCEPT='text/html')
+    assert browsable['Content-Type'].startswith('text/html')
+
+    settings.FAST_LIST_RESPONSES = False
+    assert staff_client.get(reverse('employee-list'), {'fields': 'slug,company', 'expand': ''}).content == sparse.content
+
+
+def test_orjson_renderer_matches_json_renderer():
+    data = {
+        'when': datetime.datetime(2024, 5, 1, 12, 30, 0, 123456, tzinfo=datetime.timezone.utc),
+        'day': datetime.date(2024, 5, 1),
+        'id': uuid.UUID(int=7),
+        'amount': Decimal('1.50'),
+        'text': "line separator  \x00 é 😀 </script>",
+        'nested': [{1: None, 'ok': True}],
+        'big': 2 ** 70,
+    }
+    for media_type in ('application/json', 'application/json; indent=2'):
+        assert ORJSONRenderer().render(data, media_type) == JSONRenderer().render(data, media_type)
+    assert ORJSONRenderer().render(None) == b''
@@ -6,4 +6,5 @@ class UserConfig(AppConfig):
     name = 'user'
 
     def ready(self):
-        import user.signals
\ No newline at end of file
+        import user.schema
+        import user.signals
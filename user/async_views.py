@@ -0,0 +1,20 @@
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from main.async_api import async_read_view, hashing_view, paginate, retrieve
+from .models import Employee
+from .serializers import EmployeeValuesSerializer
+from .views import RegisterView
+
+
+@async_read_view
+async def employee_list(request):
+    return await paginate(request, Employee.objects.all(), ('slug',), EmployeeValuesSerializer())
+
+
+@async_read_view
+async def employee_detail(request, slug):
+    return await retrieve(Employee.objects.all(), EmployeeValuesSerializer(), slug=slug)
+
+
+login = hashing_view(TokenObtainPairView.as_view())
+register = hashing_view(RegisterView.as_view())
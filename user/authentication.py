@@ -0,0 +1,82 @@
+"""
+JWT authentication with the user lookup cached in-process.
+
+``CachedJWTAuthentication`` keeps each user, with its employee, in the
+``AUTH_USER_CACHE_ALIAS`` cache: a LocMemCache, so an LRU private to the
+process, whose entries live ``AUTH_USER_CACHE_TIMEOUT`` seconds. An entry is
+keyed by user id and holds the token version the user was loaded for: the
+revoke claim, a hash of the password that simplejwt adds when
+``CHECK_REVOKE_TOKEN`` is on. A token of another version misses and loads the
+user again, so once a password changes every process accepts the new tokens
+and rejects the old ones. Saving or deleting a user or employee drops its
+entry in the process that saved it (``user/signals.py``); other processes keep
+authenticating the old user, including its ``is_active``, ``is_staff`` and
+role, until their entry expires.
+
+Read-only endpoints that only need an authenticated caller can use simplejwt's
+``JWTStatelessUserAuthentication`` instead, which builds a ``TokenUser`` from
+the token's claims without touching the database. Nothing is checked then
+but the token: a deactivated or deleted user keeps that access until the
+token expires (``ACCESS_TOKEN_LIFETIME``).
+"""
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+def user_cache():
+    return caches[settings.AUTH_USER_CACHE_ALIAS]
+
+
+def user_cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+def forget_users(*user_ids):
+    user_cache().delete_many([user_cache_key(pk) for pk in set(user_ids) if pk is not None])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """``JWTAuthentication`` that reads users from the in-process cache before the database."""
+
+    def get_user(self, validated_token):
+        user = self.cached_user(validated_token)
+        if user is None:
+            try:
+                user = self.user_model.objects.select_related('employee').get(
+                    **{api_settings.USER_ID_FIELD: self.user_id(validated_token)})
+            except self.user_model.DoesNotExist as e:
+                raise AuthenticationFailed("User not found", code="user_not_found") from e
+            self.remember(validated_token, user)
+        return self.check_user(user, validated_token)
+
+    def user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken("Token contained no recognizable user identification") from e
+
+    def token_version(self, validated_token):
+        return validated_token.get(api_settings.REVOKE_TOKEN_CLAIM)
+
+    def cached_user(self, validated_token):
+        entry = user_cache().get(user_cache_key(self.user_id(validated_token)))
+        if entry is not None and entry[0] == self.token_version(validated_token):
+            return entry[1]
+        return None
+
+    def remember(self, validated_token, user):
+        # The cache pickles the entry, so every request gets its own instances.
+        entry = (self.token_version(validated_token), user)
+        user_cache().set(user_cache_key(self.user_id(validated_token)), entry)
+
+    def check_user(self, user, validated_token):
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed("The user's password has been changed.", code="password_changed")
+        return user
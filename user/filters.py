@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from main.filters import FilterSet
+
+
+class EmployeeFilter(FilterSet):
+    """Employees by company, department and position, or hired in ``hired_from``..``hired_to``."""
+    company = serializers.SlugField(source='company__slug', required=False)
+    department = serializers.SlugField(source='department__slug', required=False)
+    position = serializers.CharField(max_length=100, required=False)
+    hired_from = serializers.DateField(source='hired_on__gte', required=False)
+    hired_to = serializers.DateField(source='hired_on__lte', required=False)
@@ -0,0 +1,210 @@
+import csv
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from datetime import date
+from itertools import islice
+
+import django
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Q
+
+from company.cache import bump
+from company.counters import count_created
+from company.models import Company, Department
+from search.documents import index_instances
+from .models import Employee, User
+
+FORMATS = ('csv', 'jsonl')
+FIELDS = ('email', 'username', 'password', 'name', 'mobile', 'address', 'position', 'hired_on', 'company', 'department')
+MAX_REPORTED_ERRORS = 100
+
+
+def detect_format(filename):
+    return 'jsonl' if filename.lower().endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def read_rows(stream, fmt):
+    """
+    Yield one dict per record of a text ``stream`` holding CSV (with a header row) or JSON lines.
+
+    A record that can't be read is yielded as the exception that says why, so
+    the importer reports it against its row and carries on. Text that doesn't
+    decode ends the stream the same way, since nothing after it can be read.
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        while True:
+            try:
+                yield next(reader)
+            except StopIteration:
+                return
+            except csv.Error as exc:
+                yield exc
+            except UnicodeDecodeError as exc:
+                yield exc
+                return
+    elif fmt == 'jsonl':
+        try:
+            for line in stream:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError as exc:
+                        yield exc
+        except UnicodeDecodeError as exc:
+            yield exc
+    else:
+        raise ValueError(f"Unsupported format {fmt!r}, expected one of: {', '.join(FORMATS)}")
+
+
+def batched(rows, size):
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+def _setup_worker():
+    # Spawned (non-forked) workers start without Django configured.
+    django.setup()
+
+
+class EmployeeImporter:
+    """
+    Create ``User`` and ``Employee`` rows from a stream of records, one batch at a time.
+
+    Each record needs an ``email`` and may carry ``username``, ``password``,
+    ``name``, ``mobile``, ``address``, ``position``, ``hired_on`` (ISO date)
+    and ``company`` / ``department`` slugs. Records whose email or username
+    already exists are skipped, as are records that couldn't be read, each
+    with an error naming its row. Only one batch is held in memory at a time,
+    and passwords are hashed across a process pool when ``workers`` is set.
+    """
+
+    def __init__(self, batch_size=1000, workers=0):
+        self.batch_size = batch_size
+        self.workers = workers
+        self.companies = {}
+        self.departments = {}
+        self.created = 0
+        self.skipped = 0
+        self.errors = []
+
+    def run(self, rows, progress=None):
+        started = time.perf_counter()
+        pool = ProcessPoolExecutor(self.workers, initializer=_setup_worker) if self.workers else nullcontext()
+        with pool:
+            for number, batch in enumerate(batched(rows, self.batch_size)):
+                self.import_batch(batch, number * self.batch_size, pool)
+                if progress:
+                    progress(self.result(started))
+        return self.result(started)
+
+    def result(self, started):
+        seconds = time.perf_counter() - started
+        return {
+            'created': self.created,
+            'skipped': self.skipped,
+            'errors': self.errors,
+            'seconds': round(seconds, 3),
+            'rows_per_second': round((self.created + self.skipped) / seconds, 1) if seconds else 0.0,
+        }
+
+    def error(self, line, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': line, 'error': message})
+
+    def resolve(self, model, cache, slugs):
+        missing = {slug for slug in slugs if slug and slug not in cache}
+        if missing:
+            cache.update(model.objects.filter(slug__in=missing).values_list('slug', 'id'))
+
+    def readable(self, batch, offset):
+        """The ``(line, record)`` pairs of ``batch`` that are objects with string ``FIELDS``; the rest are reported."""
+        records = []
+        for line, row in enumerate(batch, start=offset + 1):
+            if isinstance(row, UnicodeDecodeError):
+                self.error(line, f"Could not decode the rest of the file: {row}")
+            elif isinstance(row, Exception):
+                self.error(line, f"Could not read the row: {row}")
+            elif not isinstance(row, dict):
+                self.error(line, "Expected an object.")
+            elif not all(isinstance(row.get(field), (str, type(None))) for field in FIELDS):
+                self.error(line, "Values must be strings.")
+            else:
+                records.append((line, row))
+        return records
+
+    def import_batch(self, batch, offset, pool):
+        records = self.readable(batch, offset)
+        batch = [row for _, row in records]
+        emails = [User.objects.normalize_email(row.get('email') or '') for row in batch]
+        usernames = [row.get('username') or email for row, email in zip(batch, emails)]
+        taken = set()
+        for email, username in User.objects.filter(Q(email__in=emails) | Q(username__in=usernames)).values_list('email', 'username'):
+            taken.update((email, username))
+        self.resolve(Company, self.companies, [row.get('company') for row in batch])
+        self.resolve(Department, self.departments, [row.get('department') for row in batch])
+
+        accepted = []
+        for (line, row), email, username in zip(records, emails, usernames):
+            company, department = row.get('company'), row.get('department')
+            try:
+                row['hired_on'] = date.fromisoformat(row['hired_on']) if row.get('hired_on') else None
+            except (TypeError, ValueError):
+                self.error(line, f"Invalid hired_on date: {row['hired_on']}")
+                continue
+            if not email:
+                self.error(line, "Missing email.")
+            elif email in taken or username in taken:
+                self.error(line, f"User {email} already exists.")
+            elif company and company not in self.companies:
+                self.error(line, f"Unknown company slug: {company}")
+            elif department and department not in self.departments:
+                self.error(line, f"Unknown department slug: {department}")
+            else:
+                taken.update((email, username))
+                accepted.append((row, email, username))
+        if not accepted:
+            return
+
+        passwords = [row.get('password') or None for row, _, _ in accepted]
+        if self.workers:
+            hashes = pool.map(make_password, passwords, chunksize=max(1, len(passwords) // (self.workers * 4)))
+        else:
+            hashes = map(make_password, passwords)
+        users = [
+            User(username=username, email=email, role=User.ROLES.EMPLOYEE, password=password)
+            for (_, email, username), password in zip(accepted, hashes)
+        ]
+
+        with transaction.atomic():
+            User.objects.bulk_create(users, batch_size=self.batch_size)
+            if any(user.pk is None for user in users):
+                ids = dict(User.objects.filter(email__in=[user.email for user in users]).values_list('email', 'id'))
+                for user in users:
+                    user.pk = ids[user.email]
+
+            employees = [
+                Employee(
+                    user=user,
+                    company_id=self.companies.get(row.get('company')),
+                    department_id=self.departments.get(row.get('department')),
+                    name=row.get('name') or '',
+                    mobile=row.get('mobile') or '',
+                    address=row.get('address') or '',
+                    position=row.get('position') or '',
+                    hired_on=row['hired_on'],
+                )
+                for user, (row, _, _) in zip(users, accepted)
+            ]
+            Employee.objects.bulk_create(Employee.objects.allocate_slugs(employees), batch_size=self.batch_size)
+            # bulk_create skips the post_save handlers, which keep the counters and search documents too.
+            count_created(employees)
+            index_instances(employees)
+        # bulk_create skips the post_save handlers that normally invalidate the API cache.
+        bump(*{employee.company_id for employee in employees})
+        self.created += len(employees)
@@ -0,0 +1,38 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+from user.importers import FORMATS, EmployeeImporter, detect_format, read_rows
+
+
+class Command(BaseCommand):
+    help = "Stream employees from a CSV or JSONL file into the database in fixed-size batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV (with a header row) or JSONL file to import.")
+        parser.add_argument('--format', choices=FORMATS, help="File format; inferred from the extension by default.")
+        parser.add_argument('--batch-size', type=int, default=1000, help="Rows inserted per batch.")
+        parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                            help="Processes used to hash passwords; 0 hashes in this process.")
+
+    def handle(self, *args, **options):
+        path = options['path']
+        fmt = options['format'] or detect_format(path)
+        importer = EmployeeImporter(batch_size=options['batch_size'], workers=options['workers'])
+
+        def progress(result):
+            self.stdout.write(f"{result['created']} created, {result['skipped']} skipped "
+                              f"({result['rows_per_second']} rows/s)")
+
+        try:
+            with open(path, encoding='utf-8-sig', newline='') as stream:
+                result = importer.run(read_rows(stream, fmt), progress=progress)
+        except OSError as exc:
+            raise CommandError(exc)
+
+        for error in result['errors']:
+            self.stderr.write(f"Row {error['row']}: {error['error']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result['created']} employees, skipped {result['skipped']} "
+            f"in {result['seconds']}s ({result['rows_per_second']} rows/s)"
+        ))
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('company', '0008_project_indexes'),
+        ('user', '0008_alter_employee_company_alter_employee_department'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='employee',
+            index=models.Index(fields=['company', 'department'], name='employee_company_dept_idx'),
+        ),
+    ]
@@ -1,8 +1,12 @@
+from collections import Counter
 from datetime import date
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Q
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
+from django.utils.text import slugify
+from main.models import LoadedValuesMixin
 
 
 class UserManager(BaseUserManager):
@@ -50,7 +54,52 @@ class User(AbstractBaseUser, PermissionsMixin):
 
         super().save(*args, **kwargs)
 
-class Employee(models.Model):
+class EmployeeManager(models.Manager):
+    def next_free_slug(self, base):
+        """Return ``base-<n>`` with ``n`` one above the highest suffix already taken."""
+        prefix = f"{base}-"
+        suffixes = [
+            int(slug[len(prefix):])
+            for slug in self.filter(slug__startswith=prefix).values_list('slug', flat=True)
+            if slug[len(prefix):].isdigit()
+        ]
+        return f"{prefix}{max(suffixes, default=0) + 1}"
+
+    def allocate_slugs(self, employees):
+        """
+        Give every unsaved employee without a slug a unique one, ready for ``bulk_create``.
+
+        Takes one query to find which bases are already used and, only if some
+        are, a second one to find the suffixes taken for them. Collisions within
+        the batch are resolved in memory.
+        """
+        pending = [employee for employee in employees if not employee.slug]
+        bases = [employee.slug_base() for employee in pending]
+        taken = set(self.filter(slug__in=set(bases)).values_list('slug', flat=True))
+
+        colliding = {base for base in bases if base in taken}
+        colliding.update(base for base, count in Counter(bases).items() if count > 1)
+        if colliding:
+            startswith = Q()
+            for base in colliding:
+                startswith |= Q(slug__startswith=f"{base}-")
+            taken.update(self.filter(startswith).values_list('slug', flat=True))
+
+        counters = {}
+        for employee, base in zip(pending, bases):
+            slug = base
+            while slug in taken:
+                counters[base] = counters.get(base, 0) + 1
+                slug = f"{base}-{counters[base]}"
+            taken.add(slug)
+            employee.slug = slug
+        return employees
+
+
+class Employee(LoadedValuesMixin, models.Model):
+    SLUG_BASE_LENGTH = 40
+    SLUG_SAVE_ATTEMPTS = 5
+
     slug = models.SlugField(unique=True, blank=True)
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name='employee', null=True, blank=True)
     company = models.ForeignKey('company.Company', on_delete=models.CASCADE, related_name='employees',null=True, blank=True)
@@ -62,13 +111,45 @@ class Employee(models.Model):
     position = models.CharField(max_length=100)
     hired_on = models.DateField(null=True, blank=True)
 
-    def save(self, *args, **kwargs):
+    objects = EmployeeManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['company', 'department'], name='employee_company_dept_idx'),
+            models.Index(fields=['position'], name='employee_position_idx'),
+            models.Index(fields=['hired_on'], name='employee_hired_on_idx'),
+            models.Index(fields=['name', 'slug'], name='employee_name_slug_idx'),
+        ]
+
+    def slug_base(self):
         if self.user and self.user.email:
             base = self.user.email.split('@')[0].lower()
-            if Employee.objects.filter(slug=base).exists():
-                base = f"{base}-{Employee.objects.filter(user__email=self.user.email).count()}"
-            self.slug = base
-        super().save(*args, **kwargs)
+        else:
+            base = slugify(self.name) or 'employee'
+        return base[:self.SLUG_BASE_LENGTH]
+
+    def save(self, *args, **kwargs):
+        """
+        Save, allocating a slug first if the employee has none.
+
+        The email prefix is tried optimistically, so the usual case is a single
+        INSERT. When the unique index rejects it the next free suffix is looked
+        up and the insert retried, which also covers concurrent inserts racing
+        for the same slug.
+        """
+        if self.slug:
+            return super().save(*args, **kwargs)
+
+        base = self.slug = self.slug_base()
+        for attempt in range(self.SLUG_SAVE_ATTEMPTS):
+            try:
+                with transaction.atomic(using=kwargs.get('using')):
+                    return super().save(*args, **kwargs)
+            except IntegrityError:
+                if attempt + 1 == self.SLUG_SAVE_ATTEMPTS or not Employee.objects.filter(slug=self.slug).exists():
+                    self.slug = ''
+                    raise
+                self.slug = Employee.objects.next_free_slug(base)
 
     def __str__(self):
         return self.name
@@ -1,6 +1,10 @@
+from datetime import date
+
 from .models import User, Employee
 from rest_framework import serializers
 from company.models import Company, Department
+from main.serializers import SparseFieldsetMixin, ValuesSerializer
+from .importers import FORMATS
 
 
 class UserRegisterSerializer(serializers.ModelSerializer):
@@ -17,17 +21,38 @@ class UserRegisterSerializer(serializers.ModelSerializer):
         user.save()
         return user
 
-class EmployeeSerializer(serializers.ModelSerializer):
-    
+class EmployeeSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    expandable_fields = {'company': 'name', 'department': 'name'}
+    field_sources = {'get_days_employed': ('hired_on',)}
 
+    get_days_employed = serializers.ReadOnlyField()
 
     class Meta:
         model = Employee
-        fields = ('slug', 'company', 'department', 'name', 'mobile', 'address', 'position', 'hired_on', )
-
-    def to_representation(self, instance):
-        representation = super().to_representation(instance)
-        representation['get_days_employed'] = instance.get_days_employed
-        representation['company'] = instance.company.name if instance.company else None
-        representation['department'] = instance.department.name if instance.department else None
+        fields = ('slug', 'company', 'department', 'name', 'mobile', 'address', 'position', 'hired_on',
+                  'get_days_employed', )
+
+
+class EmployeeValuesSerializer(ValuesSerializer):
+    """``EmployeeSerializer`` output for ``Employee.objects.values()`` rows."""
+    fields = {
+        'slug': 'slug',
+        'company': 'company__name',
+        'department': 'department__name',
+        'name': 'name',
+        'mobile': 'mobile',
+        'address': 'address',
+        'position': 'position',
+        'hired_on': 'hired_on',
+    }
+    computed_fields = ('get_days_employed',)
+
+    def to_representation(self, row):
+        representation = super().to_representation(row)
+        representation['get_days_employed'] = (date.today() - row['hired_on']).days if row['hired_on'] else 0
         return representation
+
+
+class EmployeeImportSerializer(serializers.Serializer):
+    file = serializers.FileField()
+    format = serializers.ChoiceField(choices=FORMATS, required=False)
@@ -1,6 +1,7 @@
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from .authentication import forget_users
 from .models import User, Employee
 
 @receiver(post_save, sender=User)
@@ -8,3 +9,14 @@ def create_employee(sender, instance, created, **kwargs):
     if created and instance.role == User.ROLES.EMPLOYEE:
         Employee.objects.create(user=instance)
 
+
+
+@receiver([post_save, post_delete], sender=User)
+def forget_cached_user(sender, instance, **kwargs):
+    forget_users(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Employee)
+def forget_cached_employee_user(sender, instance, **kwargs):
+    # Cached users carry their employee; a reassigned employee changes two users.
+    forget_users(instance.user_id, instance.loaded_value('user_id'))
@@ -1,6 +1,7 @@
 
 from django.urls import path, include
 from .views import  RegisterView, EmployeeViewSet
+from . import async_views
 from rest_framework_simplejwt.views import (
     TokenObtainPairView,  # login → access + refresh
     TokenRefreshView,     # refresh access
@@ -17,5 +18,9 @@ from rest_framework import routers
 router = routers.DefaultRouter()
 router.register('employees', EmployeeViewSet, basename='employee')
 urlpatterns += [
+    path('async/login/', async_views.login, name='async-token-obtain-pair'),
+    path('async/register/', async_views.register, name='async-register'),
+    path('async/employees/', async_views.employee_list, name='async-employee-list'),
+    path('async/employees/<str:slug>/', async_views.employee_detail, name='async-employee-detail'),
     path('', include(router.urls)),
 ]
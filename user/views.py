@@ -1,11 +1,21 @@
+import io
+
+from django.conf import settings
+from .filters import EmployeeFilter
 from .models import Employee, User
+from .importers import EmployeeImporter, detect_format, read_rows
 from .serializers import UserRegisterSerializer
 from rest_framework.generics import CreateAPIView
-from .serializers import EmployeeSerializer
-from rest_framework.permissions import IsAuthenticated
-from rest_framework import viewsets
+from .serializers import EmployeeSerializer, EmployeeImportSerializer, EmployeeValuesSerializer
+from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.response import Response
+from rest_framework import viewsets, status
+from main.exports import CSVRenderer, NDJSONRenderer, export_response
+from main.views import SparseFieldsetViewMixin, ValuesListViewMixin
 
-class EmployeeViewSet(viewsets.ModelViewSet):
+class EmployeeViewSet(ValuesListViewMixin, SparseFieldsetViewMixin, viewsets.ModelViewSet):
     """
     API view set for managing Employee instances.
 
@@ -18,13 +28,42 @@ class EmployeeViewSet(viewsets.ModelViewSet):
     Attributes:
         queryset (QuerySet): All Employee objects from the database.
         serializer_class (Serializer): Serializer class used for Employee objects.
+        values_serializer_class (ValuesSerializer): Renders plain list pages from ``values()`` rows.
         permission_classes (list): List of permission classes to apply to the view.
         lookup_field (str): Field used to lookup Department instances.
+        filterset_class (FilterSet): Query-string filters for the list.
+        ordering_fields (list): Indexed columns ``?ordering=`` may name.
     """
     permission_classes = [IsAuthenticated]
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
+    values_serializer_class = EmployeeValuesSerializer
     lookup_field = 'slug'
+    filterset_class = EmployeeFilter
+    ordering_fields = ['slug', 'name']
+
+    @action(detail=False, methods=['post'], url_path='import', serializer_class=EmployeeImportSerializer,
+            permission_classes=[IsAdminUser], parser_classes=[MultiPartParser])
+    def import_file(self, request):
+        """Create users and employees from an uploaded CSV or JSONL file."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data['file']
+        fmt = serializer.validated_data.get('format') or detect_format(upload.name)
+
+        importer = EmployeeImporter(
+            batch_size=settings.EMPLOYEE_IMPORT_BATCH_SIZE,
+            workers=settings.EMPLOYEE_IMPORT_WORKERS,
+        )
+        # Rows that can't be read are reported in the result, next to those that were imported.
+        stream = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        return Response(importer.run(read_rows(stream, fmt)), status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], renderer_classes=[CSVRenderer, NDJSONRenderer])
+    def export(self, request):
+        """Stream every employee as CSV (``?format=csv``) or NDJSON (``?format=ndjson``)."""
+        queryset = Employee.objects.order_by('slug')
+        return export_response(request, queryset, EmployeeValuesSerializer, 'employees')
 
 
 class RegisterView(CreateAPIView):